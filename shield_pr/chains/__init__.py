@@ -1,27 +1,64 @@
-"""Review chain implementations."""
-
-from typing import Any
-from shield_pr.chains.base import BaseReviewChain
-from shield_pr.chains.platforms.android_chain import AndroidReviewChain
-from shield_pr.chains.platforms.ios_chain import IOSReviewChain
-from shield_pr.chains.platforms.ai_ml_chain import AiMlReviewChain
-from shield_pr.chains.platforms.frontend_chain import FrontendReviewChain
-from shield_pr.chains.platforms.backend_chain import BackendReviewChain
-from shield_pr.chains.universal_chain import UniversalReviewChain
-from shield_pr.chains.synthesis_chain import SynthesisChain
-
-
-# Chain registry for factory pattern
-CHAIN_REGISTRY = {
-    "android": AndroidReviewChain,
-    "ios": IOSReviewChain,
-    "ai-ml": AiMlReviewChain,
-    "frontend": FrontendReviewChain,
-    "backend": BackendReviewChain,
+"""Review chain implementations.
+
+Chain classes are imported on first access, so importing a submodule such
+as ``shield_pr.chains.prompts`` does not load LangChain.
+"""
+
+import functools
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any, Tuple
+
+if TYPE_CHECKING:
+    from shield_pr.chains.base import BaseReviewChain
+
+
+# Public names -> defining module, resolved lazily by __getattr__
+_EXPORTS = {
+    "BaseReviewChain": "shield_pr.chains.base",
+    "AndroidReviewChain": "shield_pr.chains.platforms.android_chain",
+    "IOSReviewChain": "shield_pr.chains.platforms.ios_chain",
+    "AiMlReviewChain": "shield_pr.chains.platforms.ai_ml_chain",
+    "FrontendReviewChain": "shield_pr.chains.platforms.frontend_chain",
+    "BackendReviewChain": "shield_pr.chains.platforms.backend_chain",
+    "UniversalReviewChain": "shield_pr.chains.universal_chain",
+    "SynthesisChain": "shield_pr.chains.synthesis_chain",
+    "DraftStore": "shield_pr.chains._speculation",
 }
 
+# Chain dispatch table: platform names index into a parallel tuple of classes
+_PLATFORMS = ("android", "ios", "ai-ml", "frontend", "backend")
+_CHAIN_NAMES = (
+    "AndroidReviewChain",
+    "IOSReviewChain",
+    "AiMlReviewChain",
+    "FrontendReviewChain",
+    "BackendReviewChain",
+)
+_PLATFORM_IDX = {sys.intern(name): index for index, name in enumerate(_PLATFORMS)}
+_SUPPORTED_PLATFORMS = ", ".join(_PLATFORMS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported chain classes and the registry on first access."""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    elif name == "CHAIN_REGISTRY":
+        # Chain registry for factory pattern
+        value = dict(zip(_PLATFORMS, _chain_classes()))
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _chain_classes() -> Tuple[type, ...]:
+    """Return the platform chain classes, in _PLATFORMS order."""
+    return tuple(__getattr__(name) for name in _CHAIN_NAMES)
+
 
-def get_chain(platform: str, llm_client: Any, depth: str = "standard") -> BaseReviewChain:
+def get_chain(platform: str, llm_client: Any, depth: str = "standard") -> "BaseReviewChain":
     """Get review chain for specified platform.
 
     Args:
@@ -35,14 +72,18 @@ def get_chain(platform: str, llm_client: Any, depth: str = "standard") -> BaseRe
     Raises:
         ValueError: If platform is not supported
     """
-    chain_class = CHAIN_REGISTRY.get(platform.lower())
-    if not chain_class:
-        raise ValueError(
-            f"Unsupported platform: {platform}. "
-            f"Supported platforms: {', '.join(CHAIN_REGISTRY.keys())}"
-        )
+    try:
+        index = _PLATFORM_IDX[platform]
+    except KeyError:
+        try:
+            index = _PLATFORM_IDX[platform.lower()]
+        except KeyError:
+            raise ValueError(
+                f"Unsupported platform: {platform}. "
+                f"Supported platforms: {_SUPPORTED_PLATFORMS}"
+            ) from None
     # Type ignore needed because chain_class is a class type from registry
-    return chain_class(llm_client, depth)  # type: ignore[abstract]
+    return _chain_classes()[index](llm_client, depth)  # type: ignore[abstract]
 
 
 __all__ = [
@@ -54,6 +95,7 @@ __all__ = [
     "BackendReviewChain",
     "UniversalReviewChain",
     "SynthesisChain",
+    "DraftStore",
     "CHAIN_REGISTRY",
     "get_chain",
 ]
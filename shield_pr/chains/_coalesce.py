@@ -0,0 +1,31 @@
+"""In-flight request coalescing for identical stage prompts.
+
+Concurrent reviews that render byte-identical prompts share a single LLM
+call: the first caller starts it and later callers await the same future.
+Entries are dropped as soon as the call finishes, so this never serves
+stale results; persistent reuse is ResultCache's job.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+_INFLIGHT: Dict[str, "asyncio.Future[Any]"] = {}
+
+
+async def coalesce(key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Run factory() once per key among concurrent callers.
+
+    Args:
+        key: Identity of the request (e.g. hash of the rendered prompt)
+        factory: Zero-argument callable returning the awaitable to run
+
+    Returns:
+        Result of the shared call
+    """
+    future = _INFLIGHT.get(key)
+    if future is None:
+        future = asyncio.ensure_future(factory())
+        _INFLIGHT[key] = future
+        future.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    # Shield so one cancelled waiter does not cancel the call for the others
+    return await asyncio.shield(future)
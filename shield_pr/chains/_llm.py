@@ -0,0 +1,173 @@
+"""Minimal prompt-to-LLM call path for review stages.
+
+Stages only pair a prompt with an LLM client, so they skip LangChain's
+chain/runnable machinery (callback and run managers, config plumbing,
+tracing) and call the client directly with the formatted prompt.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from langchain_core.runnables import Runnable
+
+
+def _response_text(response: Any) -> str:
+    """Extract text from a client response.
+
+    Args:
+        response: Plain string (LLMClient) or chat message with .content
+
+    Returns:
+        Response text
+    """
+    if isinstance(response, str):
+        return response
+    content = getattr(response, "content", response)
+    return content if isinstance(content, str) else str(content)
+
+
+def _call_options(schema: Optional[type], system: Optional[str]) -> Dict[str, Any]:
+    """Collect the optional client arguments that are set.
+
+    Plain clients and chat models only ever receive the prompt.
+    """
+    options: Dict[str, Any] = {}
+    if schema is not None:
+        options["schema"] = schema
+    if system:
+        options["system"] = system
+    return options
+
+
+def call(
+    llm: Any, prompt: str, schema: Optional[type] = None, system: Optional[str] = None
+) -> str:
+    """Send a prompt to an LLM client and return the response text.
+
+    Args:
+        llm: LLMClient wrapper or LangChain chat model
+        prompt: Fully formatted prompt text
+        schema: Response model for clients enforcing structured output
+        system: System message for clients accepting one
+
+    Returns:
+        Response text
+    """
+    return _response_text(llm.invoke(prompt, **_call_options(schema, system)))
+
+
+async def acall(
+    llm: Any, prompt: str, schema: Optional[type] = None, system: Optional[str] = None
+) -> str:
+    """Async variant of call().
+
+    Args:
+        llm: LLMClient wrapper or LangChain chat model
+        prompt: Fully formatted prompt text
+        schema: Response model for clients enforcing structured output
+        system: System message for clients accepting one
+
+    Returns:
+        Response text
+    """
+    return _response_text(await llm.ainvoke(prompt, **_call_options(schema, system)))
+
+
+class PromptStage:
+    """A review stage: a prompt template bound to an LLM client.
+
+    Exposes the invoke/ainvoke/abatch/astream surface used by review
+    chains, taking the stage context as input and returning response text.
+    Clients that accept system messages get the prompt's static
+    instructions as one, identical for every file, and only the per-file
+    inputs as the human message.
+    """
+
+    __slots__ = ("prompt", "llm", "schema", "system")
+
+    def __init__(self, prompt: Any, llm: Any, schema: Optional[type] = None) -> None:
+        """Initialize stage.
+
+        Args:
+            prompt: Prompt template for the stage
+            llm: LLM client for execution
+            schema: Response model the client enforces, or None
+        """
+        self.prompt = prompt
+        self.llm = llm
+        self.schema = schema
+        system = getattr(prompt, "system", "")
+        accepts_system = getattr(llm, "system_messages", False) is True
+        self.system: str = system if accepts_system and isinstance(system, str) else ""
+
+    def _format(self, context: Dict[str, Any]) -> str:
+        """Format the part of the prompt not sent as the system message."""
+        if self.system:
+            return self.prompt.format_human(**context)
+        return self.prompt.format(**context)
+
+    def invoke(self, context: Dict[str, Any]) -> str:
+        """Format the prompt with context and call the LLM.
+
+        Args:
+            context: Stage input context
+
+        Returns:
+            Response text
+        """
+        return call(self.llm, self._format(context), self.schema, self.system)
+
+    async def ainvoke(self, context: Dict[str, Any]) -> str:
+        """Async variant of invoke().
+
+        Args:
+            context: Stage input context
+
+        Returns:
+            Response text
+        """
+        return await acall(self.llm, self._format(context), self.schema, self.system)
+
+    async def abatch(
+        self, contexts: List[Dict[str, Any]], config: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """Run the stage for many contexts concurrently.
+
+        Args:
+            contexts: Stage input context per call
+            config: Optional settings; honours "max_concurrency"
+
+        Returns:
+            Response text per context, in input order
+        """
+        limit = (config or {}).get("max_concurrency") or len(contexts) or 1
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _one(context: Dict[str, Any]) -> str:
+            async with semaphore:
+                return await self.ainvoke(context)
+
+        return list(await asyncio.gather(*(_one(context) for context in contexts)))
+
+    async def astream(self, context: Dict[str, Any]) -> AsyncIterator[str]:
+        """Stream response text chunks.
+
+        LangChain chat models and clients marked ``streaming`` stream token
+        chunks; other clients yield the full response as a single chunk.
+
+        Args:
+            context: Stage input context
+
+        Yields:
+            Response text chunks
+        """
+        prompt = self._format(context)
+        if isinstance(self.llm, Runnable):
+            async for chunk in self.llm.astream(prompt):
+                yield _response_text(chunk)
+        elif getattr(self.llm, "streaming", False) is True:
+            options = _call_options(self.schema, self.system)
+            async for text in self.llm.astream(prompt, **options):
+                yield text
+        else:
+            yield await acall(self.llm, prompt, self.schema, self.system)
@@ -0,0 +1,53 @@
+"""Stage-level retry policy for transient LLM provider failures.
+
+Retries one stage call at a time so a rate limit hit mid-review does not
+discard the stages that already completed.
+
+Environment variables:
+    CRA_STAGE_RETRY_ATTEMPTS: Maximum attempts per stage call (default 5)
+    CRA_STAGE_RETRY_MAX_WAIT: Maximum backoff between attempts in seconds (default 30)
+"""
+
+import os
+
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from shield_pr.core.errors import RateLimitError, TransientAPIError
+
+
+def _env_number(name: str, default: float) -> float:
+    """Read a positive number from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when unset or invalid
+
+    Returns:
+        Parsed value or default
+    """
+    try:
+        value = float(os.getenv(name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+STAGE_RETRY_ATTEMPTS = int(_env_number("CRA_STAGE_RETRY_ATTEMPTS", 5))
+STAGE_RETRY_MAX_WAIT = _env_number("CRA_STAGE_RETRY_MAX_WAIT", 30)
+
+# Errors worth retrying: provider throttling, and dropped connections,
+# timeouts and 5xx responses (as mapped by LLMClient or raised raw by
+# LangChain chat models)
+RETRYABLE_ERRORS = (RateLimitError, TransientAPIError, ConnectionError, TimeoutError)
+
+RETRYING = retry(
+    stop=stop_after_attempt(STAGE_RETRY_ATTEMPTS),
+    wait=wait_random_exponential(multiplier=1, max=STAGE_RETRY_MAX_WAIT),
+    retry=retry_if_exception_type(RETRYABLE_ERRORS),
+    reraise=True,
+)
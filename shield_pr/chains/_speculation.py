@@ -0,0 +1,98 @@
+"""Draft results for speculative pre-launch of dependent stages.
+
+A dependent stage (e.g. improvements) only reads the text of earlier
+results. While the real upstream stage runs, it can start against a draft:
+the most recent result of that upstream stage for a sibling file. When the
+real result arrives and is close enough to the draft, the speculative call
+is kept; otherwise it is cancelled and reissued.
+
+A kept call was made with a sibling file's upstream output, so its
+findings can reflect that file's context. Speculation is therefore off
+unless review.speculative is set.
+"""
+
+import os
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Dict, Optional, Tuple
+
+# Minimum similarity between draft and real result to keep a speculative call
+SPECULATION_THRESHOLD = 0.8
+
+_MAX_DRAFTS = 256
+
+
+class DraftStore:
+    """Most recent stage results per platform, stage and directory.
+
+    Owned by whoever shares it across files (the review pipeline, or a
+    chain on its own), so drafts never outlive the reviews that made them.
+    """
+
+    def __init__(self, max_drafts: int = _MAX_DRAFTS) -> None:
+        """Initialize an empty store.
+
+        Args:
+            max_drafts: Drafts kept before the least recent is evicted
+        """
+        self.max_drafts = max_drafts
+        self._drafts: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+
+    def remember(self, platform: str, stage_name: str, file_path: str, text: str) -> None:
+        """Record a stage result as the draft for sibling files.
+
+        Args:
+            platform: Platform of the chain
+            stage_name: Name of the stage that produced the result
+            file_path: Path of the reviewed file
+            text: Stage result text
+        """
+        key = _draft_key(platform, stage_name, file_path)
+        self._drafts[key] = text
+        self._drafts.move_to_end(key)
+        while len(self._drafts) > self.max_drafts:
+            self._drafts.popitem(last=False)
+
+    def lookup(self, platform: str, stage_name: str, file_path: str) -> Optional[str]:
+        """Return the draft result for a stage, if a sibling file produced one.
+
+        Args:
+            platform: Platform of the chain
+            stage_name: Name of the upstream stage
+            file_path: Path of the file being reviewed
+
+        Returns:
+            Draft result text or None
+        """
+        return self._drafts.get(_draft_key(platform, stage_name, file_path))
+
+
+def _draft_key(platform: str, stage_name: str, file_path: str) -> Tuple[str, str, str]:
+    """Key drafts by platform, stage and directory so siblings share them."""
+    return (platform, stage_name, os.path.dirname(file_path))
+
+
+def drafts_hold(drafts: Dict[str, str], actual: Dict[str, str]) -> bool:
+    """Check that every draft is close enough to the real result.
+
+    Args:
+        drafts: Draft values keyed by context key
+        actual: Context holding the real results
+
+    Returns:
+        True if all drafts reach SPECULATION_THRESHOLD similarity
+    """
+    for key, draft in drafts.items():
+        real = actual.get(key, "")
+        if draft == real:
+            continue
+        matcher = SequenceMatcher(None, draft, real, autojunk=False)
+        # Cheap upper bounds first; ratio() is quadratic in the worst case
+        if (
+            matcher.real_quick_ratio() < SPECULATION_THRESHOLD
+            or matcher.quick_ratio() < SPECULATION_THRESHOLD
+            or matcher.ratio() < SPECULATION_THRESHOLD
+        ):
+            return False
+    return True
+
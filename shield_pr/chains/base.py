@@ -1,20 +1,211 @@
 """Base review chain abstract class."""
 
-from abc import ABC, abstractmethod
-from typing import Dict, List, Any
-from langchain.chains import LLMChain  # type: ignore
+import asyncio
+import functools
+from abc import ABC
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Tuple
+
+import orjson
+
+from shield_pr.core.cache import (
+    ResultCache,
+    code_digest,
+    code_shape,
+    content_digest,
+    rename_identifiers,
+)
 from shield_pr.models.review_result import ReviewResult
 from shield_pr.core.errors import ReviewError
+from shield_pr.models.finding import Finding, FindingsResponse
 from shield_pr.chains.result_parser import ResultParser  # type: ignore
+from shield_pr.chains._coalesce import coalesce
+from shield_pr.chains._llm import PromptStage
+from shield_pr.chains._retry import RETRYABLE_ERRORS, RETRYING
+from shield_pr.chains.prompts.factory import PromptRef, get_batch_prompt, get_combined_prompt
+from shield_pr.chains._speculation import DraftStore, drafts_hold
+from shield_pr.utils.logger import logger
+
+
+# Words in stage output that are structure, not references to the code
+_OUTPUT_WORDS = frozenset(
+    {"findings", "done", "true", "false", "null", "HIGH", "MEDIUM", "LOW", *Finding.model_fields}
+)
+
+
+def _build_stage(prompt: Any, llm: Any) -> PromptStage:
+    """Build a stage binding a prompt template to the LLM client.
+
+    Clients that enforce structured output get the prompt variant without
+    the JSON schema, and the stage passes them the response model instead.
+
+    Args:
+        prompt: Prompt template, or PromptRef resolved on first build
+        llm: LLM client for chain execution
+
+    Returns:
+        Stage mapping stage inputs to the response text
+    """
+    if isinstance(prompt, PromptRef):
+        if getattr(llm, "structured_output", False) is True:
+            return PromptStage(prompt.resolve(structured=True), llm, FindingsResponse)
+        prompt = prompt.resolve()
+    return PromptStage(prompt, llm)
+
+
+def _build_stage_map(stage_specs: Dict[str, Any], llm: Any) -> Dict[str, PromptStage]:
+    """Build stages from prompt specs.
+
+    Args:
+        stage_specs: Mapping of stage names to prompt templates
+        llm: LLM client for chain execution
+
+    Returns:
+        Dictionary mapping stage names to stages
+    """
+    return {name: _build_stage(prompt, llm) for name, prompt in stage_specs.items()}
+
+
+@functools.lru_cache(maxsize=32)
+def _make_stages(chain_cls: type, llm: Any) -> Dict[str, PromptStage]:
+    """Build and cache the stages of a chain class for one LLM client.
+
+    Args:
+        chain_cls: Review chain class providing STAGE_SPECS
+        llm: Hashable LLM client for chain execution
+
+    Returns:
+        Shared dictionary mapping stage names to stages
+    """
+    return _build_stage_map(chain_cls.STAGE_SPECS, llm)
+
+
+def _freeze_depth_stages(depth_stages: Dict[str, List[str]]) -> Dict[str, Tuple[str, ...]]:
+    """Freeze a DEPTH_STAGES mapping into immutable stage tuples.
+
+    Args:
+        depth_stages: Mapping of depth names to stage name lists
+
+    Returns:
+        Mapping of depth names to stage name tuples
+    """
+    return {depth: tuple(stages) for depth, stages in depth_stages.items()}
+
+
+def _stage_text(output: Any) -> str:
+    """Extract the response text from a stage output.
+
+    Args:
+        output: Stage output, either text or a ``{"text": ...}`` mapping
+
+    Returns:
+        Response text
+    """
+    if isinstance(output, str):
+        return output
+    return output.get("text", "")
+
+
+# ResultParser is stateless, so every chain shares one instance
+_SHARED_PARSER = ResultParser()
+
+# Stage name used for cache keys of the fused single-prompt review
+_FUSED_STAGE = "combined"
+
+# Code characters packed into one multi-file prompt (~6k tokens)
+DEFAULT_PACK_CHARS = 24_000
+
+
+def _prompt_fingerprint(stage: Any, llm: Any) -> str:
+    """Digest everything besides the inputs that shapes a stage's response.
+
+    Covers the prompt template (and so the definitions and severity guide
+    rendered into it), the system message split, the response schema and
+    the sampling temperature, so editing any of them misses old cache
+    entries instead of serving them.
+
+    Args:
+        stage: Review stage
+        llm: LLM client the stage calls
+
+    Returns:
+        Hex digest for the stage cache key
+    """
+    prompt = getattr(stage, "prompt", None)
+    template = getattr(prompt, "template", None)
+    schema = getattr(stage, "schema", None)
+    temperature = getattr(getattr(llm, "config", None), "temperature", "")
+    return ResultCache.make_key(
+        # Digested once per template rather than once per call
+        content_digest(template) if isinstance(template, str) else type(prompt).__name__,
+        "system" if getattr(stage, "system", "") else "",
+        getattr(schema, "__name__", ""),
+        str(temperature),
+    )
+
+
+def _pack_by_size(files: List[Tuple[int, str, int]], budget: int) -> List[List[int]]:
+    """Greedily group files so each group's code stays within a size budget.
+
+    A file larger than the budget gets a group of its own, and a path never
+    appears twice in one group since results are keyed by path.
+
+    Args:
+        files: (index, file path, code size) triples, in input order
+        budget: Maximum total code size per group
+
+    Returns:
+        Groups of file indices
+    """
+    groups: List[List[int]] = []
+    paths: set = set()
+    size = 0
+    for index, path, length in files:
+        if groups and size + length <= budget and path not in paths:
+            groups[-1].append(index)
+            paths.add(path)
+            size += length
+            continue
+        groups.append([index])
+        paths = {path}
+        size = length
+    return groups
 
 
 class BaseReviewChain(ABC):
     """Abstract base class for platform-specific review chains.
 
-    Implements depth-based stage selection and sequential chain execution.
-    Subclasses must implement _build_stages() to define platform-specific logic.
+    Implements depth-based stage selection and chain execution. The sync
+    execute() runs stages sequentially; aexecute() runs independent stages
+    of the same dependency level concurrently.
+    aexecute_batch() reviews several files at once, submitting each stage's
+    prompts for all files through one abatch() call.
+    With ``fused`` set, the active stages are merged into one prompt that
+    returns a findings array per stage, so a file takes one LLM call.
+    Subclasses declare STAGE_SPECS mapping stage names to prompt templates;
+    the resulting PromptStages call the LLM client directly and are built
+    once per (chain class, LLM client) and shared across instances.
+    Subclasses may override _build_stages() instead.
     """
 
+    __slots__ = (
+        "llm",
+        "depth",
+        "platform",
+        "stages",
+        "parser",
+        "result_cache",
+        "speculative",
+        "drafts",
+        "fused",
+        "structural_cache",
+        "_depth_stages",
+        "_active_stages",
+        "_result_keys",
+        "_skipped_results",
+    )
+
+    STAGE_SPECS: Dict[str, Any] = {}
+
     DEPTH_STAGES = {
         "quick": ["architecture", "improvements"],
         "standard": ["architecture", "platform_issues", "tests", "improvements"],
@@ -28,6 +219,14 @@ class BaseReviewChain(ABC):
         ],
     }
 
+    # Frozen copy of DEPTH_STAGES, compiled once per class definition
+    _DEPTH_STAGES_FROZEN: Dict[str, Tuple[str, ...]] = _freeze_depth_stages(DEPTH_STAGES)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Compile the frozen depth table for subclasses."""
+        super().__init_subclass__(**kwargs)
+        cls._DEPTH_STAGES_FROZEN = _freeze_depth_stages(cls.DEPTH_STAGES)
+
     def __init__(self, llm_client: Any, depth: str = "standard", platform: str = "unknown") -> None:
         """Initialize review chain.
 
@@ -39,17 +238,49 @@ class BaseReviewChain(ABC):
         self.llm = llm_client
         self.depth = depth
         self.platform = platform
+        # Optional stage output cache; set by callers to skip repeated LLM calls
+        self.result_cache: Optional[ResultCache] = None
+        # Pre-launch dependent stages against sibling drafts; set by callers.
+        # Accepted drafts can carry a sibling file's context into findings.
+        self.speculative = False
+        # Upstream results of recent files; callers may share one across chains
+        self.drafts = DraftStore()
+        # Review all active stages through one combined prompt; set by callers
+        self.fused = False
+        # Serve renamed-but-identical code from result_cache; set by callers
+        self.structural_cache = False
+        self._depth_stages: Tuple[str, ...] = self._DEPTH_STAGES_FROZEN.get(
+            depth, self._DEPTH_STAGES_FROZEN["standard"]
+        )
         self.stages = self._build_stages()
-        self.parser = ResultParser()
+        self.parser = _SHARED_PARSER
+        # Resolved once so execution loops skip depth lookup and membership tests
+        self._active_stages: Tuple[Tuple[str, PromptStage], ...] = tuple(
+            (name, self.stages[name])
+            for name in self._select_stages_by_depth()
+            if name in self.stages
+        )
+        # Context keys for stage outputs, formatted once instead of per call
+        self._result_keys: Dict[str, str] = {name: f"{name}_result" for name in self.stages}
+        # Later prompts may reference results of stages skipped at this depth
+        active = {name for name, _ in self._active_stages}
+        self._skipped_results: Dict[str, str] = {
+            self._result_keys[name]: "" for name in self.stages if name not in active
+        }
 
-    @abstractmethod
-    def _build_stages(self) -> Dict[str, LLMChain]:
-        """Build platform-specific review stages.
+    def _build_stages(self) -> Dict[str, PromptStage]:
+        """Build platform-specific review stages from STAGE_SPECS.
 
         Returns:
-            Dictionary mapping stage names to LLMChain instances
+            Dictionary mapping stage names to stages
         """
-        pass
+        try:
+            hash(self.llm)
+        except TypeError:
+            # Unhashable clients cannot key the cache; build a private set
+            return _build_stage_map(self.STAGE_SPECS, self.llm)
+        # Copy so per-instance edits to the mapping don't leak across chains
+        return dict(_make_stages(type(self), self.llm))
 
     def execute(self, code: str, file_path: str) -> ReviewResult:
         """Execute review chain with depth-based stage selection.
@@ -62,19 +293,316 @@ class BaseReviewChain(ABC):
             ReviewResult containing findings and summary
         """
         try:
-            active_stages = self._select_stages_by_depth()
-            result = self._execute_stages(active_stages, code, file_path)
+            fused = self._fused_stage() if self.fused else None
+            if fused is not None:
+                result = self._run_fused(fused, code, file_path)
+            else:
+                result = self._run_stages(self._active_stages, code, file_path)
             return self._parse_result(result, file_path)
         except Exception as e:
             raise ReviewError(f"Chain execution failed: {str(e)}") from e
 
+    async def aexecute(
+        self,
+        code: str,
+        file_path: str,
+        on_finding: Optional[Callable[[Finding], None]] = None,
+    ) -> ReviewResult:
+        """Execute review chain asynchronously.
+
+        Stages that do not consume each other's results run concurrently.
+        When on_finding is given, the final stages are streamed and each
+        finding is reported as soon as it is generated; a fused review
+        reports its findings once the single call completes.
+
+        Args:
+            code: Source code to review
+            file_path: Path to the file being reviewed
+            on_finding: Optional callback for findings streamed from final stages
+
+        Returns:
+            ReviewResult containing findings and summary
+        """
+        try:
+            fused = self._fused_stage() if self.fused else None
+            if fused is not None:
+                context = self._initial_context(code, file_path)
+                output = await self._acached_invoke(_FUSED_STAGE, fused, context)
+                review = self._parse_result(self._split_fused(output, context), file_path)
+                if on_finding is not None:
+                    for finding in review.findings:
+                        on_finding(finding)
+                return review
+
+            active_stages = [name for name, _ in self._active_stages]
+            result = await self._aexecute_stages(active_stages, code, file_path, on_finding)
+            return self._parse_result(result, file_path)
+        except Exception as e:
+            raise ReviewError(f"Chain execution failed: {str(e)}") from e
+
+    async def aexecute_batch(
+        self,
+        files: List[Tuple[str, str]],
+        max_concurrency: int = 10,
+        pack_chars: int = DEFAULT_PACK_CHARS,
+    ) -> List[ReviewResult]:
+        """Review several files, batching each stage across all files.
+
+        Levels run in dependency order; within a level every stage submits
+        the prompts for all files in a single abatch() call. Stages that do
+        not consume earlier results pack several files into one prompt,
+        up to pack_chars characters of code per call.
+
+        Args:
+            files: List of (code, file_path) pairs to review
+            max_concurrency: Maximum concurrent requests per abatch() call
+            pack_chars: Code size budget per multi-file prompt; 0 sends one
+                prompt per file
+
+        Returns:
+            ReviewResult for each file, in input order
+        """
+        try:
+            contexts: List[Dict[str, Any]] = [
+                self._initial_context(code, file_path) for code, file_path in files
+            ]
+            fused = self._fused_stage() if self.fused else None
+            if fused is not None:
+                texts = await self._abatch_stage(_FUSED_STAGE, fused, contexts, max_concurrency)
+                return [
+                    self._parse_result(self._split_fused(text, context), context["file_path"])
+                    for text, context in zip(texts, contexts)
+                ]
+            active_stages = [name for name, _ in self._active_stages]
+
+            result_keys = self._result_keys
+            for level in self._group_stage_levels(active_stages):
+                snapshots = [dict(context) for context in contexts]
+                outputs = await asyncio.gather(
+                    *(
+                        self._abatch_level_stage(name, snapshots, max_concurrency, pack_chars)
+                        for name in level
+                    )
+                )
+                for stage_name, texts in zip(level, outputs):
+                    for context, text in zip(contexts, texts):
+                        context[result_keys[stage_name]] = text
+
+            return [
+                self._parse_result(context, context["file_path"]) for context in contexts
+            ]
+        except Exception as e:
+            raise ReviewError(f"Chain execution failed: {str(e)}") from e
+
+    async def _abatch_level_stage(
+        self,
+        stage_name: str,
+        contexts: List[Dict[str, Any]],
+        max_concurrency: int,
+        pack_chars: int,
+    ) -> List[str]:
+        """Run one stage for many files, packing files per prompt when possible.
+
+        Args:
+            stage_name: Name of the stage
+            contexts: Stage input context per file
+            max_concurrency: Maximum concurrent requests
+            pack_chars: Code size budget per multi-file prompt; 0 disables packing
+
+        Returns:
+            Response text per context, in input order
+        """
+        packed = self._packed_stage(stage_name) if pack_chars > 0 and len(contexts) > 1 else None
+        if packed is None:
+            return await self._abatch_stage(
+                stage_name, self.stages[stage_name], contexts, max_concurrency
+            )
+        return await self._apack_stage(stage_name, packed, contexts, max_concurrency, pack_chars)
+
+    def _packed_stage(self, stage_name: str) -> Optional[PromptStage]:
+        """Build a stage reviewing several files per prompt.
+
+        Args:
+            stage_name: Name of the stage
+
+        Returns:
+            Multi-file stage, or None if the stage is not a shipped prompt or
+            consumes earlier stage results
+        """
+        ref = self.STAGE_SPECS.get(stage_name)
+        if not isinstance(ref, PromptRef) or ref.stage != stage_name:
+            return None
+        try:
+            prompt = get_batch_prompt(ref.platform, ref.stage)
+        except ValueError:
+            return None
+        return PromptStage(prompt, self.llm)
+
+    async def _apack_stage(
+        self,
+        stage_name: str,
+        packed: PromptStage,
+        contexts: List[Dict[str, Any]],
+        max_concurrency: int,
+        pack_chars: int,
+    ) -> List[str]:
+        """Run one stage for many files with several files per prompt.
+
+        Cached files are served per file; the rest are packed into prompts
+        within the size budget. A pack whose output cannot be split per
+        file is retried with one prompt per file.
+
+        Args:
+            stage_name: Name of the stage
+            packed: Multi-file stage from _packed_stage()
+            contexts: Stage input context per file
+            max_concurrency: Maximum concurrent requests
+            pack_chars: Code size budget per prompt
+
+        Returns:
+            Response text per context, in input order
+        """
+        stage = self.stages[stage_name]
+        keys = [self._stage_cache_key(stage_name, stage, context) for context in contexts]
+        texts: List[Optional[str]] = [
+            self.result_cache.get(key) if key and self.result_cache else None for key in keys
+        ]
+        pending = [
+            (index, contexts[index]["file_path"], len(contexts[index]["code"]))
+            for index, text in enumerate(texts)
+            if text is None
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(group: List[int]) -> None:
+            paths = [contexts[index]["file_path"] for index in group]
+            files_json = orjson.dumps(
+                [
+                    {"file_path": path, "code": contexts[index]["code"]}
+                    for index, path in zip(group, paths)
+                ]
+            ).decode()
+            async with semaphore:
+                output = await self._ainvoke_with_retry(packed, {"files_json": files_json})
+            split = self.parser.split_batch_output(_stage_text(output), paths)
+            if split is None:
+                outputs = await self._abatch_stage(
+                    stage_name, stage, [contexts[index] for index in group], max_concurrency
+                )
+                for index, text in zip(group, outputs):
+                    texts[index] = text
+                return
+            for index, path in zip(group, paths):
+                texts[index] = split[path]
+                if keys[index] is not None and self.result_cache is not None:
+                    self.result_cache.set(keys[index], split[path])
+
+        await asyncio.gather(*(_run(group) for group in _pack_by_size(pending, pack_chars)))
+        return [text or "" for text in texts]
+
+    async def _abatch_stage(
+        self,
+        stage_name: str,
+        stage: Any,
+        contexts: List[Dict[str, Any]],
+        max_concurrency: int,
+    ) -> List[str]:
+        """Run one stage for many inputs, batching the cache misses.
+
+        Args:
+            stage_name: Name of the stage
+            stage: Review stage
+            contexts: Stage input context per file
+            max_concurrency: Maximum concurrent requests for the batch
+
+        Returns:
+            Response text per context, in input order
+        """
+        keys = [self._stage_cache_key(stage_name, stage, context) for context in contexts]
+        texts: List[Optional[str]] = [
+            self.result_cache.get(key) if key and self.result_cache else None for key in keys
+        ]
+        pending = [index for index, text in enumerate(texts) if text is None]
+
+        if pending:
+            outputs = await stage.abatch(
+                [contexts[index] for index in pending],
+                config={"max_concurrency": max_concurrency},
+            )
+            for index, output in zip(pending, outputs):
+                text = _stage_text(output)
+                texts[index] = text
+                if keys[index] is not None and self.result_cache is not None:
+                    self.result_cache.set(keys[index], text)
+
+        return [text or "" for text in texts]
+
+    def _initial_context(self, code: str, file_path: str) -> Dict[str, Any]:
+        """Build the stage input context for one file.
+
+        Args:
+            code: Source code to review
+            file_path: Path to the file being reviewed
+
+        Returns:
+            Context holding the inputs and empty results of skipped stages
+        """
+        return {"code": code, "file_path": file_path, **self._skipped_results}
+
+    def _fused_stage(self) -> Optional[PromptStage]:
+        """Build a stage running every active stage through one combined prompt.
+
+        Returns:
+            Fused stage, or None when the active stages are not all shipped
+            prompts of a single platform
+        """
+        refs = [self.STAGE_SPECS.get(name) for name, _ in self._active_stages]
+        if not refs or not all(
+            isinstance(ref, PromptRef) and ref.stage == name
+            for ref, (name, _) in zip(refs, self._active_stages)
+        ):
+            return None
+        platforms = {ref.platform for ref in refs}
+        if len(platforms) != 1:
+            return None
+        prompt = get_combined_prompt(platforms.pop(), tuple(ref.stage for ref in refs))
+        return PromptStage(prompt, self.llm)
+
+    def _run_fused(self, stage: PromptStage, code: str, file_path: str) -> Dict[str, Any]:
+        """Review a file with one combined-prompt call.
+
+        Args:
+            stage: Fused stage from _fused_stage()
+            code: Source code to review
+            file_path: Path to the file being reviewed
+
+        Returns:
+            Dictionary containing per-stage outputs
+        """
+        context = self._initial_context(code, file_path)
+        output = self._cached_invoke(_FUSED_STAGE, stage, context)
+        return self._split_fused(output, context)
+
+    def _split_fused(self, output: Any, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge a combined-prompt output into the context as per-stage results.
+
+        Args:
+            output: Fused stage output
+            context: Stage input context
+
+        Returns:
+            Context extended with a result per active stage
+        """
+        names = [name for name, _ in self._active_stages]
+        return {**context, **self.parser.split_combined_output(_stage_text(output), names)}
+
     def _select_stages_by_depth(self) -> List[str]:
         """Select stages based on review depth.
 
         Returns:
             List of stage names to execute
         """
-        return self.DEPTH_STAGES.get(self.depth, self.DEPTH_STAGES["standard"])
+        return list(self._depth_stages)
 
     def _execute_stages(
         self, active_stages: List[str], code: str, file_path: str
@@ -89,20 +617,553 @@ class BaseReviewChain(ABC):
         Returns:
             Dictionary containing stage outputs
         """
-        context = {"code": code, "file_path": file_path}
+        stages = tuple((name, self.stages[name]) for name in active_stages if name in self.stages)
+        return self._run_stages(stages, code, file_path)
 
-        for stage_name in active_stages:
-            if stage_name not in self.stages:
-                continue
+    def _run_stages(
+        self, stages: Tuple[Tuple[str, Any], ...], code: str, file_path: str
+    ) -> Dict[str, Any]:
+        """Run resolved (name, stage) pairs sequentially.
 
-            stage = self.stages[stage_name]
-            output = stage.invoke(context)
+        Args:
+            stages: Ordered (stage name, stage chain) pairs to execute
+            code: Source code to review
+            file_path: Path to the file being reviewed
+
+        Returns:
+            Dictionary containing stage outputs
+        """
+        context = self._initial_context(code, file_path)
+        result_keys = self._result_keys
+
+        for stage_name, stage in stages:
+            output = self._cached_invoke(stage_name, stage, context)
 
             # Add stage output to context for next stages
-            context[f"{stage_name}_result"] = output.get("text", "")
+            context[result_keys[stage_name]] = _stage_text(output)
 
         return context
 
+    async def _aexecute_stages(
+        self,
+        active_stages: List[str],
+        code: str,
+        file_path: str,
+        on_finding: Optional[Callable[[Finding], None]] = None,
+    ) -> Dict[str, Any]:
+        """Execute selected stages level by level, concurrently within a level.
+
+        Args:
+            active_stages: List of stage names to execute
+            code: Source code to review
+            file_path: Path to the file being reviewed
+            on_finding: Optional callback; final-level stages are streamed when set
+
+        Returns:
+            Dictionary containing stage outputs
+        """
+        context: Dict[str, Any] = self._initial_context(code, file_path)
+        levels = self._group_stage_levels(active_stages)
+        if self.speculative and on_finding is None:
+            return await self._aexecute_speculative(levels, context)
+
+        for index, level in enumerate(levels):
+            # Every stage in a level sees the same snapshot of prior results
+            snapshot = dict(context)
+            if on_finding is not None and index == len(levels) - 1:
+                calls = [
+                    self._astream_stage(name, self.stages[name], snapshot, on_finding)
+                    for name in level
+                ]
+            else:
+                calls = [self._acached_invoke(name, self.stages[name], snapshot) for name in level]
+            outputs = await asyncio.gather(*calls)
+            for stage_name, output in zip(level, outputs):
+                context[self._result_keys[stage_name]] = _stage_text(output)
+
+        return context
+
+    async def _aexecute_speculative(
+        self, levels: List[List[str]], context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute levels while pre-launching the next level against drafts.
+
+        While a level runs, stages of the next level whose upstream results
+        have drafts start immediately with those drafts. When the real
+        results arrive, speculative calls whose drafts were close enough are
+        kept; the rest are cancelled and reissued with the real results. A
+        kept call saw a sibling file's upstream output instead of this
+        file's, so each one is logged.
+
+        Args:
+            levels: Stage names grouped by dependency level
+            context: Initial stage input context
+
+        Returns:
+            Dictionary containing stage outputs
+        """
+        file_path = context.get("file_path", "")
+        speculated: Dict[str, Tuple["asyncio.Future[Any]", Dict[str, str]]] = {}
+        running: List["asyncio.Future[Any]"] = []
+
+        try:
+            for index, level in enumerate(levels):
+                snapshot = dict(context)
+                tasks: Dict[str, "asyncio.Future[Any]"] = {}
+                for name in level:
+                    launched = speculated.pop(name, None)
+                    if launched is not None and drafts_hold(launched[1], context):
+                        logger.info(
+                            "Kept speculative %s for %s, drafted from a sibling file's %s",
+                            name,
+                            file_path,
+                            ", ".join(launched[1]),
+                        )
+                        tasks[name] = launched[0]
+                        continue
+                    if launched is not None:
+                        launched[0].cancel()
+                    tasks[name] = asyncio.ensure_future(
+                        self._acached_invoke(name, self.stages[name], snapshot)
+                    )
+                running = list(tasks.values())
+
+                if index + 1 < len(levels):
+                    for name in levels[index + 1]:
+                        drafts = self._speculative_drafts(name, level, file_path)
+                        if drafts is None:
+                            continue
+                        draft_context = {**snapshot, **drafts}
+                        speculated[name] = (
+                            asyncio.ensure_future(
+                                self._acached_invoke(name, self.stages[name], draft_context)
+                            ),
+                            drafts,
+                        )
+
+                outputs = await asyncio.gather(*running)
+                for stage_name, output in zip(tasks, outputs):
+                    text = _stage_text(output)
+                    context[self._result_keys[stage_name]] = text
+                    self.drafts.remember(self.platform, stage_name, file_path, text)
+        except BaseException:
+            for task in running + [task for task, _ in speculated.values()]:
+                task.cancel()
+            raise
+
+        return context
+
+    def _speculative_drafts(
+        self, stage_name: str, running_level: List[str], file_path: str
+    ) -> Optional[Dict[str, str]]:
+        """Collect drafts for the running upstream stages a stage consumes.
+
+        Args:
+            stage_name: Stage to pre-launch
+            running_level: Stages currently executing
+            file_path: Path of the file being reviewed
+
+        Returns:
+            Draft results keyed by context key, or None if any is missing
+        """
+        inputs = self._stage_input_variables(self.stages[stage_name])
+        drafts: Dict[str, str] = {}
+        for upstream in running_level:
+            key = self._result_keys[upstream]
+            if inputs is not None and key not in inputs:
+                continue
+            draft = self.drafts.lookup(self.platform, upstream, file_path)
+            if draft is None:
+                return None
+            drafts[key] = draft
+        return drafts
+
+    def _cached_invoke(
+        self, stage_name: str, stage: Any, context: Dict[str, Any]
+    ) -> Any:
+        """Invoke a stage, serving identical inputs from result_cache.
+
+        Args:
+            stage_name: Name of the stage
+            stage: Review stage
+            context: Stage input context
+
+        Returns:
+            Stage output (response text or output dictionary)
+        """
+        key = self._stage_cache_key(stage_name, stage, context)
+        if key is not None and self.result_cache is not None:
+            cached = self.result_cache.get(key)
+            if cached is None:
+                cached = self._structural_get(stage_name, stage, context)
+                if cached is not None:
+                    self.result_cache.set(key, cached)
+            if cached is not None:
+                return {"text": cached}
+
+        output = self._invoke_with_retry(stage, context)
+
+        if key is not None and self.result_cache is not None:
+            self.result_cache.set(key, _stage_text(output))
+            self._structural_set(stage_name, stage, context, _stage_text(output))
+        return output
+
+    async def _acached_invoke(
+        self, stage_name: str, stage: Any, context: Dict[str, Any]
+    ) -> Any:
+        """Async variant of _cached_invoke.
+
+        Args:
+            stage_name: Name of the stage
+            stage: Review stage
+            context: Stage input context
+
+        Returns:
+            Stage output (response text or output dictionary)
+        """
+        key = self._stage_cache_key(stage_name, stage, context)
+        if key is not None and self.result_cache is not None:
+            cached = self.result_cache.get(key)
+            if cached is None:
+                cached = self._structural_get(stage_name, stage, context)
+                if cached is not None:
+                    self.result_cache.set(key, cached)
+            if cached is not None:
+                return {"text": cached}
+
+        output = await self._ainvoke_coalesced(stage, context)
+
+        if key is not None and self.result_cache is not None:
+            self.result_cache.set(key, _stage_text(output))
+            self._structural_set(stage_name, stage, context, _stage_text(output))
+        return output
+
+    async def _ainvoke_coalesced(self, stage: Any, context: Dict[str, Any]) -> Any:
+        """Invoke a stage, sharing one call among identical concurrent prompts.
+
+        Args:
+            stage: Review stage
+            context: Stage input context
+
+        Returns:
+            Stage output
+        """
+        prompt = self._stage_prompt(stage)
+        try:
+            rendered = prompt.format(**context) if prompt is not None else None
+        except (KeyError, TypeError, ValueError):
+            rendered = None
+        if not isinstance(rendered, str):
+            return await self._ainvoke_with_retry(stage, context)
+
+        key = ResultCache.make_key(str(id(self.llm)), rendered)
+        return await coalesce(key, lambda: self._ainvoke_with_retry(stage, context))
+
+    @RETRYING
+    def _invoke_with_retry(self, stage: Any, context: Dict[str, Any]) -> Any:
+        """Invoke a stage, retrying transient provider failures.
+
+        Args:
+            stage: Review stage
+            context: Stage input context
+
+        Returns:
+            Stage output
+        """
+        return stage.invoke(context)
+
+    @RETRYING
+    async def _ainvoke_with_retry(self, stage: Any, context: Dict[str, Any]) -> Any:
+        """Async variant of _invoke_with_retry.
+
+        Args:
+            stage: Review stage
+            context: Stage input context
+
+        Returns:
+            Stage output
+        """
+        return await stage.ainvoke(context)
+
+    async def _astream_stage(
+        self,
+        stage_name: str,
+        stage: Any,
+        context: Dict[str, Any],
+        on_finding: Callable[[Finding], None],
+    ) -> Dict[str, Any]:
+        """Stream a stage's output, reporting findings while tokens arrive.
+
+        If the stream fails with a retryable error (see _retry), the stage is
+        re-run through the regular retried, coalesced and cached call, and
+        only findings not already reported from the partial stream are
+        reported.
+
+        Args:
+            stage_name: Name of the stage
+            stage: Review stage
+            context: Stage input context
+            on_finding: Callback invoked for each completed finding
+
+        Returns:
+            Stage output dictionary with the full text
+        """
+        key = self._stage_cache_key(stage_name, stage, context)
+        cached = self.result_cache.get(key) if key and self.result_cache else None
+        reported: set[Tuple[str, Optional[int], str]] = set()
+
+        def _report(finding: Finding) -> None:
+            identity = (finding.severity, finding.line_number, finding.description)
+            if identity not in reported:
+                reported.add(identity)
+                on_finding(finding)
+
+        async def _chunks() -> AsyncIterator[str]:
+            if cached is not None:
+                yield cached
+                return
+            async for chunk in stage.astream(context):
+                yield _stage_text(chunk) if isinstance(chunk, dict) else str(chunk)
+
+        try:
+            text = await self._areport_stream(_chunks(), stage_name, context, _report)
+        except RETRYABLE_ERRORS as e:
+            logger.warning(f"Streaming {stage_name} failed, retrying without streaming: {e}")
+            text = _stage_text(await self._acached_invoke(stage_name, stage, context))
+
+            async def _full_text() -> AsyncIterator[str]:
+                yield text
+
+            await self._areport_stream(_full_text(), stage_name, context, _report)
+            return {"text": text}
+
+        if cached is None and key is not None and self.result_cache is not None:
+            self.result_cache.set(key, text)
+        return {"text": text}
+
+    async def _areport_stream(
+        self,
+        chunks: AsyncIterator[str],
+        stage_name: str,
+        context: Dict[str, Any],
+        report: Callable[[Finding], None],
+    ) -> str:
+        """Feed text chunks to the incremental parser and report its findings.
+
+        Chunks are pushed into a queue consumed by the parser's incremental
+        extractor, so parsing overlaps generation.
+
+        Args:
+            chunks: Stage output text chunks
+            stage_name: Name of the stage
+            context: Stage input context
+            report: Callback invoked for each completed finding
+
+        Returns:
+            The full text
+        """
+        queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+
+        async def _produce() -> str:
+            parts: List[str] = []
+            try:
+                async for text in chunks:
+                    parts.append(text)
+                    await queue.put(text)
+            finally:
+                await queue.put(None)
+            return "".join(parts)
+
+        producer = asyncio.create_task(_produce())
+        try:
+            async for finding in self.parser.aextract_findings_stream(
+                queue, self._result_keys[stage_name], context.get("file_path", "")
+            ):
+                report(finding)
+        except BaseException:
+            producer.cancel()
+            raise
+        return await producer
+
+    def _stage_cache_key(
+        self, stage_name: str, stage: Any, context: Dict[str, Any]
+    ) -> Optional[str]:
+        """Build the cache key for a stage invocation.
+
+        The key covers platform, stage, depth, model, the prompt (see
+        _prompt_fingerprint), code, file path and the prior results the
+        stage consumes.
+
+        Args:
+            stage_name: Name of the stage
+            stage: Review stage
+            context: Stage input context
+
+        Returns:
+            Cache key, or None when caching is disabled or inputs are not plain text
+        """
+        if self.result_cache is None:
+            return None
+        if not all(isinstance(value, str) for value in context.values()):
+            return None
+
+        inputs = self._stage_input_variables(stage)
+        prior = sorted(
+            name
+            for name in context
+            if name.endswith("_result") and (inputs is None or name in inputs)
+        )
+        model = str(getattr(getattr(self.llm, "config", None), "model", ""))
+
+        return ResultCache.make_key(
+            self.platform,
+            stage_name,
+            self.depth,
+            model,
+            _prompt_fingerprint(stage, self.llm),
+            # Large inputs are digested once per file, not once per stage
+            code_digest(context.get("code", "")),
+            context.get("file_path", ""),
+            *(f"{name}={content_digest(context[name])}" for name in prior),
+        )
+
+    def _structural_key(
+        self, stage_name: str, stage: Any, context: Dict[str, Any]
+    ) -> Optional[str]:
+        """Build the cache key shared by every same-shaped version of the code.
+
+        Only with structural_cache set, and only for stages reading nothing
+        but the code and file path; the file path and identifier names are
+        left out of the key.
+
+        Args:
+            stage_name: Name of the stage
+            stage: Review stage
+            context: Stage input context
+
+        Returns:
+            Cache key, or None if the stage cannot be served structurally
+        """
+        if not self.structural_cache:
+            return None
+        inputs = self._stage_input_variables(stage)
+        if inputs is None or not set(inputs) <= {"code", "file_path"}:
+            return None
+        code = context.get("code")
+        if not isinstance(code, str):
+            return None
+        model = str(getattr(getattr(self.llm, "config", None), "model", ""))
+        shape, _ = code_shape(code)
+        return ResultCache.make_key(
+            "shape",
+            self.platform,
+            stage_name,
+            self.depth,
+            model,
+            _prompt_fingerprint(stage, self.llm),
+            shape,
+        )
+
+    def _structural_get(
+        self, stage_name: str, stage: Any, context: Dict[str, Any]
+    ) -> Optional[str]:
+        """Serve a stage from the output for a renamed version of the same code.
+
+        Args:
+            stage_name: Name of the stage
+            stage: Review stage
+            context: Stage input context
+
+        Returns:
+            Cached output with identifiers renamed, or None on miss
+        """
+        key = self._structural_key(stage_name, stage, context)
+        cached = self.result_cache.get(key) if key and self.result_cache else None
+        if cached is None:
+            return None
+        entry = orjson.loads(cached)
+        _, identifiers = code_shape(context["code"])
+        reserved = _OUTPUT_WORDS | frozenset(self.stages)
+        return rename_identifiers(entry["text"], entry["identifiers"], identifiers, reserved)
+
+    def _structural_set(
+        self, stage_name: str, stage: Any, context: Dict[str, Any], text: str
+    ) -> None:
+        """Record a stage output under its structural key.
+
+        Args:
+            stage_name: Name of the stage
+            stage: Review stage
+            context: Stage input context
+            text: Stage output text
+        """
+        key = self._structural_key(stage_name, stage, context)
+        if key is None or self.result_cache is None:
+            return
+        _, identifiers = code_shape(context["code"])
+        entry = {"identifiers": identifiers, "text": text}
+        self.result_cache.set(key, orjson.dumps(entry).decode())
+
+    def _group_stage_levels(self, active_stages: List[str]) -> List[List[str]]:
+        """Group stages into topological levels by result dependencies.
+
+        A stage depends on every earlier stage whose ``{name}_result`` appears
+        in its prompt input variables. Stages whose prompt cannot be inspected
+        depend on all earlier stages, preserving sequential semantics.
+
+        Args:
+            active_stages: Ordered list of stage names to execute
+
+        Returns:
+            List of levels, each a list of stage names safe to run together
+        """
+        present = [name for name in active_stages if name in self.stages]
+        depth_of: Dict[str, int] = {}
+        levels: List[List[str]] = []
+
+        for index, stage_name in enumerate(present):
+            earlier = present[:index]
+            inputs = self._stage_input_variables(self.stages[stage_name])
+            if inputs is None:
+                deps = earlier
+            else:
+                deps = [name for name in earlier if self._result_keys[name] in inputs]
+
+            level = max((depth_of[name] + 1 for name in deps), default=0)
+            depth_of[stage_name] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(stage_name)
+
+        return levels
+
+    @staticmethod
+    def _stage_prompt(stage: Any) -> Any:
+        """Return a stage's prompt template, or None if it has none.
+
+        Args:
+            stage: Review stage
+
+        Returns:
+            Prompt template or None
+        """
+        return getattr(stage, "prompt", None)
+
+    @staticmethod
+    def _stage_input_variables(stage: Any) -> List[str] | None:
+        """Return a stage's prompt input variables, or None if unknown.
+
+        Args:
+            stage: Review stage
+
+        Returns:
+            List of input variable names or None
+        """
+        variables = getattr(BaseReviewChain._stage_prompt(stage), "input_variables", None)
+        if isinstance(variables, (list, tuple)):
+            return list(variables)
+        return None
+
     def _parse_result(
         self, result: Dict[str, Any], file_path: str
     ) -> ReviewResult:
@@ -0,0 +1,118 @@
+"""Concurrent multi-file review with bounded concurrency and rate limiting."""
+
+import asyncio
+from typing import Any, Callable, Dict, Optional
+
+from shield_pr.chains import get_chain
+from shield_pr.core.errors import ReviewError
+from shield_pr.models.review_result import ReviewResult
+from shield_pr.utils.logger import logger
+
+
+class _TokenBucket:
+    """Queue-backed token bucket refilled by a background task.
+
+    Tokens are dropped into a bounded queue at a steady rate; acquiring a
+    token waits until one is available, which caps the start rate.
+    """
+
+    def __init__(self, rate_per_minute: int, capacity: int) -> None:
+        """Initialize token bucket.
+
+        Args:
+            rate_per_minute: Tokens added per minute
+            capacity: Maximum tokens held at once (burst size)
+        """
+        self._interval = 60.0 / rate_per_minute
+        self._tokens: asyncio.Queue[None] = asyncio.Queue(maxsize=capacity)
+        for _ in range(capacity):
+            self._tokens.put_nowait(None)
+        self._refill_task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        """Start the background refill task."""
+        self._refill_task = asyncio.create_task(self._refill())
+
+    async def stop(self) -> None:
+        """Cancel the background refill task."""
+        if self._refill_task is None:
+            return
+        self._refill_task.cancel()
+        try:
+            await self._refill_task
+        except asyncio.CancelledError:
+            pass
+
+    async def acquire(self) -> None:
+        """Wait for and consume one token."""
+        await self._tokens.get()
+
+    async def _refill(self) -> None:
+        """Add one token per interval, dropping it when the bucket is full."""
+        while True:
+            await asyncio.sleep(self._interval)
+            if not self._tokens.full():
+                self._tokens.put_nowait(None)
+
+
+async def review_files(
+    platform: str,
+    llm: Any,
+    files: Dict[str, str],
+    depth: str = "standard",
+    max_concurrency: int = 10,
+    rpm: int = 100,
+    on_result: Optional[Callable[[str, ReviewResult], None]] = None,
+) -> Dict[str, ReviewResult]:
+    """Review many files of one platform concurrently.
+
+    A single chain instance is shared across files since its stages are
+    immutable. At most ``max_concurrency`` reviews run at once and at most
+    ``rpm`` reviews start per minute.
+
+    Args:
+        platform: Platform name (android, ios, ai-ml, frontend, backend)
+        llm: LLM client for chain execution
+        files: Dictionary mapping file paths to source code
+        depth: Review depth (quick, standard, deep)
+        max_concurrency: Maximum number of files reviewed at once
+        rpm: Maximum number of file reviews started per minute
+        on_result: Optional callback invoked as each file completes
+
+    Returns:
+        Dictionary mapping file paths to ReviewResult for successful reviews
+
+    Raises:
+        ValueError: If platform is unsupported or limits are not positive
+    """
+    if max_concurrency < 1 or rpm < 1:
+        raise ValueError("max_concurrency and rpm must be positive")
+
+    chain = get_chain(platform, llm, depth)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    bucket = _TokenBucket(rpm, capacity=min(max_concurrency, rpm))
+
+    async def _review_one(file_path: str, code: str) -> tuple[str, Optional[ReviewResult]]:
+        async with semaphore:
+            await bucket.acquire()
+            try:
+                return file_path, await chain.aexecute(code, file_path)
+            except ReviewError as e:
+                logger.warning(f"Failed to review {file_path}: {e}")
+                return file_path, None
+
+    results: Dict[str, ReviewResult] = {}
+    bucket.start()
+    try:
+        tasks = [_review_one(path, code) for path, code in files.items()]
+        for next_done in asyncio.as_completed(tasks):
+            file_path, result = await next_done
+            if result is None:
+                continue
+            results[file_path] = result
+            if on_result is not None:
+                on_result(file_path, result)
+    finally:
+        await bucket.stop()
+
+    return results
@@ -1,9 +1,8 @@
 """Backend-specific review chain implementation."""
 
-from typing import Any, Dict
-from langchain.chains import LLMChain  # type: ignore
+from typing import Any
 from shield_pr.chains.base import BaseReviewChain
-from shield_pr.chains.prompts.backend_prompts import BACKEND_PROMPTS
+from shield_pr.chains.prompts.factory import PromptRef
 
 
 class BackendReviewChain(BaseReviewChain):
@@ -18,6 +17,15 @@ class BackendReviewChain(BaseReviewChain):
     - Test coverage and quality
     """
 
+    __slots__ = ()
+
+    STAGE_SPECS = {
+        "architecture": PromptRef("backend", "architecture"),
+        "platform_issues": PromptRef("backend", "platform_issues"),
+        "tests": PromptRef("backend", "tests"),
+        "improvements": PromptRef("backend", "improvements"),
+    }
+
     def __init__(self, llm_client: Any, depth: str = "standard") -> None:
         """Initialize Backend review chain.
 
@@ -26,66 +34,3 @@ class BackendReviewChain(BaseReviewChain):
             depth: Review depth (quick, standard, deep)
         """
         super().__init__(llm_client, depth, platform="backend")
-
-    def _build_stages(self) -> Dict[str, LLMChain]:
-        """Build Backend-specific review stages.
-
-        Returns:
-            Dictionary mapping stage names to LLMChain instances
-        """
-        return {
-            "architecture": self._arch_stage(),
-            "platform_issues": self._platform_issues_stage(),
-            "tests": self._test_coverage_stage(),
-            "improvements": self._improvement_stage(),
-        }
-
-    def _arch_stage(self) -> LLMChain:
-        """Create architecture analysis stage.
-
-        Returns:
-            LLMChain for architecture review
-        """
-        return LLMChain(
-            llm=self.llm,
-            prompt=BACKEND_PROMPTS["architecture"],
-            output_key="architecture_result",
-        )
-
-    def _platform_issues_stage(self) -> LLMChain:
-        """Create Backend-specific issues stage.
-
-        Analyzes security, database, error handling, rate limiting, concurrency.
-
-        Returns:
-            LLMChain for platform-specific analysis
-        """
-        return LLMChain(
-            llm=self.llm,
-            prompt=BACKEND_PROMPTS["platform_issues"],
-            output_key="platform_issues_result",
-        )
-
-    def _test_coverage_stage(self) -> LLMChain:
-        """Create test coverage analysis stage.
-
-        Returns:
-            LLMChain for test analysis
-        """
-        return LLMChain(
-            llm=self.llm,
-            prompt=BACKEND_PROMPTS["tests"],
-            output_key="tests_result",
-        )
-
-    def _improvement_stage(self) -> LLMChain:
-        """Create improvement suggestions stage.
-
-        Returns:
-            LLMChain for improvement analysis
-        """
-        return LLMChain(
-            llm=self.llm,
-            prompt=BACKEND_PROMPTS["improvements"],
-            output_key="improvements_result",
-        )
@@ -1,5 +1,7 @@
 """Prompt templates for review chains."""
 
+import os
+
 from shield_pr.chains.prompts.android_prompts import ANDROID_PROMPTS
 from shield_pr.chains.prompts.ios_prompts import IOS_PROMPTS
 from shield_pr.chains.prompts.ai_ml_prompts import AI_ML_PROMPTS
@@ -7,6 +9,8 @@ from shield_pr.chains.prompts.frontend_prompts import FRONTEND_PROMPTS
 from shield_pr.chains.prompts.backend_prompts import BACKEND_PROMPTS
 from shield_pr.chains.prompts.universal_prompts import UNIVERSAL_PROMPTS
 from shield_pr.chains.prompts.severity_guide import SEVERITY_GUIDE
+from shield_pr.chains.prompts.findings_schema import FINDINGS_SCHEMA
+from shield_pr.chains.prompts.factory import get_batch_prompt, get_combined_prompt, get_prompt
 
 __all__ = [
     "ANDROID_PROMPTS",
@@ -16,4 +20,14 @@ __all__ = [
     "BACKEND_PROMPTS",
     "UNIVERSAL_PROMPTS",
     "SEVERITY_GUIDE",
+    "FINDINGS_SCHEMA",
+    "get_prompt",
+    "get_combined_prompt",
+    "get_batch_prompt",
 ]
+
+# CI sets SHIELD_PR_BUDGET_CHECK to fail fast when a template outgrows its budget
+if os.getenv("SHIELD_PR_BUDGET_CHECK"):
+    from shield_pr.chains.prompts.budget import check_token_budgets
+
+    check_token_budgets()
@@ -0,0 +1,71 @@
+"""Token budgets for stage prompt templates.
+
+Every character of a template is sent on every call, so each stage
+declares a token_budget in definitions.yaml. Counts are estimated from
+template length, as no tokenizer ships with the project.
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+from shield_pr.chains.prompts.code_preproc import CHARS_PER_TOKEN
+from shield_pr.chains.prompts.factory import _definitions, get_prompt
+from shield_pr.core.errors import PromptBudgetError
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Approximate number of tokens
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def token_budgets() -> Dict[Tuple[str, str], int]:
+    """Return the declared budget of every platform stage.
+
+    Returns:
+        Mapping of (platform, stage) to its token budget
+    """
+    return {
+        (platform, stage): spec["token_budget"]
+        for platform, definition in _definitions().items()
+        for stage, spec in definition["stages"].items()
+    }
+
+
+def template_token_counts() -> List[Tuple[str, str, int, int]]:
+    """Measure every stage template against its budget, heaviest first.
+
+    Returns:
+        (platform, stage, estimated tokens, budget) tuples
+    """
+    counts = [
+        (platform, stage, estimate_tokens(get_prompt(platform, stage).template), budget)
+        for (platform, stage), budget in token_budgets().items()
+    ]
+    return sorted(counts, key=lambda row: row[2], reverse=True)
+
+
+def check_token_budgets(top: int = 10) -> None:
+    """Log the heaviest templates and fail if any exceeds its budget.
+
+    Args:
+        top: Number of heaviest templates to log
+
+    Raises:
+        PromptBudgetError: If a template is over budget
+    """
+    from shield_pr.utils.logger import logger
+
+    counts = template_token_counts()
+    for platform, stage, tokens, budget in counts[:top]:
+        logger.info(f"{platform}/{stage}: ~{tokens} tokens (budget {budget})")
+
+    over = [f"{p}/{s} ({t} > {b})" for p, s, t, b in counts if t > b]
+    if over:
+        raise PromptBudgetError(f"Prompt templates over token budget: {', '.join(over)}")
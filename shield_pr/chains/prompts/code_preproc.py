@@ -0,0 +1,205 @@
+"""Shrink review input before it is inlined into a prompt.
+
+Trailing whitespace and unchanged diff context cost input tokens without
+telling the reviewer anything. Findings cite line numbers, so full files
+and diff hunks keep every line in place; only a diff over budget loses its
+unchanged context lines, and its hunk headers are rewritten to match.
+"""
+
+import re
+from itertools import takewhile
+from pathlib import PurePath
+from typing import List, Optional, Tuple
+
+# Rough size of one token, used to turn token budgets into character limits
+CHARS_PER_TOKEN = 4
+
+_LANGUAGES = {
+    ".kt": "kotlin",
+    ".kts": "kotlin",
+    ".java": "java",
+    ".swift": "swift",
+    ".m": "objc",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".go": "go",
+    ".rs": "rust",
+    ".py": "python",
+    ".rb": "ruby",
+}
+
+# Hunk header: old start, optional old count, new start, optional new count
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)$")
+_TRUNCATED_RE = re.compile(r"^\.\.\. \[(\d+) more lines truncated\]$", re.MULTILINE)
+
+
+def language_for(file_path: str) -> str:
+    """Guess a file's language from its extension.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Language name, or "" if unknown
+    """
+    return _LANGUAGES.get(PurePath(file_path).suffix.lower(), "")
+
+
+def prepare(code: str, budget_tokens: Optional[int] = None, is_diff: bool = False) -> str:
+    """Normalize and trim code (or a unified diff) for a review prompt.
+
+    Line endings are normalized and trailing whitespace stripped; diff lines
+    keep their leading marker, so blank context lines survive and hunks
+    still match their @@ line counts. When a diff is over budget, its
+    unchanged context is dropped and hunks are split around the gaps with
+    rewritten @@ headers, so every change keeps its line numbers. Anything
+    still over budget is truncated at a line boundary with a marker (see
+    truncated_lines).
+
+    Args:
+        code: Source code or unified diff patch
+        budget_tokens: Approximate token limit, or None for no limit
+        is_diff: Whether code is a unified diff rather than a full file
+
+    Returns:
+        Prepared review input
+    """
+    lines = code.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    if is_diff:
+        lines = [line[:1] + line[1:].rstrip() for line in lines]
+    else:
+        lines = [line.rstrip() for line in lines]
+    while lines and not lines[-1]:
+        lines.pop()
+
+    limit = budget_tokens * CHARS_PER_TOKEN if budget_tokens else None
+    if limit is not None and is_diff and _size(lines) > limit:
+        lines = _drop_context(lines)
+    if limit is not None and _size(lines) > limit:
+        lines = _truncate(lines, limit, is_diff)
+
+    return "\n".join(lines)
+
+
+def truncated_lines(prepared: str) -> int:
+    """Return how many lines prepare() cut from the end of its input.
+
+    Args:
+        prepared: Output of prepare(), possibly embedded in a larger prompt
+
+    Returns:
+        Number of truncated lines, or 0 if nothing was cut
+    """
+    match = _TRUNCATED_RE.search(prepared)
+    return int(match.group(1)) if match else 0
+
+
+def _size(lines: List[str]) -> int:
+    """Return the joined length of lines."""
+    return sum(len(line) + 1 for line in lines)
+
+
+def _hunk_positions(match: "re.Match[str]") -> Tuple[int, int]:
+    """Return the old and new line numbers of a hunk's first line.
+
+    A side with a zero count names the line before the hunk instead.
+    """
+    old, old_count, new, new_count = match.group(1, 2, 3, 4)
+    return (
+        int(old) + (old_count == "0"),
+        int(new) + (new_count == "0"),
+    )
+
+
+def _hunk_header(old: int, removed: int, new: int, added: int, section: str = "") -> str:
+    """Format a hunk header from the line numbers of its first line."""
+    old_start = old if removed else max(old - 1, 0)
+    new_start = new if added else max(new - 1, 0)
+    return f"@@ -{old_start},{removed} +{new_start},{added} @@{section}"
+
+
+def _drop_context(lines: List[str]) -> List[str]:
+    """Drop unchanged context lines, splitting hunks around each gap.
+
+    Every run of changed lines becomes its own hunk, headed by its real
+    old and new line positions.
+    """
+    result: List[str] = []
+    run: List[str] = []
+    old = new = 0
+    run_old = run_new = 0
+    section = ""
+    in_hunk = False
+
+    def _flush() -> None:
+        nonlocal section
+        if run:
+            removed = sum(line.startswith("-") for line in run)
+            added = sum(line.startswith("+") for line in run)
+            result.append(_hunk_header(run_old, removed, run_new, added, section))
+            result.extend(run)
+            run.clear()
+            section = ""
+
+    for line in lines:
+        match = _HUNK_RE.match(line)
+        if match:
+            _flush()
+            (old, new), section = _hunk_positions(match), match.group(5)
+            in_hunk = True
+        elif not in_hunk or line.startswith("diff "):
+            _flush()
+            in_hunk = False
+            result.append(line)
+        elif line.startswith(("-", "+")):
+            if not run:
+                run_old, run_new = old, new
+            run.append(line)
+            if line.startswith("-"):
+                old += 1
+            else:
+                new += 1
+        elif line.startswith("\\"):
+            # "\ No newline at end of file" belongs to the line before it
+            if run:
+                run.append(line)
+        else:
+            _flush()
+            old += 1
+            new += 1
+    _flush()
+    return result
+
+
+def _recount_last_hunk(lines: List[str]) -> List[str]:
+    """Rewrite the counts of the last hunk header to match the lines kept."""
+    for index in range(len(lines) - 1, -1, -1):
+        match = _HUNK_RE.match(lines[index])
+        if match:
+            body = list(takewhile(lambda line: not line.startswith("diff "), lines[index + 1 :]))
+            removed = sum(not line.startswith(("+", "\\")) for line in body)
+            added = sum(not line.startswith(("-", "\\")) for line in body)
+            old, new = _hunk_positions(match)
+            lines[index] = _hunk_header(old, removed, new, added, match.group(5))
+            break
+    return lines
+
+
+def _truncate(lines: List[str], limit: int, is_diff: bool) -> List[str]:
+    """Keep whole lines up to limit characters and note how many were cut.
+
+    A diff's last kept hunk gets a header counting only its kept lines.
+    """
+    kept: List[str] = []
+    size = 0
+    for line in lines:
+        size += len(line) + 1
+        if size > limit:
+            break
+        kept.append(line)
+    if is_diff:
+        kept = _recount_last_hunk(kept)
+    kept.append(f"... [{len(lines) - len(kept)} more lines truncated]")
+    return kept
@@ -0,0 +1,278 @@
+"""Lazy construction of stage prompt templates.
+
+Every platform's stages are declared in definitions.yaml (role, task,
+focus areas, categories, upstream results) and rendered into one shared
+skeleton. FastPrompt objects are built on first use and cached, so a run
+that touches one platform only pays for the prompts it formats.
+"""
+
+import functools
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
+
+import yaml
+
+from shield_pr.chains.prompts.fast import FastPrompt
+from shield_pr.chains.prompts.findings_schema import (
+    render_batch_schema,
+    render_combined_schema,
+    render_findings_schema,
+    render_structured_hint,
+)
+from shield_pr.chains.prompts.prerender import inline_partials
+from shield_pr.chains.prompts.severity_guide import PROMPT_PARTIALS
+
+_DEFINITIONS_PATH = Path(__file__).with_name("definitions.yaml")
+
+# Per-file inputs, placed after the static instructions
+_INPUTS = "File: {file_path}\nCode:\n```\n{code}\n```\n"
+
+
+@functools.lru_cache(maxsize=1)
+def _definitions() -> Dict[str, Any]:
+    """Load the stage definitions of every platform (once).
+
+    Returns:
+        Mapping of platform names to {"role": ..., "stages": {...}}
+    """
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(_DEFINITIONS_PATH, encoding="utf-8") as f:
+        definitions: Dict[str, Any] = yaml.load(f, Loader=loader)
+    return definitions
+
+
+def _stage_names(platform: str) -> List[str]:
+    """Return a platform's stage names in pipeline order.
+
+    Args:
+        platform: Platform name (android, ios, ai-ml, frontend, backend, universal)
+
+    Returns:
+        Stage names
+
+    Raises:
+        KeyError: If the platform is unknown
+    """
+    return list(_definitions()[platform]["stages"])
+
+
+def _stage(platform: str, stage: str) -> Dict[str, Any]:
+    """Return one stage's definition, with the platform role filled in.
+
+    Args:
+        platform: Platform name
+        stage: Stage name
+
+    Returns:
+        Stage definition
+
+    Raises:
+        KeyError: If the platform or stage is unknown
+    """
+    definition = _definitions()[platform]
+    return {"role": definition["role"], **definition["stages"][stage]}
+
+
+def _focus_line(stage: Dict[str, Any]) -> str:
+    """Render a stage's focus areas as one line."""
+    label = stage.get("focus_label")
+    head = f"Focus ({label})" if label else "Focus"
+    return f"{head}: {'; '.join(stage['focus'])}. Cite line numbers."
+
+
+def _previous_block(stage: Dict[str, Any]) -> str:
+    """Render the upstream results a stage receives, or "" if none."""
+    uses = stage.get("uses") or []
+    if not uses:
+        return ""
+    if len(uses) == 1:
+        return f"\nPrevious Analysis:\n{{{uses[0]}_result}}\n"
+    lines = "".join(f"{_title(name)}: {{{name}_result}}\n" for name in uses)
+    return f"\nPrevious Analysis:\n{lines}"
+
+
+def _title(stage: str) -> str:
+    """Turn a stage name into a section title (platform_issues -> Platform Issues)."""
+    return stage.replace("_", " ").title()
+
+
+def _raw_template(platform: str, stage: str) -> str:
+    """Render a stage definition into the shared template skeleton.
+
+    Static instructions come first and per-file inputs last, so the prefix
+    up to the file path is identical across calls.
+
+    Args:
+        platform: Platform name
+        stage: Stage name
+
+    Returns:
+        Template text with {severity_guide} and {findings_schema} placeholders
+    """
+    definition = _stage(platform, stage)
+    return (
+        f"{definition['role']} {definition['task']}\n\n"
+        f"{_focus_line(definition)}\n\n"
+        "{severity_guide}\n\n{findings_schema}\n\n"
+        f"{_INPUTS}{_previous_block(definition)}"
+    )
+
+
+def get_prompt(platform: str, stage: str, structured: bool = False) -> FastPrompt:
+    """Build (once) the prompt template for a platform stage.
+
+    Args:
+        platform: Platform name (android, ios, ai-ml, frontend, backend, universal)
+        stage: Stage name (e.g. architecture, security)
+        structured: Leave out the JSON schema, for clients that enforce it
+
+    Returns:
+        Prompt with static partials inlined
+
+    Raises:
+        KeyError: If the platform or stage is unknown
+    """
+    # Positional call, so every spelling of the arguments shares one entry
+    return _build_prompt(platform, stage, structured)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_prompt(platform: str, stage: str, structured: bool) -> FastPrompt:
+    """Cached body of get_prompt()."""
+    render = render_structured_hint if structured else render_findings_schema
+    template = _raw_template(platform, stage).replace(
+        "{findings_schema}", render(_stage(platform, stage)["categories"])
+    )
+    return FastPrompt.from_template(inline_partials(template, PROMPT_PARTIALS))
+
+
+def _combined_section(platform: str, stage: str) -> Tuple[str, str]:
+    """Render a stage as a section of a combined prompt.
+
+    Args:
+        platform: Platform name
+        stage: Stage name
+
+    Returns:
+        (role sentence, section body with task, focus areas and categories)
+    """
+    definition = _stage(platform, stage)
+    body = (
+        f"# {_title(stage)}\n{definition['task']}\n\n"
+        f"{_focus_line(definition)}\nCategories: {definition['categories']}"
+    )
+    return definition["role"], body
+
+
+@functools.lru_cache(maxsize=None)
+def get_combined_prompt(platform: str, stages: Tuple[str, ...]) -> FastPrompt:
+    """Build (once) a single prompt covering several stages of a platform.
+
+    Each stage becomes a section of one prompt that asks for a JSON object
+    with a findings array per stage, so the code, severity guide and schema
+    are sent once and the review takes one LLM round trip. Sections are
+    reviewed together, so no stage receives another's results.
+
+    Args:
+        platform: Platform name (android, ios, ai-ml, frontend, backend, universal)
+        stages: Stage names, in section order
+
+    Returns:
+        Prompt taking code and file_path
+
+    Raises:
+        KeyError: If the platform or a stage is unknown
+    """
+    sections = [_combined_section(platform, stage) for stage in stages]
+    template = "\n\n".join(
+        [
+            f"{sections[0][0]} Review the file in one pass, covering every section below.",
+            *(body for _, body in sections),
+            "{severity_guide}",
+            render_combined_schema(stages),
+            "File: {file_path}\nCode:\n```\n{code}\n```\n",
+        ]
+    )
+    return FastPrompt.from_template(inline_partials(template, PROMPT_PARTIALS))
+
+
+@functools.lru_cache(maxsize=None)
+def get_batch_prompt(platform: str, stage: str) -> FastPrompt:
+    """Build (once) a prompt reviewing several files in one call for a stage.
+
+    The stage's instructions, severity guide and schema are sent once for
+    all files; the model returns a findings array per file path.
+
+    Args:
+        platform: Platform name (android, ios, ai-ml, frontend, backend, universal)
+        stage: Stage name; it must not consume earlier stage results
+
+    Returns:
+        Prompt taking files_json, a JSON list of {"file_path", "code"} objects
+
+    Raises:
+        KeyError: If the platform or stage is unknown
+        ValueError: If the stage consumes earlier stage results
+    """
+    definition = _stage(platform, stage)
+    if definition.get("uses"):
+        raise ValueError(f"Stage {stage!r} consumes earlier results and cannot be batched")
+    template = (
+        f"{definition['role']} {definition['task']}\n\n"
+        f"{_focus_line(definition)}\n\n"
+        "{severity_guide}\n\n"
+        f"{render_batch_schema(definition['categories'])}\n\n"
+        "Files (JSON list of file_path and code):\n{files_json}\n"
+    )
+    return FastPrompt.from_template(inline_partials(template, PROMPT_PARTIALS))
+
+
+class LazyPrompts(Mapping[str, FastPrompt]):
+    """Read-only stage -> prompt mapping that builds templates on access."""
+
+    def __init__(self, platform: str) -> None:
+        """Initialize mapping.
+
+        Args:
+            platform: Platform whose templates this mapping exposes
+        """
+        self._platform = platform
+
+    def __getitem__(self, stage: str) -> FastPrompt:
+        return get_prompt(self._platform, stage)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_stage_names(self._platform))
+
+    def __len__(self) -> int:
+        return len(_stage_names(self._platform))
+
+
+class PromptRef:
+    """Reference to a platform stage prompt, resolved when stages are built."""
+
+    __slots__ = ("platform", "stage")
+
+    def __init__(self, platform: str, stage: str) -> None:
+        """Initialize reference.
+
+        Args:
+            platform: Platform name
+            stage: Stage name
+        """
+        self.platform = platform
+        self.stage = stage
+
+    def resolve(self, structured: bool = False) -> FastPrompt:
+        """Return the referenced prompt template.
+
+        Args:
+            structured: Resolve the variant without the JSON schema
+
+        Returns:
+            Shared prompt template
+        """
+        return get_prompt(self.platform, self.stage, structured)
+
+    def __repr__(self) -> str:
+        return f"PromptRef({self.platform!r}, {self.stage!r})"
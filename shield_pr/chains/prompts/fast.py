@@ -0,0 +1,93 @@
+"""Minimal prompt template formatted with a single ``%`` substitution."""
+
+from string import Formatter
+from typing import Any, Tuple
+
+
+class FastPrompt:
+    """Prompt template for plain ``{var}`` substitution.
+
+    The f-string style template is converted once into a ``%(var)s``
+    format string, so format() is a single C-level ``%`` operation with no
+    template parsing, validation or partial-variable merging per call.
+    """
+
+    __slots__ = ("template", "input_variables", "system", "_compiled", "_human")
+
+    def __init__(self, template: str) -> None:
+        """Initialize prompt.
+
+        Args:
+            template: f-string style template using only ``{name}``
+                placeholders and ``{{``/``}}`` escapes
+
+        Raises:
+            ValueError: If a placeholder uses format specs, conversions or
+                attribute/index access
+        """
+        variables = set()
+        parts = []
+        prefix_len = -1
+        for literal, field, spec, conversion in Formatter().parse(template):
+            parts.append(literal.replace("%", "%%"))
+            if field is None:
+                continue
+            if spec or conversion or not field.isidentifier():
+                raise ValueError(f"Unsupported placeholder in prompt template: {{{field}}}")
+            if prefix_len < 0:
+                prefix_len = sum(len(part) for part in parts)
+            parts.append(f"%({field})s")
+            variables.add(field)
+
+        self.template = template
+        self.input_variables: Tuple[str, ...] = tuple(sorted(variables))
+        self._compiled = "".join(parts)
+
+        # The static instructions up to the last blank line before the first
+        # variable form the system message; the per-call inputs follow.
+        cut = self._compiled.rfind("\n\n", 0, max(prefix_len, 0))
+        self.system = self._compiled[:cut].replace("%%", "%") if cut > 0 else ""
+        self._human = self._compiled[cut + 2 :] if cut > 0 else self._compiled
+
+    @classmethod
+    def from_template(cls, template: str) -> "FastPrompt":
+        """Create a prompt, inferring input variables from the template.
+
+        Args:
+            template: f-string style template text
+
+        Returns:
+            FastPrompt for the template
+        """
+        return cls(template)
+
+    def format(self, **kwargs: Any) -> str:
+        """Substitute input variables into the template.
+
+        Args:
+            **kwargs: Input variable values; extra keys are ignored
+
+        Returns:
+            Formatted prompt text
+
+        Raises:
+            KeyError: If an input variable is missing
+        """
+        return self._compiled % kwargs
+
+    def format_human(self, **kwargs: Any) -> str:
+        """Format only the per-call part that follows the system text.
+
+        Args:
+            **kwargs: Input variable values; extra keys are ignored
+
+        Returns:
+            Human message text (the full prompt if there is no system text)
+
+        Raises:
+            KeyError: If an input variable is missing
+        """
+        return self._human % kwargs
+
+    def __repr__(self) -> str:
+        return f"FastPrompt(input_variables={list(self.input_variables)!r})"
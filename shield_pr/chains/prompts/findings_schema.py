@@ -0,0 +1,93 @@
+"""Shared JSON output schema appended to every review prompt."""
+
+from typing import Iterable
+
+# One finding object; {categories} is filled per stage when the prompt is built
+_FINDING = (
+    '{{"severity": "HIGH|MEDIUM|LOW", "category": "{categories}", '
+    '"file_path": "<reviewed file path>", "line_number": <int or null>, '
+    '"description": "<detailed description>", "suggestion": "<actionable suggestion>", '
+    '"code_snippet": "<relevant code or null>"}}'
+)
+
+# Output discipline shared by every schema; fences and prose cost a
+# fallback scan in the parser and are the usual cause of malformed output
+_STRICT = "Respond with ONLY the JSON, no markdown fences, no prose."
+
+# Template fragment: {categories} is filled per stage when the prompt is
+# built. It holds no input variables, so it stays in the static prompt prefix.
+# Findings are requested as JSON Lines so each one can be parsed as soon as
+# its line is streamed.
+FINDINGS_SCHEMA = (
+    "Emit ONE finding per line as a JSON object, with no array wrapper:\n"
+    + _FINDING
+    + '\nAfter the last finding emit {{"done": true}}. '
+    'If no issues found, emit only {{"done": true}}.\n'
+    + _STRICT
+)
+
+
+def render_findings_schema(categories: str) -> str:
+    """Fill the schema's category list for one stage.
+
+    Args:
+        categories: Allowed categories, separated by "|"
+
+    Returns:
+        Schema template fragment for the stage
+    """
+    return FINDINGS_SCHEMA.replace("{categories}", categories)
+
+
+def render_structured_hint(categories: str) -> str:
+    """Replace the schema for a stage whose JSON shape the provider enforces.
+
+    Only the per-stage category list is left for the prompt to state.
+
+    Args:
+        categories: Allowed categories, separated by "|"
+
+    Returns:
+        Template fragment naming the stage's categories
+    """
+    return f"Categories: {categories}"
+
+
+def render_combined_schema(stages: Iterable[str]) -> str:
+    """Build the schema for a fused prompt with one findings array per stage.
+
+    Args:
+        stages: Stage names, in section order
+
+    Returns:
+        Schema template fragment keyed by stage name
+    """
+    arrays = ", ".join(f'"{stage}": [<finding>]' for stage in stages)
+    finding = _FINDING.replace("{categories}", "<one of the section's categories>")
+    return (
+        "Provide structured JSON output with one findings array per section:\n"
+        f"{{{{{arrays}}}}}\n"
+        f"Each <finding> is: {finding}\n"
+        "Use an empty array for a section with no issues.\n"
+        f"{_STRICT}"
+    )
+
+
+def render_batch_schema(categories: str) -> str:
+    """Build the schema for a multi-file prompt with one findings array per file.
+
+    Args:
+        categories: Allowed categories, separated by "|"
+
+    Returns:
+        Schema template fragment keyed by file path
+    """
+    finding = _FINDING.replace("{categories}", categories)
+    return (
+        "Analyze each file below independently. Provide structured JSON output "
+        "mapping every file_path to its findings array:\n"
+        '{{"<file_path>": [<finding>]}}\n'
+        f"Each <finding> is: {finding}\n"
+        "Use an empty array for a file with no issues.\n"
+        f"{_STRICT}"
+    )
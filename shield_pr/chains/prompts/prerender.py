@@ -0,0 +1,25 @@
+"""Pre-rendering of stage-invariant prompt partials."""
+
+from typing import Mapping
+
+
+def _escape_braces(text: str) -> str:
+    """Escape braces so literal text survives f-string template formatting."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def inline_partials(template: str, partials: Mapping[str, object]) -> str:
+    """Substitute static partial values into f-string template text.
+
+    Args:
+        template: f-string style template text
+        partials: Partial variable values (or zero-argument callables)
+
+    Returns:
+        Template text with the partial placeholders replaced
+    """
+    for key, value in partials.items():
+        static = value() if callable(value) else value
+        template = template.replace(f"{{{key}}}", _escape_braces(str(static)))
+    return template
+
@@ -1,30 +1,16 @@
 """Severity rating calibration guide for consistent findings."""
 
-SEVERITY_GUIDE = """
-## Severity Rating Guidelines
+from types import MappingProxyType
+from typing import Mapping
 
-**HIGH**: Security risk, data loss, production outage, crash, type error
-  Examples:
-  - SQL injection vulnerability
-  - Unhandled exception on critical path
-  - Memory leak causing app crash
-  - ANR (Application Not Responding)
-  - Data exposure or privacy violation
+# Compact form inlined into every prompt; each character is an input token
+SEVERITY_GUIDE = (
+    "Severity: HIGH=security risk, data loss, outage, crash, type error "
+    "(e.g. SQL injection, unhandled exception on critical path, ANR, data exposure); "
+    "MEDIUM=performance, maintainability, potential bug "
+    "(e.g. N+1 query, unreleased listener, missing null check, deprecated API); "
+    "LOW=style, docs, minor optimization (e.g. formatting, missing docs, small refactor)."
+)
 
-**MEDIUM**: Performance degradation, maintainability issue, potential bug
-  Examples:
-  - N+1 query pattern
-  - Unclear variable naming
-  - Listener not released properly
-  - Inefficient algorithm
-  - Missing null checks
-  - Deprecated API usage
-
-**LOW**: Code style, documentation, optimization opportunity
-  Examples:
-  - Inconsistent code formatting
-  - Missing documentation
-  - Suboptimal but working code
-  - Minor refactoring suggestions
-  - TODO comments without context
-"""
+# Static partials inlined into every prompt template; read-only and shared
+PROMPT_PARTIALS: Mapping[str, str] = MappingProxyType({"severity_guide": SEVERITY_GUIDE})
@@ -2,9 +2,13 @@
 
 from typing import List, Dict, Any
 import json
-from langchain.output_parsers import PydanticOutputParser  # type: ignore
+import re
+from collections import Counter
 from shield_pr.models.finding import Finding
 
+# Opening bracket of the first JSON array or object in the text
+_JSON_START = re.compile(r"[\[{]")
+
 
 class ResultParser:
     """Parses LLM outputs into structured Finding objects.
@@ -17,6 +21,9 @@ class ResultParser:
 
     def __init__(self) -> None:
         """Initialize parser with Pydantic output parser."""
+        # Deferred: langchain is slow to import and only needed here
+        from langchain.output_parsers import PydanticOutputParser  # type: ignore
+
         self.parser = PydanticOutputParser(pydantic_object=Finding)
 
     def extract_findings(
@@ -38,30 +45,49 @@ class ResultParser:
             if not key.endswith("_result"):
                 continue
 
-            try:
-                # Tier 1: Try Pydantic parser first
-                parsed = self.parser.parse(value)
-                if isinstance(parsed, Finding):
-                    findings.append(parsed)
-            except Exception:
-                # Tier 2: Fallback to manual JSON extraction
+            # Tier 1: Pydantic parser, only for output that starts like JSON;
+            # anything else would just raise
+            stripped = value.lstrip() if isinstance(value, str) else ""
+            if stripped[:1] in ("{", "["):
                 try:
-                    findings.extend(self._manual_json_extract(value, file_path))
+                    parsed = self.parser.parse(value)
+                    if isinstance(parsed, Finding):
+                        findings.append(parsed)
+                    continue
                 except Exception:
-                    # Tier 3: Create generic finding from raw output
-                    if value and isinstance(value, str) and len(value) > 10:
-                        findings.append(
-                            Finding(
-                                severity="LOW",
-                                category="analysis",
-                                file_path=file_path,
-                                description=value[:500],
-                                suggestion="Manual review recommended",
-                            )
-                        )
+                    pass
+
+            findings.extend(self._fallback_findings(value, file_path))
 
         return findings
 
+    def _fallback_findings(self, value: Any, file_path: str) -> List[Finding]:
+        """Extract findings from output the Pydantic parser could not handle.
+
+        Args:
+            value: Stage output
+            file_path: Path to the reviewed file
+
+        Returns:
+            List of Finding objects
+        """
+        try:
+            # Tier 2: Manual JSON extraction
+            return self._manual_json_extract(value, file_path)
+        except Exception:
+            # Tier 3: Create generic finding from raw output
+            if value and isinstance(value, str) and len(value) > 10:
+                return [
+                    Finding(
+                        severity="LOW",
+                        category="analysis",
+                        file_path=file_path,
+                        description=value[:500],
+                        suggestion="Manual review recommended",
+                    )
+                ]
+            return []
+
     def _manual_json_extract(self, text: str, file_path: str) -> List[Finding]:
         """Manually extract findings from JSON text.
 
@@ -75,11 +101,10 @@ class ResultParser:
         findings = []
 
         try:
-            # Try to find JSON array or object in text
-            start = text.find("[")
-            if start == -1:
-                start = text.find("{")
-            if start != -1:
+            # Find the first JSON array or object in text in one scan
+            match = _JSON_START.search(text)
+            if match is not None:
+                start = match.start()
                 end = text.rfind("]" if text[start] == "[" else "}")
                 if end != -1:
                     json_str = text[start : end + 1]
@@ -107,9 +132,8 @@ class ResultParser:
         if not findings:
             return "No issues found. Code looks good!"
 
-        high = sum(1 for f in findings if f.severity == "HIGH")
-        medium = sum(1 for f in findings if f.severity == "MEDIUM")
-        low = sum(1 for f in findings if f.severity == "LOW")
+        counts = Counter(f.severity for f in findings)
+        high, medium, low = counts["HIGH"], counts["MEDIUM"], counts["LOW"]
 
         parts = []
         if high > 0:
@@ -136,9 +160,9 @@ class ResultParser:
         """
         # Base confidence on number of stages executed
         total_stages = len(depth_stages.get(depth, []))
-        executed_stages = sum(1 for key in result.keys() if key.endswith("_result"))
-
         if total_stages == 0:
             return 0.5
 
+        executed_stages = sum(1 for key in result if key.endswith("_result"))
+
         return min(0.95, executed_stages / total_stages)
@@ -1,12 +1,42 @@
 """Parse chain results into structured findings."""
 
+import asyncio
 import re
-from typing import Any, Dict, List, Literal
+from collections import Counter
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
+
+import orjson
 
 from shield_pr.models.finding import Finding
 from shield_pr.models.review_result import ReviewResult
 
 
+def _load_json_object(text: str) -> Any:
+    """Decode an LLM response holding one JSON object.
+
+    Strict output decodes in a single orjson call; fenced or prose-wrapped
+    output falls back to the span from the first "{" to the last "}".
+
+    Args:
+        text: Response text
+
+    Returns:
+        Decoded value, or None if no JSON object could be decoded
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    try:
+        return orjson.loads(text[start : end + 1])
+    except orjson.JSONDecodeError:
+        return None
+
+
 class ResultParser:
     """Parse LLM chain outputs into structured findings.
 
@@ -21,8 +51,30 @@ class ResultParser:
         r"maintainability|error.handling|architecture|documentation)\b",
         re.IGNORECASE,
     )
+    # A word every CATEGORY_PATTERN match contains, for a cheap pre-check
+    CATEGORY_HINTS = frozenset(
+        {
+            "security",
+            "performance",
+            "bug",
+            "practice",
+            "smell",
+            "maintainability",
+            "error",
+            "architecture",
+            "documentation",
+        }
+    )
     LINE_NUMBER_PATTERN = re.compile(r"line\s+(\d+)", re.IGNORECASE)
     CODE_SNIPPET_PATTERN = re.compile(r"```[\w]*\n(.*?)```", re.DOTALL)
+    # Bullets (-, •, *) and numbered items, each starting a new line
+    SEGMENT_SPLIT_RE = re.compile(r"\n\s*(?:-|\d+\.|•|\*)\s+")
+    SUGGESTION_PREFIX_RE = re.compile(
+        r"(?:Suggestion|Recommendation|Fix|Solution):.*", re.IGNORECASE | re.DOTALL
+    )
+    SUGGESTION_CAPTURE_RE = re.compile(
+        r"(?:Suggestion|Recommendation|Fix|Solution):\s*(.*?)(?:\n|$)", re.IGNORECASE
+    )
 
     def extract_findings(self, result: Dict[str, Any], file_path: str) -> List[Finding]:
         """Extract findings from chain execution results.
@@ -63,6 +115,127 @@ class ResultParser:
 
         return findings
 
+    async def aextract_findings_stream(
+        self, queue: "asyncio.Queue[Optional[str]]", stage_name: str, file_path: str
+    ) -> AsyncIterator[Finding]:
+        """Yield findings from streamed stage output as each one completes.
+
+        Consumes text chunks from the queue until a None sentinel. Every JSON
+        object carrying a "description" is emitted as soon as its closing
+        brace arrives, which covers both the JSON Lines output the prompts
+        request and a {"findings": [...]} wrapper; if the stream holds no
+        such objects, the full text is parsed with the regular segment
+        parser at the end.
+
+        Args:
+            queue: Queue of text chunks terminated by None
+            stage_name: Name of the stage (e.g., "security_result")
+            file_path: Path to the reviewed file
+
+        Yields:
+            Finding objects in stream order
+        """
+        parts: List[str] = []
+        # Unconsumed text, starting at the outermost open brace; offsets in
+        # open_braces and pos are relative to it, so each chunk is scanned once
+        pending = ""
+        pos = 0
+        open_braces: List[int] = []
+        in_string = False
+        escaped = False
+        emitted = False
+
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            parts.append(chunk)
+            pending += chunk
+
+            while pos < len(pending):
+                char = pending[pos]
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif char == "\\":
+                        escaped = True
+                    elif char == '"':
+                        in_string = False
+                elif char == '"':
+                    in_string = True
+                elif char == "{":
+                    open_braces.append(pos)
+                elif char == "}" and open_braces:
+                    start = open_braces.pop()
+                    finding = self._finding_from_json(
+                        pending[start : pos + 1], stage_name, file_path
+                    )
+                    if finding is not None:
+                        emitted = True
+                        yield finding
+                pos += 1
+
+            if not open_braces:
+                pending, pos = "", 0
+            elif open_braces[0]:
+                shift = open_braces[0]
+                pending, pos = pending[shift:], pos - shift
+                open_braces = [offset - shift for offset in open_braces]
+
+        if not emitted:
+            for finding in self._parse_stage_output("".join(parts), stage_name, file_path):
+                yield finding
+
+    def _finding_from_json(
+        self, candidate: str, stage_name: str, file_path: str
+    ) -> Finding | None:
+        """Build a Finding from a JSON object string, if it describes one.
+
+        Args:
+            candidate: Text of a complete JSON object
+            stage_name: Name of the source stage
+            file_path: Path to the reviewed file
+
+        Returns:
+            Finding object or None if the object is not a valid finding
+        """
+        try:
+            data = orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            return None
+        return self._finding_from_data(data, stage_name, file_path)
+
+    def _finding_from_data(
+        self, data: Any, stage_name: str, file_path: str
+    ) -> Finding | None:
+        """Build a Finding from a decoded JSON object, if it describes one.
+
+        Args:
+            data: Decoded JSON value
+            stage_name: Name of the source stage
+            file_path: Path to the reviewed file
+
+        Returns:
+            Finding object or None if the object is not a valid finding
+        """
+        if not isinstance(data, dict) or not data.get("description"):
+            return None
+
+        severity = str(data.get("severity", "LOW")).upper()
+        line_number = data.get("line_number")
+        try:
+            return Finding(
+                severity=severity if severity in ("HIGH", "MEDIUM", "LOW") else "LOW",
+                category=str(data.get("category") or self._extract_category("", stage_name)),
+                file_path=file_path,
+                line_number=line_number if isinstance(line_number, int) else None,
+                description=str(data["description"]),
+                suggestion=data.get("suggestion"),
+                code_snippet=data.get("code_snippet"),
+            )
+        except ValueError:
+            return None
+
     def _parse_stage_output(self, text: str, stage_name: str, file_path: str) -> List[Finding]:
         """Parse findings from a single stage output.
 
@@ -74,6 +247,12 @@ class ResultParser:
         Returns:
             List of Finding objects from this stage
         """
+        json_findings = self._parse_json_output(text, stage_name, file_path)
+        if json_findings is None:
+            json_findings = self._parse_json_lines(text, stage_name, file_path)
+        if json_findings is not None:
+            return json_findings
+
         findings: List[Finding] = []
 
         # Split by common delimiters to find individual findings
@@ -87,6 +266,109 @@ class ResultParser:
 
         return findings
 
+    def _parse_json_output(
+        self, text: str, stage_name: str, file_path: str
+    ) -> List[Finding] | None:
+        """Decode the structured {"findings": [...]} output the prompts request.
+
+        Args:
+            text: Stage output text, possibly wrapped in prose or code fences
+            stage_name: Name of the stage (e.g., "security_result")
+            file_path: Path to the reviewed file
+
+        Returns:
+            List of Finding objects, or None if the text holds no findings JSON
+        """
+        data = _load_json_object(text)
+        if not isinstance(data, dict) or not isinstance(data.get("findings"), list):
+            return None
+
+        findings: List[Finding] = []
+        for item in data["findings"]:
+            finding = self._finding_from_data(item, stage_name, file_path)
+            if finding is not None:
+                findings.append(finding)
+        return findings
+
+    def _parse_json_lines(
+        self, text: str, stage_name: str, file_path: str
+    ) -> List[Finding] | None:
+        """Decode JSON Lines output: one finding object per line, then {"done": true}.
+
+        Args:
+            text: Stage output text, possibly wrapped in prose or code fences
+            stage_name: Name of the stage (e.g., "security_result")
+            file_path: Path to the reviewed file
+
+        Returns:
+            List of Finding objects, or None if no line holds a JSON object
+        """
+        findings: List[Finding] = []
+        decoded = False
+        for line in text.splitlines():
+            line = line.strip()
+            if not line.startswith("{"):
+                continue
+            try:
+                data = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            decoded = True
+            if isinstance(data, dict) and data.get("done") is True:
+                break
+            finding = self._finding_from_data(data, stage_name, file_path)
+            if finding is not None:
+                findings.append(finding)
+        return findings if decoded else None
+
+    def split_combined_output(self, text: str, stage_names: List[str]) -> Dict[str, str]:
+        """Distribute a fused prompt's per-stage findings arrays to stage results.
+
+        Args:
+            text: Output of a combined prompt, {"<stage>": [...], ...}
+            stage_names: Stages the prompt covered, in section order
+
+        Returns:
+            Mapping of "{stage}_result" keys to {"findings": [...]} JSON text.
+            If the output holds no JSON object, the raw text goes to the
+            first stage so the segment parser can still recover findings.
+        """
+        data = _load_json_object(text)
+        if not isinstance(data, dict):
+            return {
+                f"{name}_result": text if index == 0 else ""
+                for index, name in enumerate(stage_names)
+            }
+
+        results: Dict[str, str] = {}
+        for name in stage_names:
+            items = data.get(name)
+            findings = items if isinstance(items, list) else []
+            results[f"{name}_result"] = orjson.dumps({"findings": findings}).decode()
+        return results
+
+    def split_batch_output(self, text: str, file_paths: List[str]) -> Optional[Dict[str, str]]:
+        """Demultiplex a multi-file prompt's output into per-file stage results.
+
+        Args:
+            text: Output of a batch prompt, {"<file_path>": [...], ...}
+            file_paths: Files the prompt covered
+
+        Returns:
+            Mapping of file paths to {"findings": [...]} JSON text, or None
+            if the output holds no JSON object
+        """
+        data = _load_json_object(text)
+        if not isinstance(data, dict):
+            return None
+
+        results: Dict[str, str] = {}
+        for path in file_paths:
+            items = data.get(path)
+            findings = items if isinstance(items, list) else []
+            results[path] = orjson.dumps({"findings": findings}).decode()
+        return results
+
     def _split_into_segments(self, text: str) -> List[str]:
         """Split text into potential finding segments.
 
@@ -96,27 +378,7 @@ class ResultParser:
         Returns:
             List of text segments, each potentially containing a finding
         """
-        segments: List[str] = []
-
-        # Try various delimiters
-        delimiters = [
-            r"\n\s*-\s+",  # Bullet points
-            r"\n\s*\d+\.\s+",  # Numbered lists
-            r"\n\s*•\s+",  # Bullet points with •
-            r"\n\s*[*]\s+",  # Bullet points with *
-            r"(?=\b[HIGH|MEDIUM|LOW]\b)",  # Severity markers
-        ]
-
-        for delimiter in delimiters:
-            parts = re.split(delimiter, text)
-            if len(parts) > 1:
-                segments = parts
-                break
-
-        # If no delimiters found, treat whole text as one segment
-        if not segments:
-            segments = [text]
-
+        segments = self.SEGMENT_SPLIT_RE.split(text)
         return [s.strip() for s in segments if s.strip()]
 
     def _parse_finding_segment(self, segment: str, stage_name: str, file_path: str) -> Finding | None:
@@ -130,35 +392,20 @@ class ResultParser:
         Returns:
             Finding object or None if parsing fails
         """
-        # Extract severity
-        severity = self._extract_severity(segment)
-
-        # Extract category from stage name or content
-        category = self._extract_category(segment, stage_name)
-
-        # Extract line number
-        line_number = self._extract_line_number(segment)
-
-        # Extract code snippet
-        code_snippet = self._extract_code_snippet(segment)
-
-        # Extract description (main text without structured parts)
+        # Extract description (main text without structured parts); segments
+        # without one are dropped before scanning for anything else
         description = self._extract_description(segment)
-
-        # Extract suggestion
-        suggestion = self._extract_suggestion(segment)
-
         if not description:
             return None
 
         return Finding(
-            severity=severity,
-            category=category,
+            severity=self._extract_severity(segment),
+            category=self._extract_category(segment, stage_name),
             file_path=file_path,
-            line_number=line_number,
+            line_number=self._extract_line_number(segment),
             description=description,
-            suggestion=suggestion,
-            code_snippet=code_snippet,
+            suggestion=self._extract_suggestion(segment),
+            code_snippet=self._extract_code_snippet(segment),
         )
 
     def _extract_severity(self, text: str) -> Literal["HIGH", "MEDIUM", "LOW"]:
@@ -170,11 +417,15 @@ class ResultParser:
         Returns:
             Severity level (HIGH, MEDIUM, or LOW as default)
         """
+        # Substring checks are much cheaper than the regex and rule out
+        # most segments; the regex still decides word boundaries and which
+        # severity comes first
+        upper = text.upper()
+        if "HIGH" not in upper and "MEDIUM" not in upper:
+            return "LOW"
         match = self.SEVERITY_PATTERN.search(text)
         if match:
-            severity = match.group(1).upper()
-            if severity in ("HIGH", "MEDIUM", "LOW"):
-                return severity  # type: ignore[return-value]
+            return match.group(1).upper()  # type: ignore[return-value]
         return "LOW"
 
     def _extract_category(self, text: str, stage_name: str) -> str:
@@ -187,10 +438,13 @@ class ResultParser:
         Returns:
             Category name
         """
-        # Try to extract from text first
-        match = self.CATEGORY_PATTERN.search(text)
-        if match:
-            return match.group(1).replace(".", " ").lower()
+        # Try to extract from text first. For ASCII text, plain substring
+        # checks rule out most segments without running the alternation.
+        lowered = text.lower()
+        if not text.isascii() or any(hint in lowered for hint in self.CATEGORY_HINTS):
+            match = self.CATEGORY_PATTERN.search(text)
+            if match:
+                return match.group(1).replace(".", " ").lower()
 
         # Fall back to stage name
         base_name = stage_name.replace("_result", "").replace("_", " ")
@@ -222,6 +476,8 @@ class ResultParser:
         Returns:
             Code snippet or None
         """
+        if "```" not in text:
+            return None
         match = self.CODE_SNIPPET_PATTERN.search(text)
         if match:
             return match.group(1).strip()
@@ -236,19 +492,11 @@ class ResultParser:
         Returns:
             Description text
         """
-        # Remove code blocks and common prefixes
-        cleaned = self.CODE_SNIPPET_PATTERN.sub("", text)
-
-        # Remove common suggestion prefixes
-        suggestion_prefixes = [
-            r"Suggestion:.*",
-            r"Recommendation:.*",
-            r"Fix:.*",
-            r"Solution:.*",
-        ]
-
-        for prefix in suggestion_prefixes:
-            cleaned = re.sub(prefix, "", cleaned, flags=re.IGNORECASE | re.DOTALL)
+        # Remove code blocks, then everything from the first suggestion prefix
+        # on; both patterns need a marker that most segments lack
+        cleaned = self.CODE_SNIPPET_PATTERN.sub("", text) if "```" in text else text
+        if ":" in cleaned:
+            cleaned = self.SUGGESTION_PREFIX_RE.sub("", cleaned)
 
         return cleaned.strip()
 
@@ -261,20 +509,14 @@ class ResultParser:
         Returns:
             Suggestion text or None
         """
-        # Look for suggestion patterns
-        patterns = [
-            r"Suggestion:\s*(.*?)(?:\n|$)",
-            r"Recommendation:\s*(.*?)(?:\n|$)",
-            r"Fix:\s*(.*?)(?:\n|$)",
-            r"Solution:\s*(.*?)(?:\n|$)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                suggestion = match.group(1).strip()
-                if suggestion and len(suggestion) > 5:
-                    return suggestion
+        if ":" not in text:
+            return None
+
+        # First suggestion-style line with real content
+        for match in self.SUGGESTION_CAPTURE_RE.finditer(text):
+            suggestion = match.group(1).strip()
+            if len(suggestion) > 5:
+                return suggestion
 
         return None
 
@@ -290,9 +532,8 @@ class ResultParser:
         if not findings:
             return "Code review completed. No issues found."
 
-        high = sum(1 for f in findings if f.severity == "HIGH")
-        medium = sum(1 for f in findings if f.severity == "MEDIUM")
-        low = sum(1 for f in findings if f.severity == "LOW")
+        counts = Counter(f.severity for f in findings)
+        high, medium, low = counts["HIGH"], counts["MEDIUM"], counts["LOW"]
 
         parts = []
         if high > 0:
@@ -320,13 +561,13 @@ class ResultParser:
             Confidence score between 0.0 and 1.0
         """
         expected_stages = depth_stages.get(depth, depth_stages["standard"])
-        completed_stages = sum(
-            1 for name in result.keys() if name.endswith("_result") and result.get(name)
-        )
-
         if not expected_stages:
             return 0.5
 
+        completed_stages = sum(
+            1 for name, output in result.items() if output and name.endswith("_result")
+        )
+
         # Base confidence on stage completion
         stage_ratio = completed_stages / len(expected_stages) if expected_stages else 0.5
 
@@ -1,10 +1,18 @@
 """Synthesis chain for aggregating and prioritizing findings."""
 
-from typing import List
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
 from difflib import SequenceMatcher
 from shield_pr.models.finding import Finding
 from shield_pr.models.review_result import ReviewResult
 
+try:
+    # Optional C implementation of the Indel similarity, an upper bound on
+    # SequenceMatcher.ratio()
+    from rapidfuzz.fuzz import ratio as _indel_ratio
+except ImportError:  # pragma: no cover - rapidfuzz is an optional extra
+    _indel_ratio = None
+
 
 class SynthesisChain:
     """Aggregates platform + universal findings, prioritizes, deduplicates.
@@ -65,36 +73,77 @@ class SynthesisChain:
             return []
 
         deduplicated: List[Finding] = []
-        seen: List[Finding] = []
+        # Duplicates share category and file, so only findings in the same
+        # (category, file_path) bucket need to be compared. Buckets hold
+        # indices into deduplicated so replacements need no list search.
+        buckets: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        # Normalized description of each kept finding, computed once
+        normalized: List[str] = []
+        # Index of a kept finding per normalized description; may go stale
+        # when a finding is replaced, so hits are re-checked before use
+        exact: Dict[Tuple[str, str, str], int] = {}
+        # One matcher per kept finding: SequenceMatcher indexes its second
+        # sequence once and reuses that index for every comparison
+        matchers: Dict[int, SequenceMatcher] = {}
 
         for finding in findings:
-            # Check if this finding is similar to any we've seen
-            is_duplicate = False
-            for seen_finding in seen:
-                if self._are_similar(finding, seen_finding):
-                    is_duplicate = True
-                    # Keep the higher severity one
-                    if self.SEVERITY_ORDER[finding.severity] < self.SEVERITY_ORDER[
-                        seen_finding.severity
-                    ]:
-                        # Replace with higher severity
-                        idx = deduplicated.index(seen_finding)
-                        deduplicated[idx] = finding
-                        seen[seen.index(seen_finding)] = finding
+            key = (finding.category, finding.file_path)
+            norm = self._normalize(finding.description)
+            exact_key = (*key, norm)
+            # A matching normalized description is always similar, so only
+            # earlier entries need the fuzzy check
+            match = exact.get(exact_key)
+            if match is not None and normalized[match] != norm:
+                match = None
+
+            for i in buckets[key]:
+                if match is not None and i >= match:
+                    break
+                matcher = matchers.get(i)
+                if matcher is None:
+                    matcher = matchers[i] = SequenceMatcher(
+                        None, "", deduplicated[i].description
+                    )
+                if self._are_similar(finding, deduplicated[i], matcher, (norm, normalized[i])):
+                    match = i
                     break
 
-            if not is_duplicate:
+            if match is None:
+                match = len(deduplicated)
+                buckets[key].append(match)
                 deduplicated.append(finding)
-                seen.append(finding)
+                normalized.append(norm)
+            elif self.SEVERITY_ORDER[finding.severity] < self.SEVERITY_ORDER[
+                deduplicated[match].severity
+            ]:
+                # Keep the higher severity one
+                deduplicated[match] = finding
+                normalized[match] = norm
+                matchers.pop(match, None)
+            else:
+                continue
+
+            known = exact.get(exact_key)
+            if known is None or normalized[known] != norm:
+                exact[exact_key] = match
 
         return deduplicated
 
-    def _are_similar(self, finding1: Finding, finding2: Finding) -> bool:
+    def _are_similar(
+        self,
+        finding1: Finding,
+        finding2: Finding,
+        matcher: Optional[SequenceMatcher] = None,
+        normalized: Optional[Tuple[str, str]] = None,
+    ) -> bool:
         """Check if two findings are similar enough to be considered duplicates.
 
         Args:
             finding1: First finding
             finding2: Second finding
+            matcher: Optional SequenceMatcher already holding finding2's
+                description as its second sequence
+            normalized: Optional precomputed _normalize() of both descriptions
 
         Returns:
             True if findings are similar
@@ -106,20 +155,64 @@ class SynthesisChain:
         if finding1.file_path != finding2.file_path:
             return False
 
-        # Similar descriptions (>0.8 similarity)
-        desc_similarity = SequenceMatcher(
-            None, finding1.description, finding2.description
-        ).ratio()
-
-        if desc_similarity > 0.8:
-            return True
-
-        # Similar line numbers (within 5 lines)
+        # Similar line numbers (within 5 lines); checked first since it is
+        # far cheaper than comparing descriptions
         if finding1.line_number and finding2.line_number:
             if abs(finding1.line_number - finding2.line_number) <= 5:
                 return True
 
-        return False
+        # Same description up to case and whitespace
+        if normalized is None:
+            normalized = (
+                self._normalize(finding1.description),
+                self._normalize(finding2.description),
+            )
+        if normalized[0] == normalized[1]:
+            return True
+
+        # Similar descriptions (>0.8 similarity)
+        return self._similar_descriptions(finding1.description, finding2.description, matcher)
+
+    @staticmethod
+    def _normalize(description: str) -> str:
+        """Lowercase a description and collapse its whitespace."""
+        return " ".join(description.lower().split())
+
+    @staticmethod
+    def _similar_descriptions(
+        desc1: str, desc2: str, matcher: Optional[SequenceMatcher] = None
+    ) -> bool:
+        """Check whether two descriptions have a similarity ratio above 0.8.
+
+        Cheap upper bounds on the ratio reject most pairs before the full
+        Ratcliff/Obershelp comparison runs; the result is the same as
+        comparing ratio() directly.
+
+        Args:
+            desc1: First description
+            desc2: Second description
+            matcher: Optional SequenceMatcher holding desc2 as its second sequence
+
+        Returns:
+            True if the descriptions are similar
+        """
+        shorter, longer = sorted((len(desc1), len(desc2)))
+        if not longer:
+            return True
+        # ratio = 2M / (len1 + len2) with M <= shorter, so it can only
+        # exceed 0.8 when 3 * shorter > 2 * longer
+        if 3 * shorter <= 2 * longer:
+            return False
+        # Indel similarity is 2 * LCS / (len1 + len2) and SequenceMatcher's
+        # matching blocks never exceed the LCS, so it bounds ratio from above
+        if _indel_ratio is not None and _indel_ratio(desc1, desc2) <= 80:
+            return False
+
+        if matcher is None:
+            matcher = SequenceMatcher(None, desc1, desc2)
+        else:
+            matcher.set_seq1(desc1)
+        return matcher.quick_ratio() > 0.8 and matcher.ratio() > 0.8
 
     def _prioritize(self, findings: List[Finding]) -> List[Finding]:
         """Prioritize findings by severity, then category.
@@ -148,15 +241,13 @@ class SynthesisChain:
         if not findings:
             return f"{platform.capitalize()} code review: No issues found. Code looks good!"
 
-        # Count by severity
-        high = sum(1 for f in findings if f.severity == "HIGH")
-        medium = sum(1 for f in findings if f.severity == "MEDIUM")
-        low = sum(1 for f in findings if f.severity == "LOW")
-
-        # Count by category
-        categories: dict[str, int] = {}
+        # Count by severity and category in one pass
+        severities: Counter[str] = Counter()
+        categories: Counter[str] = Counter()
         for finding in findings:
-            categories[finding.category] = categories.get(finding.category, 0) + 1
+            severities[finding.severity] += 1
+            categories[finding.category] += 1
+        high, medium, low = severities["HIGH"], severities["MEDIUM"], severities["LOW"]
 
         # Build summary
         summary_parts = [f"{platform.capitalize()} code review:"]
@@ -4,8 +4,9 @@ Provides main command group with global options and subcommands
 for review operations, initialization, and platform management.
 """
 
+import importlib
 import sys
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
 from rich.console import Console
@@ -26,8 +27,76 @@ class CLIContext:
 
 pass_context = click.make_pass_decorator(CLIContext, ensure=True)
 
-
-@click.group()
+# Subcommand name -> ("module:attribute", short help); review commands pull
+# in the LLM stack, so they are imported only when invoked, and the short
+# help lets --help list them without importing anything
+_LAZY_COMMANDS = {
+    "init": (
+        "shield_pr.commands.base_commands:init",
+        "Initialize configuration file with interactive prompts.",
+    ),
+    "platforms": (
+        "shield_pr.commands.base_commands:platforms",
+        "List supported platforms and their detection patterns.",
+    ),
+    "version": ("shield_pr.commands.base_commands:version", "Show version information."),
+    "review": ("shield_pr.commands.review_command:review", "Review code files with AI analysis."),
+    "review-diff": ("shield_pr.commands.review_diff:review_diff", "Review git changes."),
+    "pr": ("shield_pr.commands.review_pr:review_pr", "Review pull request changes."),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use."""
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Optional[Dict[str, Tuple[str, str]]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize group.
+
+        Args:
+            *args: Positional arguments for click.Group
+            lazy_commands: Subcommand name -> ("module:attribute", short help)
+            **kwargs: Keyword arguments for click.Group
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eager and lazy subcommand names."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Return a subcommand, importing and registering it if needed."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attribute = self.lazy_commands[cmd_name][0].split(":")
+            command = getattr(importlib.import_module(module_name), attribute)
+            if not isinstance(command, click.Command):
+                command = click.command(cmd_name)(command)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List subcommands in help, using stored short help for unloaded ones."""
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            command = self.commands.get(name) or click.Command(
+                name, help=self.lazy_commands[name][1]
+            )
+            if not command.hidden:
+                rows.append((name, command.get_short_help_str(limit)))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup, lazy_commands=_LAZY_COMMANDS)
 @click.option(
     "--config",
     "-c",
@@ -68,22 +137,6 @@ def main(ctx: click.Context, config: Optional[str], debug: bool) -> None:
                 sys.exit(1)
 
 
-# Register commands
-from shield_pr.commands.base_commands import init as init_fn, platforms, version
-from shield_pr.commands.review_command import review
-
-main.command("init")(init_fn)
-main.command("platforms")(platforms)
-main.command("version")(version)
-main.command("review")(review)
-
-from shield_pr.commands.review_diff import review_diff
-from shield_pr.commands.review_pr import review_pr
-
-main.add_command(review_diff)
-main.add_command(review_pr)
-
-
 if __name__ == "__main__":
     try:
         main()
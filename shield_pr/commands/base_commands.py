@@ -5,10 +5,20 @@ Base CLI commands - init, version, platforms.
 import click
 from rich.console import Console
 
+# Fallback for calls outside the CLI; building a Console probes the terminal
+_CONSOLE = Console()
+
+
+def _console() -> Console:
+    """Return the CLI context's console, or the shared module console."""
+    ctx = click.get_current_context(silent=True)
+    console = getattr(ctx.obj, "console", None) if ctx is not None else None
+    return console if isinstance(console, Console) else _CONSOLE
+
 
 def init() -> None:
     """Initialize configuration file with interactive prompts."""
-    console = Console()
+    console = _console()
     console.print("[bold cyan]Code Review Assistant - Configuration Setup[/bold cyan]")
     console.print()
 
@@ -23,7 +33,7 @@ def init() -> None:
 
 def platforms() -> None:
     """List supported platforms and their detection patterns."""
-    console = Console()
+    console = _console()
     console.print("[bold cyan]Supported Platforms[/bold cyan]")
     console.print()
 
@@ -43,7 +53,7 @@ def platforms() -> None:
 
 def version() -> None:
     """Show version information."""
-    console = Console()
+    console = _console()
     console.print("[bold cyan]Code Review Assistant[/bold cyan]")
     console.print("Version: 0.1.0")
     console.print("LangChain + Gemini 1.5 Pro")
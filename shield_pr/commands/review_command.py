@@ -3,13 +3,14 @@ Main review command.
 """
 
 import sys
-from typing import Optional
+from contextlib import nullcontext
+from typing import Any, ContextManager, Optional
 
 import click
 
 from shield_pr.formatters import get_formatter
-from shield_pr.formatters.rich_renderer import RichRenderer
 from shield_pr.core.review_pipeline import ReviewPipeline
+from shield_pr.utils.file_writer import write_text_atomic
 from shield_pr.utils.logger import logger
 
 
@@ -70,24 +71,33 @@ def review(
     try:
         # Create pipeline and review
         pipeline = ReviewPipeline(cli_ctx.config)
-        result = pipeline.review_files(
-            list(files),
-            platform_override=platform_override,
-            depth=depth,
-        )
+        # Findings are counted live only when the result is rendered here
+        interactive = not output and format != "json" and sys.stdout.isatty()
+        progress: ContextManager[Any] = nullcontext()
+        if interactive:
+            from shield_pr.formatters.rich_renderer import RichRenderer
+
+            renderer = RichRenderer(cli_ctx.console)
+            progress = renderer.finding_progress()
+        with progress as on_finding:
+            result = pipeline.review_files(
+                list(files),
+                platform_override=platform_override,
+                depth=depth,
+                on_finding=on_finding,
+            )
 
         # Format and output
         formatter = get_formatter(format)
         output_text = formatter.format(result)
 
         if output:
-            with open(output, "w") as f:
-                f.write(output_text)
+            write_text_atomic(output, output_text)
             cli_ctx.console.print(f"[green]Results written to {output}[/green]")
-        elif format == "json" or not sys.stdout.isatty():
+        elif not interactive:
             click.echo(output_text)
         else:
-            RichRenderer(cli_ctx.console).render(result)
+            renderer.render(result)
 
     except Exception as e:
         logger.error(f"Review failed: {e}")
@@ -3,16 +3,17 @@ Review diff command for staged changes.
 """
 
 import sys
-from typing import Optional
+from contextlib import nullcontext
+from typing import Any, ContextManager, Optional
 
 import click
 
 from shield_pr.formatters import get_formatter
-from shield_pr.formatters.rich_renderer import RichRenderer
 from shield_pr.git.repository import GitRepository
 from shield_pr.git.filters import DiffFilter
 from shield_pr.core.errors import GitOperationError
 from shield_pr.core.review_pipeline import ReviewPipeline
+from shield_pr.utils.file_writer import write_text_atomic
 from shield_pr.utils.logger import logger
 
 
@@ -115,13 +116,11 @@ def review_diff(
             click.echo(click.style("No files to review after filtering.", fg="yellow"))
             return
 
-        click.echo(f"Found {len(filtered_paths)} files to review:\n")
-        for path in filtered_paths:
-            file_change = files[path]
-            change_type = _format_change_type(file_change.change_type)
-            click.echo(f"  {change_type} {path}")
-
-        click.echo()
+        # One write for the whole listing rather than one per file
+        listing = "\n".join(
+            f"  {_format_change_type(files[path].change_type)} {path}" for path in filtered_paths
+        )
+        click.echo(f"Found {len(filtered_paths)} files to review:\n\n{listing}\n")
 
         # Prepare patches for review
         file_patches = {}
@@ -141,24 +140,33 @@ def review_diff(
 
         # Create pipeline and review
         pipeline = ReviewPipeline(cli_ctx.config)
-        result = pipeline.review_diff(
-            file_patches,
-            platform_override=platform_override,
-            depth=depth,
-        )
+        # Findings are counted live only when the result is rendered here
+        interactive = not output and format != "json" and sys.stdout.isatty()
+        progress: ContextManager[Any] = nullcontext()
+        if interactive:
+            from shield_pr.formatters.rich_renderer import RichRenderer
+
+            renderer = RichRenderer(cli_ctx.console)
+            progress = renderer.finding_progress()
+        with progress as on_finding:
+            result = pipeline.review_diff(
+                file_patches,
+                platform_override=platform_override,
+                depth=depth,
+                on_finding=on_finding,
+            )
 
         # Format and output
         formatter = get_formatter(format)
         output_text = formatter.format(result)
 
         if output:
-            with open(output, "w") as f:
-                f.write(output_text)
+            write_text_atomic(output, output_text)
             cli_ctx.console.print(f"[green]Results written to {output}[/green]")
-        elif format == "json" or not sys.stdout.isatty():
+        elif not interactive:
             click.echo(output_text)
         else:
-            RichRenderer(cli_ctx.console).render(result)
+            renderer.render(result)
 
     except GitOperationError as e:
         click.echo(click.style(f"Git error: {e}", fg="red"), err=True)
@@ -170,12 +178,15 @@ def review_diff(
         sys.exit(1)
 
 
+# Styled once at import; click.style is a pure string transform
+_CHANGE_TYPE_LABELS = {
+    'A': click.style('A', fg='green'),    # Added
+    'M': click.style('M', fg='yellow'),   # Modified
+    'D': click.style('D', fg='red'),      # Deleted
+    'R': click.style('R', fg='blue'),     # Renamed
+}
+
+
 def _format_change_type(change_type: str) -> str:
-    """Format change type with emoji."""
-    types = {
-        'A': click.style('A', fg='green'),    # Added
-        'M': click.style('M', fg='yellow'),   # Modified
-        'D': click.style('D', fg='red'),      # Deleted
-        'R': click.style('R', fg='blue'),     # Renamed
-    }
-    return types.get(change_type, change_type)
+    """Format change type with color."""
+    return _CHANGE_TYPE_LABELS.get(change_type, change_type)
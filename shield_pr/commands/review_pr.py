@@ -7,9 +7,54 @@ from pathlib import Path
 
 from shield_pr.git.repository import GitRepository
 from shield_pr.git.pr_fetcher import PRFetcher
+from shield_pr.git.pr_cache import PRDiffCache
 from shield_pr.git.filters import DiffFilter
 from shield_pr.git.diff_parser import DiffParser
 from shield_pr.core.errors import GitOperationError, APIError, ValidationError
+from shield_pr.config.defaults import DEFAULT_PR_CACHE_DIR
+from shield_pr.config.models import ReviewConfig
+
+
+def _parse_count(value: str | int | None) -> int:
+    """
+    Parse a change count from PR metadata.
+
+    GitLab reports changes_count as a string, capped as "1000+" on large
+    merge requests; a capped count parses as one more than the cap.
+
+    Args:
+        value: Count as reported by the API.
+
+    Returns:
+        The count, or 0 if it cannot be parsed.
+    """
+    if isinstance(value, int):
+        return value
+    text = str(value or '').strip()
+    capped = text.endswith('+')
+    try:
+        count = int(text.rstrip('+'))
+    except ValueError:
+        return 0
+    return count + 1 if capped else count
+
+
+def _exceeds_pr_limits(info: dict[str, str | int], review_config: ReviewConfig) -> bool:
+    """
+    Check PR metadata against the configured size limits.
+
+    Args:
+        info: PR info from PRFetcher.get_pr_info (may be empty).
+        review_config: Review configuration with the limits.
+
+    Returns:
+        True if the PR has too many changed files or lines.
+    """
+    changed_lines = _parse_count(info.get('additions')) + _parse_count(info.get('deletions'))
+    return (
+        _parse_count(info.get('changed_files')) > review_config.max_files_per_pr
+        or changed_lines > review_config.max_lines_per_pr
+    )
 
 
 @click.command('pr')
@@ -56,9 +101,10 @@ def review_pr(
             click.echo(f"Fetching PR: {url}")
 
             token = getattr(config, 'github_token', None) or getattr(config, 'gitlab_token', None)
-            fetcher = PRFetcher(token=token)
+            fetcher = PRFetcher(token=token, diff_cache=PRDiffCache(DEFAULT_PR_CACHE_DIR))
 
             # Get PR info
+            info: dict[str, str | int] = {}
             try:
                 info = fetcher.get_pr_info(url)
                 click.echo(f"\nPR: {info.get('title', 'N/A')}")
@@ -68,28 +114,33 @@ def review_pr(
             except APIError:
                 click.echo(click.style("Could not fetch PR info (auth may be required)", fg="yellow"))
 
-            # Fetch diff
-            diff_text = fetcher.fetch_pr_diff(url)
-
-            # Parse diff
-            parser = DiffParser()
-            parsed = parser.parse(diff_text)
-
-            if not parsed:
+            if _exceeds_pr_limits(info, config.review if config else ReviewConfig()):
+                # Too big to download as one patch; list the files instead
+                click.echo(click.style(
+                    "PR exceeds size limits; listing changed files without patches.",
+                    fg="yellow"
+                ))
+                file_paths = list(dict.fromkeys(fetcher.iter_pr_files(url)))
+            else:
+                # Stream and parse the diff, keeping only file paths so memory
+                # stays bounded by the largest file rather than the whole PR
+                parser = DiffParser()
+                file_paths = list(dict.fromkeys(
+                    d.file_path for d in parser.iter_parse(fetcher.iter_pr_diff(url))
+                ))
+
+            if not file_paths:
                 click.echo(click.style("No files found in PR diff.", fg="yellow"))
                 return
 
-            # Extract file paths
-            files = {d.file_path: d for d in parsed}
-            file_paths = list(files.keys())
-
         else:
             # Compare branches locally
             repo = GitRepository()
             current_branch = repo.current_branch
 
             click.echo(f"Comparing {current_branch} -> {branch}")
-            file_changes = repo.get_branch_diff(branch)
+            # Names only; patches are not needed to filter or list files
+            file_changes = repo.get_branch_diff_names(branch)
             file_paths = list(file_changes.keys())
 
         if not file_paths:
@@ -104,12 +155,12 @@ def review_pr(
             click.echo(click.style("No files to review after filtering.", fg="yellow"))
             return
 
-        click.echo(f"\nFiles to review: {len(filtered_paths)}\n")
-        for path in filtered_paths[:20]:  # Show first 20
-            click.echo(f"  - {path}")
-
+        # Show first 20, written in one go
+        listing = [f"\nFiles to review: {len(filtered_paths)}\n"]
+        listing.extend(f"  - {path}" for path in filtered_paths[:20])
         if len(filtered_paths) > 20:
-            click.echo(f"  ... and {len(filtered_paths) - 20} more")
+            listing.append(f"  ... and {len(filtered_paths) - 20} more")
+        click.echo("\n".join(listing))
 
         # TODO: Integrate with review pipeline
         click.echo(f"\nReview pipeline integration pending...")
@@ -13,9 +13,23 @@ DEFAULT_TIMEOUT = 30  # seconds
 DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_RETRY_MIN_WAIT = 2  # seconds
 DEFAULT_RETRY_MAX_WAIT = 10  # seconds
+DEFAULT_CACHE_TYPE = "sqlite"  # persist LLM responses across runs
+DEFAULT_CACHE_PATH = "~/.cache/shield-pr/llm_cache.db"
+DEFAULT_PR_CACHE_DIR = "~/.cache/shield-pr/pr_diffs"  # ETag-indexed PR diff bodies
+DEFAULT_STRUCTURED_OUTPUT = True  # enforce the findings schema via Gemini JSON mode
+DEFAULT_LLM_MAX_CONCURRENCY = 10  # LLM calls in flight; lowered automatically on 429s
 
 # Review Configuration Defaults
 DEFAULT_REVIEW_DEPTH = "standard"
+DEFAULT_SINGLE_PASS = True  # one combined prompt per chain instead of one per stage
+DEFAULT_MAX_CONCURRENCY = 5  # files reviewed at once
+DEFAULT_CODE_TOKEN_BUDGET = 12000  # approximate tokens of code per prompt
+DEFAULT_STRUCTURAL_CACHE = False  # reuse results across renamed code (approximate)
+DEFAULT_BATCH_UNIVERSAL = False  # pack several files per universal review prompt
+DEFAULT_BATCH_PLATFORM = False  # same for platform reviews, one batch per platform
+DEFAULT_SPECULATIVE = False  # pre-launch stages on sibling drafts; may leak sibling context
+DEFAULT_MAX_FILES_PER_PR = 200  # larger PRs are listed without downloading patches
+DEFAULT_MAX_LINES_PER_PR = 20000  # added + deleted lines, same fallback
 DEFAULT_FOCUS_AREAS: list[str] = ["security", "performance", "maintainability"]
 DEFAULT_PLATFORMS: list[str] = []  # Empty = auto-detect
 
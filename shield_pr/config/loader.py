@@ -4,9 +4,11 @@ Implements configuration precedence: ENV vars > YAML file > defaults
 Provides secure loading with validation and error handling.
 """
 
+import copy
+import functools
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 from pydantic import ValidationError
@@ -15,6 +17,9 @@ from ..core.errors import ConfigError
 from .defaults import DEFAULT_CONFIG_PATH
 from .models import APIConfig, Config, OutputConfig, ReviewConfig
 
+# libyaml's C loader when PyYAML was built with it, same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_yaml_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """Load configuration from YAML file.
@@ -30,19 +35,63 @@ def load_yaml_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     path = Path(config_path or DEFAULT_CONFIG_PATH).expanduser()
 
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return {}  # Return empty dict if config file doesn't exist
+    except OSError as e:
+        raise ConfigError(f"Failed to read config from {path}: {e}")
+
+    # Callers merge into the result, so each gets its own copy
+    return copy.deepcopy(_parse_yaml_file(str(path), stat.st_ino, stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml_file(path: str, inode: int, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML config file, memoized until the file changes.
 
+    Args:
+        path: Path to config file
+        inode: File inode, part of the cache key
+        mtime_ns: File modification time, part of the cache key
+        size: File size, part of the cache key
+
+    Returns:
+        Parsed configuration dictionary
+
+    Raises:
+        ConfigError: If file cannot be read or parsed
+    """
     try:
-        with open(path, "r") as f:
-            data = yaml.safe_load(f)
-            return data or {}
+        # Bytes go straight to the parser, which detects the encoding itself
+        data = yaml.load(Path(path).read_bytes(), Loader=_YAML_LOADER)
+        return data or {}
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid YAML in {path}: {e}")
     except Exception as e:
         raise ConfigError(f"Failed to read config from {path}: {e}")
 
 
+def _split_list(value: str) -> List[str]:
+    """Split a comma-separated env value into stripped items."""
+    return [item.strip() for item in value.split(",")]
+
+
+# Environment variable -> (section, key, converter)
+_ENV_OVERRIDES: Tuple[Tuple[str, str, str, Callable[[str], Any]], ...] = (
+    ("CRA_API_KEY", "api", "api_key", str),
+    ("CRA_MODEL", "api", "model", str),
+    ("CRA_MAX_TOKENS", "api", "max_tokens", int),
+    ("CRA_TEMPERATURE", "api", "temperature", float),
+    ("CRA_TIMEOUT", "api", "timeout", int),
+    ("CRA_DEPTH", "review", "depth", str),
+    ("CRA_PLATFORMS", "review", "platforms", _split_list),
+    ("CRA_FOCUS_AREAS", "review", "focus_areas", _split_list),
+    ("CRA_OUTPUT_FORMAT", "output", "format", str),
+    ("CRA_OUTPUT_FILE", "output", "file", str),
+)
+
+
 def load_env_overrides() -> Dict[str, Any]:
     """Load configuration overrides from environment variables.
 
@@ -53,41 +102,26 @@ def load_env_overrides() -> Dict[str, Any]:
         CRA_MAX_TOKENS -> api.max_tokens
 
     Returns:
-        Dictionary with nested configuration from env vars
+        Dictionary with nested configuration from env vars (only sections
+        with at least one variable set)
     """
-    config: Dict[str, Any] = {"api": {}, "review": {}, "output": {}}
-
-    # API configuration env vars
-    if api_key := os.getenv("CRA_API_KEY"):
-        config["api"]["api_key"] = api_key
-    if model := os.getenv("CRA_MODEL"):
-        config["api"]["model"] = model
-    if max_tokens := os.getenv("CRA_MAX_TOKENS"):
-        config["api"]["max_tokens"] = int(max_tokens)
-    if temperature := os.getenv("CRA_TEMPERATURE"):
-        config["api"]["temperature"] = float(temperature)
-    if timeout := os.getenv("CRA_TIMEOUT"):
-        config["api"]["timeout"] = int(timeout)
-
-    # Review configuration env vars
-    if depth := os.getenv("CRA_DEPTH"):
-        config["review"]["depth"] = depth
-    if platforms := os.getenv("CRA_PLATFORMS"):
-        config["review"]["platforms"] = [p.strip() for p in platforms.split(",")]
-    if focus_areas := os.getenv("CRA_FOCUS_AREAS"):
-        config["review"]["focus_areas"] = [a.strip() for a in focus_areas.split(",")]
-
-    # Output configuration env vars
-    if output_format := os.getenv("CRA_OUTPUT_FORMAT"):
-        config["output"]["format"] = output_format
-    if output_file := os.getenv("CRA_OUTPUT_FILE"):
-        config["output"]["file"] = output_file
+    env = os.environ
+    config: Dict[str, Any] = {}
+
+    for name, section, key, convert in _ENV_OVERRIDES:
+        if value := env.get(name):
+            config.setdefault(section, {})[key] = convert(value)
 
     return config
 
 
 def merge_configs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    """Deep merge two configuration dictionaries.
+    """Merge two configuration dictionaries section by section.
+
+    The config schema is two levels deep (section -> setting), so sections
+    present in both are merged key by key and everything else is replaced.
+    Unset values (None or empty strings) never override; falsy values such
+    as False, 0 or [] do.
 
     Args:
         base: Base configuration
@@ -96,17 +130,23 @@ def merge_configs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, A
     Returns:
         Merged configuration dictionary
     """
-    result = base.copy()
+    result = {key: dict(value) if isinstance(value, dict) else value for key, value in base.items()}
 
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_configs(result[key], value)
-        elif value:  # Only override if value is not empty
+        section = result.get(key)
+        if isinstance(section, dict) and isinstance(value, dict):
+            section.update((name, setting) for name, setting in value.items() if _is_set(setting))
+        elif _is_set(value):
             result[key] = value
 
     return result
 
 
+def _is_set(value: Any) -> bool:
+    """Return whether an override value should replace the base value."""
+    return value is not None and value != ""
+
+
 def load_config(config_path: Optional[str] = None, require_api_key: bool = True) -> Config:
     """Load and validate configuration from all sources.
 
@@ -141,7 +181,7 @@ def load_config(config_path: Optional[str] = None, require_api_key: bool = True)
             )
 
         # Validate with Pydantic
-        config = Config(**merged)
+        config = Config.model_validate(merged)
         return config
 
     except ValidationError as e:
@@ -4,14 +4,23 @@ Defines configuration schemas with validation rules, default values,
 and type hints for the code review assistant.
 """
 
-from typing import Any, List, Optional
+from typing import Any, Final, List, Optional
 
 from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 from .defaults import (
     DEFAULT_API_MODEL,
     DEFAULT_API_PROVIDER,
+    DEFAULT_BATCH_PLATFORM,
+    DEFAULT_BATCH_UNIVERSAL,
+    DEFAULT_CACHE_PATH,
+    DEFAULT_CACHE_TYPE,
+    DEFAULT_CODE_TOKEN_BUDGET,
     DEFAULT_FOCUS_AREAS,
+    DEFAULT_LLM_MAX_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_FILES_PER_PR,
+    DEFAULT_MAX_LINES_PER_PR,
     DEFAULT_MAX_TOKENS,
     DEFAULT_OUTPUT_FORMAT,
     DEFAULT_PLATFORMS,
@@ -19,10 +28,17 @@ from .defaults import (
     DEFAULT_RETRY_MAX_WAIT,
     DEFAULT_RETRY_MIN_WAIT,
     DEFAULT_REVIEW_DEPTH,
+    DEFAULT_SINGLE_PASS,
+    DEFAULT_SPECULATIVE,
+    DEFAULT_STRUCTURAL_CACHE,
+    DEFAULT_STRUCTURED_OUTPUT,
     DEFAULT_TEMPERATURE,
     DEFAULT_TIMEOUT,
 )
 
+_VALID_PLATFORMS: Final = frozenset({"android", "ios", "ai-ml", "frontend", "backend"})
+_PLACEHOLDER_API_KEYS: Final = frozenset({"", "your-api-key-here", "xxx", "placeholder"})
+
 
 class APIConfig(BaseModel):
     """API provider configuration with credentials and parameters."""
@@ -36,12 +52,16 @@ class APIConfig(BaseModel):
     retry_attempts: int = Field(default=DEFAULT_RETRY_ATTEMPTS, ge=1, le=5)
     retry_min_wait: int = Field(default=DEFAULT_RETRY_MIN_WAIT, ge=1, le=30)
     retry_max_wait: int = Field(default=DEFAULT_RETRY_MAX_WAIT, ge=2, le=60)
+    cache_type: str = Field(default=DEFAULT_CACHE_TYPE, pattern="^(memory|sqlite)$")
+    cache_path: str = Field(default=DEFAULT_CACHE_PATH)
+    structured_output: bool = Field(default=DEFAULT_STRUCTURED_OUTPUT)
+    max_concurrency: int = Field(default=DEFAULT_LLM_MAX_CONCURRENCY, ge=1, le=100)
 
     @field_validator("api_key")
     @classmethod
     def validate_api_key(cls, v: str) -> str:
         """Ensure API key is not a placeholder."""
-        if v in ("", "your-api-key-here", "xxx", "placeholder"):
+        if v in _PLACEHOLDER_API_KEYS:
             raise ValueError("Invalid API key: must be a real key")
         return v
 
@@ -61,15 +81,23 @@ class ReviewConfig(BaseModel):
     depth: str = Field(default=DEFAULT_REVIEW_DEPTH, pattern="^(quick|standard|deep)$")
     platforms: List[str] = Field(default_factory=lambda: DEFAULT_PLATFORMS.copy())
     focus_areas: List[str] = Field(default_factory=lambda: DEFAULT_FOCUS_AREAS.copy())
+    single_pass: bool = Field(default=DEFAULT_SINGLE_PASS)
+    max_concurrency: int = Field(default=DEFAULT_MAX_CONCURRENCY, ge=1, le=50)
+    code_token_budget: int = Field(default=DEFAULT_CODE_TOKEN_BUDGET, ge=256)
+    structural_cache: bool = Field(default=DEFAULT_STRUCTURAL_CACHE)
+    batch_universal: bool = Field(default=DEFAULT_BATCH_UNIVERSAL)
+    batch_platform: bool = Field(default=DEFAULT_BATCH_PLATFORM)
+    speculative: bool = Field(default=DEFAULT_SPECULATIVE)
+    max_files_per_pr: int = Field(default=DEFAULT_MAX_FILES_PER_PR, ge=1)
+    max_lines_per_pr: int = Field(default=DEFAULT_MAX_LINES_PER_PR, ge=1)
 
     @field_validator("platforms")
     @classmethod
     def validate_platforms(cls, v: List[str]) -> List[str]:
         """Validate platform names."""
-        valid_platforms = {"android", "ios", "ai-ml", "frontend", "backend"}
-        invalid = set(v) - valid_platforms
+        invalid = set(v) - _VALID_PLATFORMS
         if invalid:
-            raise ValueError(f"Invalid platforms: {invalid}. Valid: {valid_platforms}")
+            raise ValueError(f"Invalid platforms: {invalid}. Valid: {set(_VALID_PLATFORMS)}")
         return v
 
     @field_validator("focus_areas")
@@ -1,34 +1,299 @@
 """LangChain cache configuration for token efficiency.
 
-Implements InMemoryCache with future extensibility for Redis or disk caching.
+Implements InMemoryCache or a persistent SQLiteCache for LLM responses,
+plus a content-addressed ResultCache for review stage outputs and the
+structural fingerprints used to reuse outputs across renamed code.
 """
 
+import functools
+import hashlib
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
 from langchain_core.caches import InMemoryCache
 from langchain_core.globals import set_llm_cache
 
 from ..utils.logger import logger
 
 
-def setup_cache(cache_type: str = "memory") -> None:
+@functools.lru_cache(maxsize=64)
+def content_digest(text: str) -> str:
+    """Hash a large input once so repeated cache keys can reuse the digest.
+
+    Every stage of a review keys its cache entry on the same source code;
+    memoizing the digest makes that O(len(code)) per file rather than per
+    stage.
+
+    Args:
+        text: Content to hash
+
+    Returns:
+        Hex digest of the content
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def setup_cache(cache_type: str = "memory", path: Optional[str] = None) -> None:
     """Configure LangChain caching layer.
 
     Args:
-        cache_type: Type of cache to use ('memory', 'redis', 'disk')
-                   Currently only 'memory' is implemented
+        cache_type: Type of cache to use ('memory' or 'sqlite')
+        path: Database file for the 'sqlite' cache
 
     Raises:
-        ValueError: If cache_type is not supported
+        ValueError: If cache_type is not supported or path is missing
     """
     if cache_type == "memory":
         cache = InMemoryCache()
         set_llm_cache(cache)
         logger.debug("Initialized InMemoryCache for LLM responses")
+    elif cache_type == "sqlite":
+        if not path:
+            raise ValueError("SQLite cache requires a database path")
+        from langchain_community.cache import SQLiteCache
+
+        db_path = Path(path).expanduser()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        set_llm_cache(SQLiteCache(database_path=str(db_path)))
+        logger.debug(f"Initialized SQLiteCache for LLM responses at {db_path}")
     else:
         raise ValueError(f"Unsupported cache type: {cache_type}")
 
 
+@functools.lru_cache(maxsize=64)
+def code_digest(code: str) -> str:
+    """Digest source code, ignoring line-ending and trailing-whitespace changes.
+
+    Re-running a review on a file that only differs in CRLF line endings
+    or trailing spaces then maps to the same cache entries.
+
+    Args:
+        code: Source code
+
+    Returns:
+        Hex digest of the normalized code
+    """
+    normalized = "\n".join(line.rstrip() for line in code.splitlines())
+    return content_digest(normalized)
+
+
+# Strings, identifiers, numbers, a newline with the next line's indentation,
+# or any other single character; other whitespace is insignificant
+_TOKEN_RE = re.compile(
+    r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|[A-Za-z_$][\w$]*|\d[\w.]*|\n[ \t]*|\S'
+)
+
+# Words that carry meaning on their own and so stay part of the shape
+_KEYWORDS = frozenset(
+    """abstract as assert async await break case catch class const continue data def
+    default defer del do elif else enum except export extends extension false final
+    finally fn for from fun func function go guard if impl implements import in init
+    inline interface internal is lambda late let match mut new nil none not null object
+    open or override package pass private protected pub public raise return sealed self
+    static struct super suspend switch this throw throws true try type typealias val var
+    void when where while with yield""".split()
+)
+
+
+@functools.lru_cache(maxsize=64)
+def code_shape(code: str) -> Tuple[str, Tuple[str, ...]]:
+    """Fingerprint code's structure with identifiers abstracted away.
+
+    Keywords, literals, punctuation, line breaks and indentation form the
+    shape; every other name is replaced by a placeholder and returned in
+    order, so two snippets with equal shapes differ only by renaming.
+
+    Args:
+        code: Source code
+
+    Returns:
+        (shape digest, identifiers in order of appearance)
+    """
+    shape = []
+    identifiers = []
+    for token in _TOKEN_RE.findall(code.replace("\r\n", "\n")):
+        if (token[0].isalpha() or token[0] in "_$") and token not in _KEYWORDS:
+            identifiers.append(token)
+            shape.append("\x01")
+        else:
+            shape.append(token)
+    return content_digest("\x00".join(shape)), tuple(identifiers)
+
+
+def rename_identifiers(
+    text: str,
+    old: Sequence[str],
+    new: Sequence[str],
+    reserved: frozenset = frozenset(),
+) -> Optional[str]:
+    """Rewrite text produced for one snippet to fit a same-shaped snippet.
+
+    Args:
+        text: Text mentioning identifiers of the original snippet
+        old: Identifiers of the original snippet, from code_shape()
+        new: Identifiers of the new snippet, from code_shape()
+        reserved: Words that must not be rewritten (e.g. JSON field names)
+
+    Returns:
+        Text with renamed identifiers substituted, or None if the snippets
+        are not a consistent renaming of each other
+    """
+    if len(old) != len(new):
+        return None
+    forward: Dict[str, str] = {}
+    backward: Dict[str, str] = {}
+    for before, after in zip(old, new):
+        if forward.setdefault(before, after) != after:
+            return None
+        if backward.setdefault(after, before) != before:
+            return None
+
+    renames = {before: after for before, after in forward.items() if before != after}
+    if not renames:
+        return text
+    if reserved.intersection(renames):
+        return None
+    pattern = re.compile(r"\b(" + "|".join(map(re.escape, renames)) + r")\b")
+    return pattern.sub(lambda match: renames[match.group(1)], text)
+
+
 def clear_cache() -> None:
     """Clear the current LLM cache."""
     set_llm_cache(None)
     setup_cache()  # Reinitialize
     logger.debug("Cleared LLM cache")
+
+
+class ResultCache:
+    """Content-addressed cache for LLM stage outputs.
+
+    Keeps a bounded in-process LRU in front of an optional SQLite file so
+    identical inputs skip the LLM call, within a run and across runs. Disk
+    entries expire after max_age_days and at most max_disk_entries are kept;
+    both limits are applied when the cache is opened.
+    """
+
+    # Entries written before keys covered the prompt lived in "entries";
+    # they can never be hit again and are dropped on open
+    TABLE = "stage_results"
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        path: Optional[str] = None,
+        max_age_days: float = 30,
+        max_disk_entries: int = 100_000,
+    ) -> None:
+        """Initialize result cache.
+
+        Args:
+            max_entries: Maximum entries held in memory
+            path: Optional SQLite file for persistent storage
+            max_age_days: Age after which disk entries are discarded
+            max_disk_entries: Maximum entries kept on disk (newest win)
+        """
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.max_disk_entries = max_disk_entries
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+
+        if path:
+            db_path = Path(path).expanduser()
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+            # WAL lets concurrent runs (e.g. parallel CI jobs) read while one
+            # writes, and NORMAL sync keeps the per-entry commits cheap
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.TABLE}_stored_at ON {self.TABLE} (stored_at)"
+            )
+            self._prune(self._db)
+            self._db.commit()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash key parts into a cache key.
+
+        Args:
+            *parts: Strings identifying the cached computation
+
+        Returns:
+            Hex digest of the joined parts
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached value.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached value or None on miss
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        if self._db is not None:
+            row = self._db.execute(
+                f"SELECT value FROM {self.TABLE} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._remember(key, row[0])
+                return str(row[0])
+
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key from make_key()
+            value: Value to cache
+        """
+        self._remember(key, value)
+        if self._db is not None:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO {self.TABLE} (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self._memory.clear()
+        if self._db is not None:
+            self._db.execute(f"DELETE FROM {self.TABLE}")
+            self._db.commit()
+
+    def _prune(self, db: sqlite3.Connection) -> None:
+        """Drop expired disk entries and the oldest ones beyond max_disk_entries."""
+        cutoff = time.time() - self.max_age_days * 86400
+        db.execute(f"DELETE FROM {self.TABLE} WHERE stored_at < ?", (cutoff,))
+        db.execute(
+            f"DELETE FROM {self.TABLE} WHERE key IN (SELECT key FROM {self.TABLE} "
+            "ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,),
+        )
+
+    def _remember(self, key: str, value: str) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry if full."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
@@ -45,6 +45,18 @@ class RateLimitError(APIError):
     pass
 
 
+class TransientAPIError(APIError):
+    """Raised when an LLM call fails for a reason that may clear on retry.
+
+    Examples:
+        - Dropped or reset connections
+        - Request timeouts
+        - 5xx responses from the provider
+    """
+
+    pass
+
+
 class ValidationError(CRAError):
     """Raised when input validation fails.
 
@@ -102,3 +114,14 @@ class FilterError(CRAError):
     """
 
     pass
+
+
+class PromptBudgetError(CRAError):
+    """Raised when a prompt template outgrows its token budget.
+
+    Examples:
+        - A stage's focus list grew past its token_budget
+        - A shared partial (severity guide, schema) was expanded
+    """
+
+    pass
@@ -1,28 +1,193 @@
-"""Gemini LLM client with retry logic and caching.
+"""Gemini LLM client with error classification and caching.
 
 Provides abstraction layer over LangChain's Gemini integration with
-exponential backoff, rate limiting handling, and token tracking.
+adaptive concurrency, rate limiting handling, and token tracking. Calls are
+made once; callers retry the errors marked retryable (see chains._retry).
 """
 
-from typing import Optional
+import asyncio
+import functools
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, Union
 
+from google.api_core import exceptions as google_exceptions
 from langchain_google_genai import ChatGoogleGenerativeAI
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from pydantic import BaseModel
 
 from ..config.models import APIConfig
-from ..core.errors import APIError, RateLimitError
+from ..core.errors import APIError, RateLimitError, TransientAPIError
 from ..utils.logger import logger
 from .cache import setup_cache
 
+# Provider errors that mean the request was throttled; ResourceExhausted
+# (Gemini's quota error) is a TooManyRequests
+_THROTTLED_ERRORS = (google_exceptions.TooManyRequests,)
+
+# Throttling named in the message of a wrapped provider error. Whole words
+# only: "generate", "4294 bytes" or a 400 citing a field must not match,
+# since a rate limit also halves the concurrency cap for every review.
+_RATE_LIMIT_RE = re.compile(
+    r"\b(?:429|rate[ _-]?limit(?:ed)?|quota|resource[ _]exhausted|resource has been exhausted)\b",
+    re.IGNORECASE,
+)
+
+# Provider failures that may succeed when retried: dropped connections,
+# timeouts and 5xx responses (ServerError covers 500, 503 and 504)
+_TRANSIENT_ERRORS = (ConnectionError, TimeoutError, google_exceptions.ServerError)
+
+
+def _provider_error(error: Exception, label: str) -> APIError:
+    """Map a failed LLM call to the matching APIError subclass.
+
+    Args:
+        error: Exception raised by the call
+        label: Call kind used in messages ("LLM", "Async LLM", ...)
+
+    Returns:
+        RateLimitError, TransientAPIError or APIError to raise
+    """
+    if isinstance(error, _THROTTLED_ERRORS) or _RATE_LIMIT_RE.search(str(error)):
+        logger.warning("Rate limit hit, will retry with backoff")
+        return RateLimitError(f"Rate limit exceeded: {error}")
+
+    if isinstance(error, _TRANSIENT_ERRORS):
+        logger.warning(f"{label} call failed, will retry: {error}")
+        return TransientAPIError(f"{label} call failed: {error}")
+
+    logger.error(f"{label} invocation failed: {error}")
+    return APIError(f"{label} call failed: {error}")
+
+
+def _schema_node(node: Dict[str, Any], defs: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert one JSON Schema node to Gemini's Schema fields.
+
+    Args:
+        node: JSON Schema node from pydantic
+        defs: Shared $defs of the root schema
+
+    Returns:
+        Gemini Schema dictionary
+    """
+    if "$ref" in node:
+        node = defs[node["$ref"].rsplit("/", 1)[-1]]
+    if "anyOf" in node:
+        options = [option for option in node["anyOf"] if option.get("type") != "null"]
+        converted = _schema_node(options[0], defs)
+        if "description" in node:
+            converted["description"] = node["description"]
+        converted["nullable"] = len(options) < len(node["anyOf"])
+        return converted
+
+    converted: Dict[str, Any] = {"type_": node.get("type", "string").upper()}
+    if "description" in node:
+        converted["description"] = node["description"]
+    if "enum" in node:
+        converted["format_"] = "enum"
+        converted["enum"] = node["enum"]
+    if "items" in node:
+        converted["items"] = _schema_node(node["items"], defs)
+    if "properties" in node:
+        converted["properties"] = {
+            name: _schema_node(prop, defs) for name, prop in node["properties"].items()
+        }
+        converted["required"] = node.get("required", [])
+    return converted
+
+
+@functools.lru_cache(maxsize=None)
+def response_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Build (once) the Gemini response schema for a pydantic model.
+
+    Gemini accepts only a subset of JSON Schema: references are inlined
+    and optional fields become nullable.
+
+    Args:
+        model: Pydantic model describing the response
+
+    Returns:
+        Gemini Schema dictionary for generation_config.response_schema
+    """
+    schema = model.model_json_schema()
+    return _schema_node(schema, schema.get("$defs", {}))
+
+
+def _messages(prompt: str, system: Optional[str]) -> Union[str, List[Tuple[str, str]]]:
+    """Build the model input, splitting off the system message if given.
+
+    Args:
+        prompt: Human message text
+        system: Optional system message text
+
+    Returns:
+        Prompt string, or (role, text) chat messages
+    """
+    if not system:
+        return prompt
+    return [("system", system), ("human", prompt)]
+
+
+class _AdaptiveLimiter:
+    """Concurrency cap for LLM calls, tuned by AIMD from call outcomes.
+
+    Starts at the configured maximum. A rate-limited call halves the cap
+    (never below one); every other completed call raises it by one, back up
+    to the maximum. Concurrent reviews thus settle just under the
+    provider's limit instead of piling into 429 backoffs.
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        """Initialize limiter.
+
+        Args:
+            max_concurrency: Upper bound on calls in flight
+        """
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self._active = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._condition: Optional[asyncio.Condition] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Return the condition for the running loop (each asyncio.run has its own)."""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._loop = loop
+            self._condition = asyncio.Condition()
+            self._active = 0
+        return self._condition
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current cap."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def release(self, rate_limited: bool) -> None:
+        """Free a slot and adjust the cap.
+
+        Args:
+            rate_limited: Whether the call was rejected by the rate limit
+        """
+        condition = self._get_condition()
+        async with condition:
+            self._active -= 1
+            if rate_limited:
+                self.limit = max(1, self.limit // 2)
+            else:
+                self.limit = min(self.max_concurrency, self.limit + 1)
+            condition.notify_all()
+
 
 class LLMClient:
     """LLM client wrapper with retry logic and error handling."""
 
+    # Review stages send their static instructions as a system message
+    system_messages = True
+    # Review stages stream through astream() when a caller passes on_finding,
+    # as the review commands do when rendering to a terminal
+    streaming = True
+
     def __init__(self, config: APIConfig):
         """Initialize LLM client with configuration.
 
@@ -30,9 +195,15 @@ class LLMClient:
             config: API configuration with credentials and parameters
         """
         self.config = config
+        # Stages check this to request schema-enforced JSON instead of
+        # describing the shape in the prompt
+        self.structured_output = config.structured_output
+
+        # Shared by all concurrent async calls made through this client
+        self._limiter = _AdaptiveLimiter(config.max_concurrency)
 
-        # Set up caching
-        setup_cache()
+        # Set up caching; the sqlite cache persists responses across runs
+        setup_cache(config.cache_type, config.cache_path)
 
         # Initialize Gemini client
         try:
@@ -43,92 +214,187 @@ class LLMClient:
                 max_tokens=config.max_tokens,
                 timeout=config.timeout,
             )
-            logger.debug(f"Initialized Gemini client with model {config.model}")
+            logger.debug("Initialized Gemini client with model %s", config.model)
         except Exception as e:
             raise APIError(f"Failed to initialize LLM client: {e}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((APIError, RateLimitError)),
-        reraise=True,
-    )
-    def invoke(self, prompt: str) -> str:
-        """Execute LLM call with retry logic.
+    def _model_for(self, schema: Optional[Type[BaseModel]]) -> Any:
+        """Return the chat model, bound to JSON mode when a schema is given.
+
+        Args:
+            schema: Pydantic model the response must follow, or None
+
+        Returns:
+            Chat model or schema-bound runnable
+        """
+        if schema is None:
+            return self.llm
+        return self.llm.bind(
+            generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": response_schema(schema),
+            }
+        )
+
+    def invoke(
+        self,
+        prompt: str,
+        schema: Optional[Type[BaseModel]] = None,
+        system: Optional[str] = None,
+    ) -> str:
+        """Execute one LLM call.
+
+        Retries are left to the caller, as for ainvoke.
 
         Args:
             prompt: The prompt to send to the LLM
+            schema: Optional pydantic model enforced through JSON mode
+            system: Optional system message sent ahead of the prompt
 
         Returns:
             LLM response content as string
 
         Raises:
-            APIError: If LLM call fails after retries
+            APIError: If LLM call fails
             RateLimitError: If rate limit is exceeded
+            TransientAPIError: If the call failed in a way worth retrying
         """
         if not prompt or not prompt.strip():
             raise ValueError("Prompt cannot be empty")
 
         try:
-            logger.debug(f"Invoking LLM with {len(prompt)} chars")
-            response = self.llm.invoke(prompt)
+            logger.debug("Invoking LLM with %d chars", len(prompt))
+            response = self._model_for(schema).invoke(_messages(prompt, system))
 
             if not response or not hasattr(response, "content"):
                 raise APIError("Invalid response from LLM")
 
             content = response.content
             if isinstance(content, str):
-                logger.debug(f"Received response: {len(content)} chars")
+                logger.debug("Received response: %d chars", len(content))
                 return content
             raise APIError("Response content is not a string")
 
         except Exception as e:
-            error_msg = str(e).lower()
-
-            # Check for rate limiting
-            if "rate" in error_msg or "quota" in error_msg or "429" in error_msg:
-                logger.warning("Rate limit hit, will retry with backoff")
-                raise RateLimitError(f"Rate limit exceeded: {e}")
+            raise _provider_error(e, "LLM")
 
-            # Generic API error
-            logger.error(f"LLM invocation failed: {e}")
-            raise APIError(f"LLM call failed: {e}")
-
-    async def ainvoke(self, prompt: str) -> str:
+    async def ainvoke(
+        self,
+        prompt: str,
+        schema: Optional[Type[BaseModel]] = None,
+        system: Optional[str] = None,
+    ) -> str:
         """Async version of invoke.
 
+        At most api.max_concurrency calls run at once, fewer after rate
+        limiting (see _AdaptiveLimiter). Retries are left to the caller.
+
         Args:
             prompt: The prompt to send to the LLM
+            schema: Optional pydantic model enforced through JSON mode
+            system: Optional system message sent ahead of the prompt
 
         Returns:
             LLM response content as string
 
         Raises:
-            APIError: If LLM call fails after retries
+            APIError: If LLM call fails
             RateLimitError: If rate limit is exceeded
+            TransientAPIError: If the call failed in a way worth retrying
         """
         if not prompt or not prompt.strip():
             raise ValueError("Prompt cannot be empty")
 
+        await self._limiter.acquire()
+        rate_limited = False
         try:
-            logger.debug(f"Async invoking LLM with {len(prompt)} chars")
-            response = await self.llm.ainvoke(prompt)
+            return await self._ainvoke_once(prompt, schema, system)
+        except RateLimitError:
+            rate_limited = True
+            raise
+        finally:
+            await self._limiter.release(rate_limited)
+
+    async def _ainvoke_once(
+        self,
+        prompt: str,
+        schema: Optional[Type[BaseModel]],
+        system: Optional[str],
+    ) -> str:
+        """Make one async LLM call and map provider errors.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            schema: Optional pydantic model enforced through JSON mode
+            system: Optional system message sent ahead of the prompt
+
+        Returns:
+            LLM response content as string
+
+        Raises:
+            APIError: If LLM call fails
+            RateLimitError: If rate limit is exceeded
+            TransientAPIError: If the call failed in a way worth retrying
+        """
+        try:
+            logger.debug("Async invoking LLM with %d chars", len(prompt))
+            response = await self._model_for(schema).ainvoke(_messages(prompt, system))
 
             if not response or not hasattr(response, "content"):
                 raise APIError("Invalid response from LLM")
 
             content = response.content
             if isinstance(content, str):
-                logger.debug(f"Received async response: {len(content)} chars")
+                logger.debug("Received async response: %d chars", len(content))
                 return content
             raise APIError("Response content is not a string")
 
         except Exception as e:
-            error_msg = str(e).lower()
+            raise _provider_error(e, "Async LLM")
+
+    async def astream(
+        self,
+        prompt: str,
+        schema: Optional[Type[BaseModel]] = None,
+        system: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Stream the response text as the model generates it.
+
+        Holds one limiter slot until the stream is exhausted or closed.
+        Streamed calls bypass the LangChain response cache; review chains
+        cache the joined text themselves.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            schema: Optional pydantic model enforced through JSON mode
+            system: Optional system message sent ahead of the prompt
 
-            if "rate" in error_msg or "quota" in error_msg or "429" in error_msg:
-                logger.warning("Rate limit hit, will retry with backoff")
-                raise RateLimitError(f"Rate limit exceeded: {e}")
+        Yields:
+            Response text chunks
 
-            logger.error(f"Async LLM invocation failed: {e}")
-            raise APIError(f"Async LLM call failed: {e}")
+        Raises:
+            APIError: If LLM call fails
+            RateLimitError: If rate limit is exceeded
+            TransientAPIError: If the call failed in a way worth retrying
+        """
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+
+        await self._limiter.acquire()
+        rate_limited = False
+        try:
+            logger.debug("Streaming LLM response for %d chars", len(prompt))
+            async for chunk in self._model_for(schema).astream(_messages(prompt, system)):
+                content = getattr(chunk, "content", None)
+                if not isinstance(content, str):
+                    raise APIError("Response content is not a string")
+                if content:
+                    yield content
+        except APIError:
+            raise
+        except Exception as e:
+            error = _provider_error(e, "Streamed LLM")
+            rate_limited = isinstance(error, RateLimitError)
+            raise error
+        finally:
+            await self._limiter.release(rate_limited)
@@ -4,14 +4,19 @@ Coordinates file reading, platform detection, chain execution,
 and result synthesis for complete code review workflow.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from shield_pr.config.models import Config
+from shield_pr.core.cache import ResultCache
 from shield_pr.core.errors import ReviewError
 from shield_pr.core.llm_client import LLMClient
 from shield_pr.detection.detector import PlatformDetector
+from shield_pr.models.finding import Finding
 from shield_pr.models.review_result import ReviewResult
-from shield_pr.chains import get_chain, UniversalReviewChain, SynthesisChain
+from shield_pr.chains import get_chain, DraftStore, UniversalReviewChain, SynthesisChain
+from shield_pr.chains.prompts.code_preproc import language_for, prepare, truncated_lines
 from shield_pr.utils.file_reader import FileReader
 from shield_pr.utils.logger import logger
 
@@ -23,6 +28,7 @@ class ReviewPipeline:
     1. File reading - Load file contents
     2. Platform detection - Identify platform for each file
     3. Chain execution - Run platform-specific and universal reviews
+       concurrently, for several files at once
     4. Synthesis - Combine and deduplicate findings
     5. Aggregation - Combine multi-file results
     """
@@ -38,12 +44,22 @@ class ReviewPipeline:
         self.detector = PlatformDetector()
         self.file_reader = FileReader()
         self.synthesis_chain = SynthesisChain()
+        # Shared across chains so unchanged inputs skip repeated LLM calls;
+        # persisted next to the LLM response cache when that is on disk
+        cache_path = config.api.cache_path if config.api.cache_type == "sqlite" else None
+        self.stage_cache = ResultCache(path=cache_path)
+        # Chains keep no per-review state, so one instance per (platform,
+        # depth) serves every file; "universal" keys the universal chain
+        self._chains: Dict[Tuple[str, str], Any] = {}
+        # Speculation drafts live as long as the pipeline, shared by its chains
+        self.drafts = DraftStore()
 
     def review_files(
         self,
         file_paths: List[str],
         platform_override: Optional[str] = None,
         depth: Optional[str] = None,
+        on_finding: Optional[Callable[[Finding], None]] = None,
     ) -> ReviewResult:
         """Review multiple files and aggregate results.
 
@@ -51,6 +67,38 @@ class ReviewPipeline:
             file_paths: List of file paths to review
             platform_override: Optional platform override for all files
             depth: Review depth (defaults to config)
+            on_finding: Optional callback invoked for each finding as soon
+                as it is found, before findings are synthesized and
+                deduplicated
+
+        Returns:
+            Aggregated ReviewResult
+
+        Raises:
+            ReviewError: If review fails
+        """
+        return asyncio.run(
+            self.areview_files(file_paths, platform_override, depth, on_finding)
+        )
+
+    async def areview_files(
+        self,
+        file_paths: List[str],
+        platform_override: Optional[str] = None,
+        depth: Optional[str] = None,
+        on_finding: Optional[Callable[[Finding], None]] = None,
+    ) -> ReviewResult:
+        """Review multiple files concurrently and aggregate results.
+
+        Up to review.max_concurrency files are reviewed at once.
+
+        Args:
+            file_paths: List of file paths to review
+            platform_override: Optional platform override for all files
+            depth: Review depth (defaults to config)
+            on_finding: Optional callback invoked for each finding as soon
+                as it is found, before findings are synthesized and
+                deduplicated
 
         Returns:
             Aggregated ReviewResult
@@ -63,10 +111,10 @@ class ReviewPipeline:
 
         depth = depth or self.config.review.depth
 
-        logger.info(f"Starting review of {len(file_paths)} file(s) at depth '{depth}'")
+        logger.info("Starting review of %d file(s) at depth '%s'", len(file_paths), depth)
 
-        # Read all files
-        file_contents = self.file_reader.read_files(file_paths)
+        # Read all files; every file is needed before reviews are grouped
+        file_contents = await self.file_reader.aread_files(file_paths)
 
         # Filter out failed reads
         valid_files = {
@@ -78,26 +126,38 @@ class ReviewPipeline:
         if not valid_files:
             raise ReviewError("No valid files could be read")
 
-        logger.info(f"Successfully read {len(valid_files)}/{len(file_paths)} files")
+        logger.info("Successfully read %d/%d files", len(valid_files), len(file_paths))
+
+        targets = [
+            (file_path, *self._prepare_file(file_path, content, platform_override))
+            for file_path, content in valid_files.items()
+        ]
+        # Copies of a file (vendored modules, generated code) are reviewed once
+        results = await self._areview_unique(
+            targets,
+            [
+                ResultCache.make_key(platform, language_for(file_path), code)
+                for file_path, code, platform in targets
+            ],
+            depth,
+            on_finding,
+        )
 
-        # Review each file
         all_findings = []
         platforms_found = set()
 
-        for file_path, content in valid_files.items():
-            try:
-                result = self._review_single_file(
-                    file_path, content, platform_override, depth
-                )
-                all_findings.extend(result.findings)
-                if result.platform:
-                    platforms_found.add(result.platform)
-            except ReviewError as e:
-                logger.warning(f"Failed to review {file_path}: {e}")
+        for (file_path, code, _), result in zip(targets, results):
+            all_findings.extend(self._truncation_findings(file_path, code))
+            if isinstance(result, ReviewError):
+                logger.warning(f"Failed to review {file_path}: {result}")
                 # Continue with other files
                 all_findings.append(
-                    self._create_error_finding(file_path, str(e))
+                    self._create_error_finding(file_path, str(result))
                 )
+                continue
+            all_findings.extend(result.findings)
+            if result.platform:
+                platforms_found.add(result.platform)
 
         # Aggregate results
         return self._aggregate_results(
@@ -111,6 +171,7 @@ class ReviewPipeline:
         file_changes: Dict[str, str],
         platform_override: Optional[str] = None,
         depth: Optional[str] = None,
+        on_finding: Optional[Callable[[Finding], None]] = None,
     ) -> ReviewResult:
         """Review git diff changes.
 
@@ -118,6 +179,36 @@ class ReviewPipeline:
             file_changes: Dictionary mapping file paths to diff patches
             platform_override: Optional platform override
             depth: Review depth (defaults to config)
+            on_finding: Optional callback invoked for each finding as soon
+                as it is found, before findings are synthesized and
+                deduplicated
+
+        Returns:
+            ReviewResult with findings from diff review
+
+        Raises:
+            ReviewError: If review fails
+        """
+        return asyncio.run(
+            self.areview_diff(file_changes, platform_override, depth, on_finding)
+        )
+
+    async def areview_diff(
+        self,
+        file_changes: Dict[str, str],
+        platform_override: Optional[str] = None,
+        depth: Optional[str] = None,
+        on_finding: Optional[Callable[[Finding], None]] = None,
+    ) -> ReviewResult:
+        """Review git diff changes, reviewing files concurrently.
+
+        Args:
+            file_changes: Dictionary mapping file paths to diff patches
+            platform_override: Optional platform override
+            depth: Review depth (defaults to config)
+            on_finding: Optional callback invoked for each finding as soon
+                as it is found, before findings are synthesized and
+                deduplicated
 
         Returns:
             ReviewResult with findings from diff review
@@ -130,39 +221,55 @@ class ReviewPipeline:
 
         depth = depth or self.config.review.depth
 
-        logger.info(f"Starting diff review of {len(file_changes)} file(s) at depth '{depth}'")
+        logger.info("Starting diff review of %d file(s) at depth '%s'", len(file_changes), depth)
 
-        all_findings = []
+        targets = []
         platforms_found = set()
-        files_reviewed = 0
 
         for file_path, patch in file_changes.items():
-            try:
-                # Detect platform from file path
-                platform, _, _ = self.detector.detect(
-                    file_path, manual_platform=platform_override
-                )
-
-                if not platform:
-                    logger.debug(f"Could not detect platform for {file_path}, skipping")
-                    continue
-
-                platforms_found.add(platform)
+            # Detect platform from file path
+            platform, _, _ = self.detector.detect(
+                file_path, manual_platform=platform_override
+            )
+
+            if not platform:
+                logger.debug("Could not detect platform for %s, skipping", file_path)
+                continue
+
+            platforms_found.add(platform)
+            targets.append((file_path, patch, platform))
+
+        # Identical hunks in several files (version bumps, copied boilerplate)
+        # are reviewed once
+        inputs = [
+            (file_path, self._prepare_diff(file_path, patch, platform), platform)
+            for file_path, patch, platform in targets
+        ]
+        results = await self._areview_unique(
+            inputs,
+            [
+                ResultCache.make_key(platform, language_for(file_path), _patch_body(patch))
+                for file_path, patch, platform in targets
+            ],
+            depth,
+            on_finding,
+        )
 
-                # Review the diff patch
-                result = self._review_diff_content(
-                    file_path, patch, platform, depth
-                )
-                all_findings.extend(result.findings)
-                files_reviewed += 1
+        all_findings = []
+        files_reviewed = 0
 
-            except ReviewError as e:
-                logger.warning(f"Failed to review diff for {file_path}: {e}")
+        for (file_path, review_input, _), result in zip(inputs, results):
+            all_findings.extend(self._truncation_findings(file_path, review_input))
+            if isinstance(result, ReviewError):
+                logger.warning(f"Failed to review diff for {file_path}: {result}")
                 all_findings.append(
-                    self._create_error_finding(file_path, str(e))
+                    self._create_error_finding(file_path, str(result))
                 )
+                continue
+            all_findings.extend(result.findings)
+            files_reviewed += 1
 
-        logger.info(f"Successfully reviewed {files_reviewed}/{len(file_changes)} files")
+        logger.info("Successfully reviewed %d/%d files", files_reviewed, len(file_changes))
 
         return self._aggregate_results(
             all_findings,
@@ -170,91 +277,341 @@ class ReviewPipeline:
             files_reviewed,
         )
 
-    def _review_single_file(
+    async def _areview_unique(
         self,
-        file_path: str,
-        content: str,
-        platform_override: Optional[str],
+        targets: List[Tuple[str, str, str]],
+        keys: List[str],
         depth: str,
-    ) -> ReviewResult:
-        """Review a single file with full content.
+        on_finding: Optional[Callable[[Finding], None]] = None,
+    ) -> List[Any]:
+        """Review targets once per distinct key and copy results to duplicates.
 
         Args:
-            file_path: Path to file
-            content: File content
-            platform_override: Platform override
+            targets: (file path, review input, platform) per file
+            keys: Content key per target; equal keys mean equal reviews
             depth: Review depth
+            on_finding: Optional callback for findings of reviewed targets;
+                copies made for duplicates are not reported again
 
         Returns:
-            ReviewResult for this file
+            ReviewResult or ReviewError per target, in input order, with
+            copied findings pointing at their own file
         """
-        # Detect platform
-        platform, confidence, _ = self.detector.detect(
-            file_path, content, manual_platform=platform_override
+        groups: Dict[str, List[int]] = {}
+        for index, key in enumerate(keys):
+            groups.setdefault(key, []).append(index)
+
+        unique_results = await self._areview_targets(
+            [targets[group[0]] for group in groups.values()], depth, on_finding
         )
 
-        if not platform:
-            platform = "backend"  # Default fallback
-            logger.debug(f"Using default platform 'backend' for {file_path}")
+        results: List[Any] = [None] * len(targets)
+        for group, result in zip(groups.values(), unique_results):
+            results[group[0]] = result
+            for index in group[1:]:
+                results[index] = (
+                    result
+                    if isinstance(result, ReviewError)
+                    else _retarget(result, targets[index][0])
+                )
+        if len(groups) < len(targets):
+            logger.info(
+                "Reused reviews of identical inputs for %d file(s)", len(targets) - len(groups)
+            )
+        return results
 
-        logger.debug(f"Reviewing {file_path} as {platform} (confidence: {confidence:.2%})")
+    async def _agather_limited(self, calls: List[Awaitable[ReviewResult]]) -> List[Any]:
+        """Await per-file reviews concurrently, at most max_concurrency at once.
 
-        # Get platform chain
-        platform_chain = get_chain(platform, self.llm_client, depth)
+        Args:
+            calls: Per-file review coroutines
+
+        Returns:
+            ReviewResult or ReviewError per call, in input order
 
-        # Execute platform review
-        platform_result = platform_chain.execute(content, file_path)
+        Raises:
+            Exception: Any error other than ReviewError raised by a review
+        """
+        semaphore = asyncio.Semaphore(self.config.review.max_concurrency)
 
-        # Execute universal review (for cross-cutting concerns)
-        universal_chain = UniversalReviewChain(self.llm_client, depth)
-        universal_result = universal_chain.execute(content, file_path)
+        async def _limited(call: Awaitable[ReviewResult]) -> ReviewResult:
+            async with semaphore:
+                return await call
 
-        # Synthesize results
-        final_result = self.synthesis_chain.synthesize(
-            platform_result, universal_result
+        results = await asyncio.gather(
+            *(_limited(call) for call in calls), return_exceptions=True
         )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, ReviewError):
+                raise result
+        return results
+
+    def _make_chains(self, platform: str, depth: str) -> Tuple[Any, UniversalReviewChain]:
+        """Get the platform and universal chains for one file.
+
+        Args:
+            platform: Platform name
+            depth: Review depth
+
+        Returns:
+            (platform chain, universal chain) sharing the stage cache
+        """
+        return self._chain_for(platform, depth), self._chain_for("universal", depth)
 
-        return final_result
+    def _chain_for(self, platform: str, depth: str) -> Any:
+        """Return the shared chain for a platform and depth, creating it once.
 
-    def _review_diff_content(
+        Args:
+            platform: Platform name, or "universal" for the universal chain
+            depth: Review depth
+
+        Returns:
+            Chain configured with the current cache and review settings
+        """
+        chain = self._chains.get((platform, depth))
+        if chain is None:
+            if platform == "universal":
+                chain = UniversalReviewChain(self.llm_client, depth)
+            else:
+                chain = get_chain(platform, self.llm_client, depth)
+            self._chains[(platform, depth)] = chain
+        return self._configure_chain(chain)
+
+    def _configure_chain(self, chain: Any) -> Any:
+        """Apply the pipeline's cache and review settings to a chain.
+
+        Args:
+            chain: Review chain
+
+        Returns:
+            The same chain
+        """
+        chain.result_cache = self.stage_cache
+        chain.fused = self.config.review.single_pass
+        chain.structural_cache = self.config.review.structural_cache
+        chain.speculative = self.config.review.speculative
+        chain.drafts = self.drafts
+        return chain
+
+    async def _areview_targets(
+        self,
+        targets: List[Tuple[str, str, str]],
+        depth: str,
+        on_finding: Optional[Callable[[Finding], None]] = None,
+    ) -> List[Any]:
+        """Review prepared inputs, one platform and universal review each.
+
+        With review.batch_universal set, the universal reviews of all
+        targets run as one batch so several files share each prompt; with
+        review.batch_platform set, the platform reviews are batched the
+        same way, one batch per platform.
+
+        Args:
+            targets: (file path, review input, platform) per file
+            depth: Review depth
+            on_finding: Optional callback invoked for each finding
+
+        Returns:
+            ReviewResult or ReviewError per target, in input order
+        """
+        review = self.config.review
+        if not (review.batch_universal or review.batch_platform) or len(targets) < 2:
+            return await self._agather_limited(
+                [
+                    self._areview_content(content, file_path, platform, depth, on_finding)
+                    for file_path, content, platform in targets
+                ]
+            )
+
+        items = [(content, file_path) for file_path, content, _ in targets]
+        universal_chain = self._chain_for("universal", depth)
+        universal_task = asyncio.ensure_future(
+            self._abatch_chain(universal_chain, items, on_finding)
+            if review.batch_universal
+            else self._agather_limited(
+                [
+                    universal_chain.aexecute(content, file_path, on_finding=on_finding)
+                    for content, file_path in items
+                ]
+            )
+        )
+        try:
+            if review.batch_platform:
+                platform_results = await self._abatch_platforms(targets, depth, on_finding)
+            else:
+                platform_results = await self._agather_limited(
+                    [
+                        self._chain_for(platform, depth).aexecute(
+                            content, file_path, on_finding=on_finding
+                        )
+                        for file_path, content, platform in targets
+                    ]
+                )
+        except BaseException:
+            universal_task.cancel()
+            raise
+        universal_results: List[Any] = await universal_task
+
+        results: List[Any] = []
+        for platform_result, universal_result in zip(platform_results, universal_results):
+            if isinstance(platform_result, ReviewError):
+                results.append(platform_result)
+            elif isinstance(universal_result, ReviewError):
+                results.append(universal_result)
+            else:
+                results.append(self.synthesis_chain.synthesize(platform_result, universal_result))
+        return results
+
+    async def _abatch_platforms(
+        self,
+        targets: List[Tuple[str, str, str]],
+        depth: str,
+        on_finding: Optional[Callable[[Finding], None]] = None,
+    ) -> List[Any]:
+        """Run the platform reviews as one batch per platform.
+
+        Args:
+            targets: (file path, review input, platform) per file
+            depth: Review depth
+            on_finding: Optional callback invoked for each finding
+
+        Returns:
+            ReviewResult or ReviewError per target, in input order
+        """
+        groups: Dict[str, List[int]] = {}
+        for index, (_, _, platform) in enumerate(targets):
+            groups.setdefault(platform, []).append(index)
+
+        batches = await asyncio.gather(
+            *(
+                self._abatch_chain(
+                    self._chain_for(platform, depth),
+                    [(targets[index][1], targets[index][0]) for index in indices],
+                    on_finding,
+                )
+                for platform, indices in groups.items()
+            )
+        )
+
+        results: List[Any] = [None] * len(targets)
+        for indices, batch in zip(groups.values(), batches):
+            for index, result in zip(indices, batch):
+                results[index] = result
+        return results
+
+    async def _abatch_chain(
+        self,
+        chain: Any,
+        items: List[Tuple[str, str]],
+        on_finding: Optional[Callable[[Finding], None]] = None,
+    ) -> List[Any]:
+        """Review files with one chain as a batch, per file if the batch fails.
+
+        Findings of a batch are reported once the whole batch completes.
+
+        Args:
+            chain: Review chain
+            items: (review input, file path) per file
+            on_finding: Optional callback invoked for each finding
+
+        Returns:
+            ReviewResult or ReviewError per item, in input order
+        """
+        try:
+            results: List[Any] = await chain.aexecute_batch(
+                items, max_concurrency=self.config.review.max_concurrency
+            )
+        except ReviewError as e:
+            logger.warning(f"Batched review failed, reviewing per file: {e}")
+            return await self._agather_limited(
+                [
+                    chain.aexecute(content, file_path, on_finding=on_finding)
+                    for content, file_path in items
+                ]
+            )
+        if on_finding is not None:
+            for result in results:
+                if isinstance(result, ReviewResult):
+                    for finding in result.findings:
+                        on_finding(finding)
+        return results
+
+    async def _areview_content(
         self,
+        content: str,
         file_path: str,
-        patch: str,
         platform: str,
         depth: str,
+        on_finding: Optional[Callable[[Finding], None]] = None,
     ) -> ReviewResult:
-        """Review a diff patch for a file.
+        """Run the platform and universal reviews concurrently and synthesize them.
+
+        The two chains share no inputs, so their LLM calls overlap.
 
         Args:
+            content: Review input (file content or diff context)
             file_path: Path to file
-            patch: Git diff patch
-            platform: Detected platform
+            platform: Platform name
             depth: Review depth
+            on_finding: Optional callback invoked for each finding
 
         Returns:
-            ReviewResult for this diff
+            Synthesized ReviewResult
         """
-        logger.debug(f"Reviewing diff for {file_path} as {platform}")
+        platform_chain, universal_chain = self._make_chains(platform, depth)
+        platform_result, universal_result = await asyncio.gather(
+            platform_chain.aexecute(content, file_path, on_finding=on_finding),
+            universal_chain.aexecute(content, file_path, on_finding=on_finding),
+        )
 
-        # Create a specialized prompt for diff review
-        diff_context = self._create_diff_context(patch, file_path)
+        # Synthesize results
+        return self.synthesis_chain.synthesize(platform_result, universal_result)
+
+    def _prepare_file(
+        self, file_path: str, content: str, platform_override: Optional[str]
+    ) -> Tuple[str, str]:
+        """Detect a file's platform and prepare its content for review.
 
-        # Get platform chain
-        platform_chain = get_chain(platform, self.llm_client, depth)
+        Args:
+            file_path: Path to file
+            content: File content
+            platform_override: Platform override
 
-        # Execute review with diff context
-        platform_result = platform_chain.execute(diff_context, file_path)
+        Returns:
+            (review input, platform)
+        """
+        # Detect platform
+        platform, confidence, _ = self.detector.detect(
+            file_path, content, manual_platform=platform_override
+        )
 
-        # Execute universal review
-        universal_chain = UniversalReviewChain(self.llm_client, depth)
-        universal_result = universal_chain.execute(diff_context, file_path)
+        if not platform:
+            platform = "backend"  # Default fallback
+            logger.debug("Using default platform 'backend' for %s", file_path)
 
-        # Synthesize results
-        final_result = self.synthesis_chain.synthesize(
-            platform_result, universal_result
+        logger.debug(
+            "Reviewing %s as %s (confidence: %.2f%%)", file_path, platform, confidence * 100
         )
 
-        return final_result
+        code = prepare(content, self.config.review.code_token_budget)
+        return code, platform
+
+    def _prepare_diff(self, file_path: str, patch: str, platform: str) -> str:
+        """Prepare a diff patch for review.
+
+        Args:
+            file_path: Path to file
+            patch: Git diff patch
+            platform: Detected platform
+
+        Returns:
+            Review input for this diff
+        """
+        logger.debug("Reviewing diff for %s as %s", file_path, platform)
+
+        # Create a specialized prompt for diff review
+        patch = prepare(patch, self.config.review.code_token_budget, is_diff=True)
+        return self._create_diff_context(patch, file_path)
 
     def _create_diff_context(self, patch: str, file_path: str) -> str:
         """Create review context from diff patch.
@@ -299,11 +656,9 @@ Please review the above changes for:
         Returns:
             Aggregated ReviewResult
         """
-        # Sort by severity and file
-        from shield_pr.chains.synthesis_chain import SynthesisChain
-
-        synthesis = SynthesisChain()
-        prioritized = synthesis._prioritize(findings)
+        # Sort by severity and file; per-file results arrive already sorted,
+        # and sorted() merges those runs instead of re-sorting from scratch
+        prioritized = self.synthesis_chain._prioritize(findings)
 
         # Generate summary
         summary = self._generate_aggregate_summary(
@@ -342,9 +697,8 @@ Please review the above changes for:
         if not findings:
             return f"Reviewed {files_count} file(s) across {len(set(platforms))} platform(s). No issues found."
 
-        high = sum(1 for f in findings if f.severity == "HIGH")
-        medium = sum(1 for f in findings if f.severity == "MEDIUM")
-        low = sum(1 for f in findings if f.severity == "LOW")
+        counts = Counter(f.severity for f in findings)
+        high, medium, low = counts["HIGH"], counts["MEDIUM"], counts["LOW"]
 
         parts = [f"Reviewed {files_count} file(s)."]
 
@@ -384,6 +738,36 @@ Please review the above changes for:
 
         return round(base, 2)
 
+    def _truncation_findings(self, file_path: str, review_input: str) -> List[Finding]:
+        """Report review input cut to fit review.code_token_budget.
+
+        Args:
+            file_path: File the input was prepared from
+            review_input: Prepared review input
+
+        Returns:
+            One finding naming the unreviewed lines, or none if nothing was cut
+        """
+        cut = truncated_lines(review_input)
+        if not cut:
+            return []
+        logger.warning(
+            "Review input for %s exceeded the token budget; %d line(s) not reviewed",
+            file_path,
+            cut,
+        )
+        return [
+            Finding(
+                severity="LOW",
+                category="review",
+                file_path=file_path,
+                line_number=None,
+                description=f"Only part of this file was reviewed: the last {cut} line(s) "
+                "exceeded the review token budget.",
+                suggestion="Raise review.code_token_budget or review this file on its own.",
+            )
+        ]
+
     def _create_error_finding(self, file_path: str, error: str) -> Any:
         """Create a finding for review errors.
 
@@ -404,3 +788,17 @@ Please review the above changes for:
             description=f"Could not review file: {error}",
             suggestion="Check file format and try again.",
         )
+
+
+def _patch_body(patch: str) -> str:
+    """Return a patch from its first hunk on, dropping per-file header lines."""
+    if patch.startswith("@@"):
+        return patch
+    start = patch.find("\n@@")
+    return patch[start + 1:] if start != -1 else patch
+
+
+def _retarget(result: ReviewResult, file_path: str) -> ReviewResult:
+    """Copy a file's review result with its findings moved to another file."""
+    findings = [finding.model_copy(update={"file_path": file_path}) for finding in result.findings]
+    return result.model_copy(update={"findings": findings})
@@ -73,8 +73,8 @@ def aggregate_scores(scores: Dict[str, float]) -> Tuple[Optional[str], float]:
     if not scores:
         return (None, 0.0)
 
-    platform = max(scores.items(), key=lambda x: x[1])
-    return (platform[0], platform[1])
+    platform = max(scores, key=scores.__getitem__)
+    return (platform, scores[platform])
 
 
 def should_use_llm_fallback(confidence: float, threshold: float = 0.5) -> bool:
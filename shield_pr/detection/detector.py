@@ -3,6 +3,7 @@
 Coordinates extension-based, content-based, and LLM-based detection.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -11,6 +12,26 @@ from .confidence import calculate_confidence, should_use_llm_fallback
 from .file_analyzer import FileAnalyzer
 from .patterns import is_valid_platform
 
+# Upper bound on threads used to read and analyze files in detect_batch
+MAX_DETECT_WORKERS = 32
+
+# Bytes read from disk for content analysis; imports and keywords sit near the top
+CONTENT_PEEK_BYTES = 16384
+
+
+def _peek_file(file_path: str, limit: int = CONTENT_PEEK_BYTES) -> str:
+    """Read the start of a file as text.
+
+    Args:
+        file_path: Path to the file
+        limit: Maximum number of bytes to read
+
+    Returns:
+        Up to limit bytes of the file, decoded as UTF-8 ignoring errors
+    """
+    with open(file_path, "rb") as f:
+        return f.read(limit).decode("utf-8", errors="ignore")
+
 
 class PlatformDetector:
     """Main platform detection orchestrator."""
@@ -38,7 +59,7 @@ class PlatformDetector:
         # Manual override takes precedence
         if manual_platform:
             if is_valid_platform(manual_platform):
-                logger.debug(f"Using manual platform: {manual_platform}")
+                logger.debug("Using manual platform: %s", manual_platform)
                 return (manual_platform, 1.0, "Manual selection via --platform flag")
             else:
                 logger.warning(f"Invalid manual platform: {manual_platform}")
@@ -47,8 +68,9 @@ class PlatformDetector:
         # Extension-based detection
         ext_platform, ext_confidence = self.analyzer.detect_by_extension(file_path)
         logger.debug(
-            f"Extension detection: platform={ext_platform}, "
-            f"confidence={ext_confidence:.2%}"
+            "Extension detection: platform=%s, confidence=%.2f%%",
+            ext_platform,
+            ext_confidence * 100,
         )
 
         # Content-based detection
@@ -60,33 +82,38 @@ class PlatformDetector:
                 content
             )
             logger.debug(
-                f"Content detection: platform={content_platform}, "
-                f"confidence={content_confidence:.2%}"
+                "Content detection: platform=%s, confidence=%.2f%%",
+                content_platform,
+                content_confidence * 100,
             )
         elif ext_confidence < 0.8:
             # Read file for content analysis if extension is ambiguous
             try:
-                file_content = Path(file_path).read_text(encoding="utf-8", errors="ignore")
+                file_content = _peek_file(file_path)
                 content_platform, content_confidence = (
                     self.analyzer.detect_by_content(file_content)
                 )
                 logger.debug(
-                    f"Content detection: platform={content_platform}, "
-                    f"confidence={content_confidence:.2%}"
+                    "Content detection: platform=%s, confidence=%.2f%%",
+                    content_platform,
+                    content_confidence * 100,
                 )
             except Exception as e:
-                logger.debug(f"Failed to read file for content analysis: {e}")
+                logger.debug("Failed to read file for content analysis: %s", e)
 
         # Calculate final result
         platform, confidence, reasoning = calculate_confidence(
             ext_platform, ext_confidence, content_platform, content_confidence
         )
 
+        # %-style arguments are only formatted if a handler emits the record
         logger.info(
-            f"Detection result for {Path(file_path).name}: "
-            f"platform={platform}, confidence={confidence:.2%}"
+            "Detection result for %s: platform=%s, confidence=%.2f%%",
+            Path(file_path).name,
+            platform,
+            confidence * 100,
         )
-        logger.debug(f"Reasoning: {reasoning}")
+        logger.debug("Reasoning: %s", reasoning)
 
         return (platform, confidence, reasoning)
 
@@ -95,6 +122,9 @@ class PlatformDetector:
     ) -> dict[str, Tuple[Optional[str], float, str]]:
         """Detect platforms for multiple files.
 
+        Files are detected on a thread pool so that reads of ambiguous files
+        overlap instead of blocking one after another.
+
         Args:
             files: List of file paths
             manual_platform: Optional manual platform override
@@ -102,10 +132,18 @@ class PlatformDetector:
         Returns:
             Dictionary mapping file paths to detection results
         """
-        results = {}
-        for file_path in files:
-            results[file_path] = self.detect(file_path, manual_platform=manual_platform)
-        return results
+        if len(files) <= 1:
+            return {
+                file_path: self.detect(file_path, manual_platform=manual_platform)
+                for file_path in files
+            }
+
+        with ThreadPoolExecutor(max_workers=min(MAX_DETECT_WORKERS, len(files))) as executor:
+            detections = executor.map(
+                lambda file_path: self.detect(file_path, manual_platform=manual_platform),
+                files,
+            )
+            return dict(zip(files, detections))
 
     def get_detection_summary(
         self, results: dict[str, Tuple[Optional[str], float, str]]
@@ -56,8 +56,8 @@ class FileAnalyzer:
             return (platform, weights[platform])
 
         # Multiple platforms, return highest weight
-        platform_tuple = max(weights.items(), key=lambda x: x[1])
-        return (platform_tuple[0], platform_tuple[1])
+        platform = max(weights, key=weights.__getitem__)
+        return (platform, weights[platform])
 
     def detect_by_content(self, content: str) -> Tuple[Optional[str], float]:
         """Detect platform from file content.
@@ -96,8 +96,8 @@ class FileAnalyzer:
             return (None, 0.0)
 
         # Return platform with highest score
-        platform_tuple = max(scores.items(), key=lambda x: x[1])
-        return (platform_tuple[0], min(platform_tuple[1], 1.0))  # Cap at 1.0
+        platform = max(scores, key=scores.__getitem__)
+        return (platform, min(scores[platform], 1.0))  # Cap at 1.0
 
     def _analyze_imports(self, content: str) -> Dict[str, float]:
         """Analyze import statements for platform detection.
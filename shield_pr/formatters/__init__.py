@@ -4,13 +4,17 @@ This module provides formatters for transforming ReviewResult objects
 into various output formats including Markdown, GitHub, GitLab, Slack, and JSON.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from shield_pr.formatters.base import BaseFormatter
 from shield_pr.formatters.markdown import MarkdownFormatter
 from shield_pr.formatters.github import GitHubFormatter
 from shield_pr.formatters.gitlab import GitLabFormatter
 from shield_pr.formatters.slack import SlackFormatter
 from shield_pr.formatters.json_formatter import JSONFormatter
-from shield_pr.formatters.rich_renderer import RichRenderer
+
+if TYPE_CHECKING:
+    from shield_pr.formatters.rich_renderer import RichRenderer
 
 __all__ = [
     "BaseFormatter",
@@ -23,6 +27,16 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Import RichRenderer on first access; piped and file output never need rich."""
+    if name == "RichRenderer":
+        from shield_pr.formatters.rich_renderer import RichRenderer
+
+        globals()[name] = RichRenderer
+        return RichRenderer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_formatter(format_type: str = "markdown") -> BaseFormatter:
     """Factory function to get formatter by type.
 
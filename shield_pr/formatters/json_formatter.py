@@ -1,9 +1,10 @@
 """JSON formatter for code review results."""
 
-import json
 from datetime import datetime
 from typing import Any
 
+import orjson
+
 from shield_pr.formatters.base import BaseFormatter
 from shield_pr.models.finding import Finding
 from shield_pr.models.review_result import ReviewResult
@@ -32,7 +33,7 @@ class JSONFormatter(BaseFormatter):
             "summary": result.summary,
             "metadata": self._build_metadata(),
         }
-        return json.dumps(data, indent=2)
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
 
     def _serialize_finding(self, finding: Finding) -> dict[str, Any]:
         """Serialize finding to dict for JSON output.
@@ -1,7 +1,9 @@
 """Rich terminal renderer for code review results."""
 
 import sys
-from typing import Optional
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -246,3 +248,36 @@ class RichRenderer:
             console=self.console,
         )
         return progress
+
+    @contextmanager
+    def finding_progress(
+        self, message: str = "Analyzing code..."
+    ) -> Iterator[Callable[[Finding], None]]:
+        """Show a spinner counting findings while a review reports them.
+
+        Args:
+            message: Progress message to display
+
+        Yields:
+            Callback to pass as the review's on_finding
+        """
+        counts: Counter[str] = Counter()
+        progress = self.render_progress(message)
+        task = progress.add_task(message, total=None)
+
+        def _on_finding(finding: Finding) -> None:
+            counts[finding.severity] += 1
+            breakdown = ", ".join(
+                f"{counts[severity]} {severity}"
+                for severity in self.SEVERITY_COLORS
+                if counts[severity]
+            )
+            progress.update(
+                task,
+                description=(
+                    f"{message} {sum(counts.values())} issue(s) reported so far ({breakdown})"
+                ),
+            )
+
+        with progress:
+            yield _on_finding
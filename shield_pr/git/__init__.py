@@ -9,12 +9,14 @@ from shield_pr.git.filter_patterns import default_ignore_patterns
 from shield_pr.git.models import FileChange, DiffChange, ParsedDiff
 from shield_pr.git.pr_helpers import PRMetadata
 from shield_pr.git.pr_fetcher import PRFetcher
+from shield_pr.git.pr_cache import PRDiffCache
 
 __all__ = [
     'GitRepository',
     'DiffParser',
     'ParsedDiff',
     'PRFetcher',
+    'PRDiffCache',
     'PRMetadata',
     'DiffFilter',
     'default_ignore_patterns',
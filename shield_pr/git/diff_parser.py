@@ -3,7 +3,7 @@ Parse unified diff format into structured changes.
 """
 
 import re
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from shield_pr.git.models import ParsedDiff, DiffChange
 
@@ -41,23 +41,33 @@ class DiffParser:
         Returns:
             List of ParsedDiff objects.
         """
-        self.reset()
-
         if not diff_text or not diff_text.strip():
+            self.reset()
             return []
 
-        results = []
-        current_diff = None
-        lines = diff_text.split('\n')
+        return list(self.iter_parse(diff_text.split('\n')))
 
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+    def iter_parse(self, lines: Iterable[str]) -> Iterator["ParsedDiff"]:
+        """
+        Parse diff lines lazily, yielding each file as soon as it ends.
+
+        Only the file being parsed is held in memory, so a large streamed
+        diff never has to be materialized as one string.
+
+        Args:
+            lines: Unified diff lines without trailing newlines.
 
+        Yields:
+            ParsedDiff objects in diff order.
+        """
+        self.reset()
+        current_diff = None
+
+        for line in lines:
             # File headers
             if line.startswith('---'):
                 if current_diff and current_diff.added:
-                    results.append(current_diff)
+                    yield current_diff
                 current_diff = ParsedDiff(
                     file_path="",
                     added=[],
@@ -84,13 +94,9 @@ class DiffParser:
             elif self.in_hunk and current_diff:
                 self._parse_diff_line(line, current_diff)
 
-            i += 1
-
-        # Append last diff
+        # Yield last diff
         if current_diff and current_diff.file_path:
-            results.append(current_diff)
-
-        return results
+            yield current_diff
 
     def parse_single_file(self, diff_text: str) -> "ParsedDiff | None":
         """
@@ -2,7 +2,9 @@
 Pattern matching for file filtering.
 """
 
-from fnmatch import fnmatch
+import os
+import re
+from fnmatch import fnmatch, translate
 from pathlib import Path
 from typing import Optional
 
@@ -25,20 +27,50 @@ class PatternMatcher:
         if respect_gitignore:
             self._load_gitignore()
 
+        self._compiled = self._compile(self.patterns + self._gitignore_patterns)
+
     def matches(self, file_path: str) -> bool:
-        """Check if file path matches any pattern."""
-        # Check user patterns
-        for pattern in self.patterns:
-            if self._match_pattern(file_path, pattern):
-                return True
+        """Check if file path matches any pattern (user or gitignore)."""
+        parts = file_path.split('/')
+        suffixes = [os.path.normcase('/'.join(parts[i:])) for i in range(len(parts))]
 
-        # Check gitignore
-        for pattern in self._gitignore_patterns:
-            if self._match_pattern(file_path, pattern):
-                return True
+        for depth, regex in self._compiled:
+            # Same suffixes _match_pattern tries for a pattern of this depth
+            for subpath in suffixes[:max(len(parts) - depth, 0) + 1]:
+                if regex.match(subpath):
+                    return True
 
         return False
 
+    @staticmethod
+    def _compile(patterns: list[str]) -> list[tuple[int, re.Pattern[str]]]:
+        """
+        Combine patterns into one regex per pattern depth.
+
+        Equivalent to calling _match_pattern for every pattern, but each
+        path suffix is tested once per depth instead of once per pattern.
+
+        Args:
+            patterns: Glob patterns (negations are skipped, as in _match_pattern).
+
+        Returns:
+            (number of path segments, compiled alternation) pairs.
+        """
+        by_depth: dict[int, list[str]] = {}
+        for pattern in patterns:
+            if pattern.endswith('/'):
+                pattern = pattern + '**'
+            if pattern.startswith('!'):
+                continue
+            by_depth.setdefault(len(pattern.split('/')), []).append(
+                translate(os.path.normcase(pattern))
+            )
+
+        return [
+            (depth, re.compile('|'.join(f'(?:{regex})' for regex in regexes)))
+            for depth, regexes in by_depth.items()
+        ]
+
     def _match_pattern(self, file_path: str, pattern: str) -> bool:
         """Match file path against single pattern."""
         if pattern.endswith('/'):
@@ -54,23 +54,15 @@ class DiffFilter:
         if self.max_file_size == 0:
             return False
 
-        full_path = repo_root / file_path
-        if not full_path.exists():
-            return False
-
         try:
-            return full_path.stat().st_size > self.max_file_size
-        except OSError:
+            return (repo_root / file_path).stat().st_size > self.max_file_size
+        except OSError:  # Missing files are not too large
             return False
 
     def is_binary_file(self, file_path: str, repo_root: Path) -> bool:
         """Check if file is binary."""
-        full_path = repo_root / file_path
-        if not full_path.exists():
-            return False
-
         try:
-            with open(full_path, 'rb') as f:
+            with open(repo_root / file_path, 'rb') as f:
                 chunk = f.read(8192)
                 return b'\x00' in chunk
         except (OSError, IOError):
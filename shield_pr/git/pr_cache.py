@@ -0,0 +1,110 @@
+"""
+ETag-indexed on-disk store for downloaded PR diffs.
+"""
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+
+class PRDiffCache:
+    """
+    Remember the last diff downloaded for each PR API URL.
+
+    A SQLite index maps the URL to the response ETag and a body file, so
+    an unchanged PR can be re-fetched with If-None-Match and, on 304,
+    replayed from disk instead of downloaded again.
+    """
+
+    INDEX_NAME = "pr_etags.sqlite"
+
+    def __init__(self, directory: str):
+        """
+        Initialize diff cache.
+
+        Args:
+            directory: Directory holding the index and diff bodies.
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.directory / self.INDEX_NAME), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS etags "
+            "(url TEXT PRIMARY KEY, etag TEXT NOT NULL, body_path TEXT NOT NULL)"
+        )
+        self._db.commit()
+
+    def lookup(self, url: str) -> Optional[tuple[str, Path]]:
+        """
+        Find the cached ETag and body file for a URL.
+
+        Args:
+            url: API URL the diff was fetched from.
+
+        Returns:
+            (etag, body path), or None if nothing usable is cached.
+        """
+        row = self._db.execute(
+            "SELECT etag, body_path FROM etags WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None or not Path(row[1]).is_file():
+            return None
+        return row[0], Path(row[1])
+
+    def body_path(self, url: str) -> Path:
+        """
+        Return where the diff body for a URL is stored.
+
+        Args:
+            url: API URL the diff was fetched from.
+
+        Returns:
+            Path of the body file (may not exist yet).
+        """
+        name = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+        return self.directory / f"{name}.diff"
+
+    def store(self, url: str, etag: str, body_path: Path) -> None:
+        """
+        Record the ETag of a fully written diff body.
+
+        Args:
+            url: API URL the diff was fetched from.
+            etag: ETag header of the response.
+            body_path: File holding the response body.
+        """
+        self._db.execute(
+            "INSERT OR REPLACE INTO etags (url, etag, body_path) VALUES (?, ?, ?)",
+            (url, etag, str(body_path))
+        )
+        self._db.commit()
+
+    def record(self, url: str, etag: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Pass a response body through while saving it for url.
+
+        The entry is only recorded once the stream is fully consumed; an
+        abandoned or failed download leaves the previous entry in place.
+
+        Args:
+            url: API URL the diff is fetched from.
+            etag: ETag header of the response.
+            chunks: Response body chunks.
+
+        Yields:
+            The same chunks, unchanged.
+        """
+        body_path = self.body_path(url)
+        partial_path = body_path.with_suffix(".part")
+        try:
+            with open(partial_path, "wb") as sink:
+                for chunk in chunks:
+                    sink.write(chunk)
+                    yield chunk
+            os.replace(partial_path, body_path)
+            self.store(url, etag, body_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
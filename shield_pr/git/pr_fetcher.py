@@ -2,11 +2,13 @@
 Pull request fetcher for GitHub and GitLab APIs.
 """
 
-from typing import Optional
+import time
+from typing import Iterable, Iterator, Optional
 
 import requests
 
 from shield_pr.core.errors import APIError
+from shield_pr.git.pr_cache import PRDiffCache
 from shield_pr.git.pr_helpers import parse_pr_url, PRMetadata, GITHUB_PATTERN, GITLAB_PATTERN
 
 
@@ -22,16 +24,25 @@ class PRFetcher:
     GITHUB_API = "https://api.github.com/repos/{owner}/{repo}/pulls/{number}"
     GITLAB_API = "https://gitlab.com/api/v4/projects/{owner}%2F{repo}/merge_requests/{number}"
 
-    def __init__(self, token: Optional[str] = None):
+    # Bytes read per chunk when streaming diffs
+    STREAM_CHUNK_SIZE = 65536
+    # Entries requested per page when listing changed files
+    FILES_PAGE_SIZE = 100
+
+    def __init__(self, token: Optional[str] = None, diff_cache: Optional[PRDiffCache] = None):
         """
         Initialize PR fetcher.
 
         Args:
             token: Optional API token for authentication.
+            diff_cache: Optional store enabling conditional re-fetches of diffs.
         """
         self.token = token
+        self.diff_cache = diff_cache
         self.session = requests.Session()
         self.timeout = 30
+        # Epoch seconds until which the API rate limit is known to be exhausted
+        self._rate_limit_reset = 0.0
 
         if token:
             self.session.headers.update({'Authorization': f'Bearer {token}'})
@@ -49,6 +60,70 @@ class PRFetcher:
         else:
             return self._fetch_gitlab_diff(metadata)
 
+    def iter_pr_diff(self, url: str) -> Iterator[str]:
+        """
+        Stream PR diff lines from GitHub/GitLab API.
+
+        GitHub diffs are read from the response in chunks, so the full patch
+        text is never held in memory. GitLab returns changes as one JSON
+        document, which is converted and split as a whole.
+
+        Args:
+            url: PR URL (GitHub or GitLab).
+
+        Yields:
+            Diff lines without trailing newlines.
+        """
+        metadata = self.parse_url(url)
+
+        if metadata.platform == 'github':
+            yield from self._iter_github_diff(metadata)
+        else:
+            yield from self._fetch_gitlab_diff(metadata).split('\n')
+
+    def iter_pr_files(self, url: str) -> Iterator[str]:
+        """
+        List changed file paths page by page, without downloading the diff.
+
+        Used for PRs too large to fetch as one patch. Pages are requested
+        one at a time and only the paths kept, so memory stays bounded by a
+        single page. GitHub lists at most 3000 files per PR.
+
+        Args:
+            url: PR URL (GitHub or GitLab).
+
+        Yields:
+            Changed file paths in API order.
+        """
+        metadata = self.parse_url(url)
+
+        if metadata.platform == 'github':
+            api_url = self.GITHUB_API.format(
+                owner=metadata.owner,
+                repo=metadata.repo,
+                number=metadata.pr_number
+            ) + '/files'
+            path_key = 'filename'
+        else:
+            api_url = self.GITLAB_API.format(
+                owner=metadata.owner,
+                repo=metadata.repo,
+                number=metadata.pr_number
+            ) + '/diffs'
+            path_key = 'new_path'
+
+        page = 1
+        while True:
+            response = self._make_request(
+                f"{api_url}?per_page={self.FILES_PAGE_SIZE}&page={page}"
+            )
+            entries = response.json()
+            for entry in entries:
+                yield entry.get(path_key, '')
+            if len(entries) < self.FILES_PAGE_SIZE:
+                return
+            page += 1
+
     def _fetch_github_diff(self, metadata: PRMetadata) -> str:
         """Fetch diff from GitHub API."""
         api_url = self.GITHUB_API.format(
@@ -61,6 +136,48 @@ class PRFetcher:
         response = self._make_request(api_url, headers=headers)
         return response.text
 
+    def _iter_github_diff(self, metadata: PRMetadata) -> Iterator[str]:
+        """Stream diff lines from GitHub API, replaying unchanged diffs from cache."""
+        api_url = self.GITHUB_API.format(
+            owner=metadata.owner,
+            repo=metadata.repo,
+            number=metadata.pr_number
+        )
+
+        headers = {'Accept': 'application/vnd.github.v3.diff'}
+        cached = self.diff_cache.lookup(api_url) if self.diff_cache else None
+        if cached:
+            headers['If-None-Match'] = cached[0]
+
+        response = self._make_request(api_url, headers=headers, stream=True)
+        if cached and response.status_code == 304:
+            response.close()
+            with open(cached[1], 'rb') as f:
+                chunks = iter(lambda: f.read(self.STREAM_CHUNK_SIZE), b'')
+                yield from self._split_lines(chunks, 'utf-8')
+            return
+
+        chunks = response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE)
+        etag = response.headers.get('ETag')
+        if self.diff_cache and isinstance(etag, str):
+            chunks = self.diff_cache.record(api_url, etag, chunks)
+        try:
+            yield from self._split_lines(chunks, response.encoding or 'utf-8')
+        except requests.RequestException as e:
+            raise APIError(f"Failed to fetch PR: {e}")
+        finally:
+            response.close()
+
+    @staticmethod
+    def _split_lines(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+        """Split a byte stream on newlines and decode each line."""
+        pending = b''
+        for chunk in chunks:
+            *lines, pending = (pending + chunk).split(b'\n')
+            for line in lines:
+                yield line.decode(encoding, errors='replace')
+        yield pending.decode(encoding, errors='replace')
+
     def _fetch_gitlab_diff(self, metadata: PRMetadata) -> str:
         """Fetch diff from GitLab API."""
         api_url = self.GITLAB_API.format(
@@ -83,19 +200,37 @@ class PRFetcher:
 
         return '\n'.join(diffs)
 
-    def _make_request(self, url: str, headers: Optional[dict[str, str]] = None) -> requests.Response:
+    def _make_request(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        stream: bool = False
+    ) -> requests.Response:
         """Make HTTP request with error handling."""
+        if self._rate_limit_reset > time.time():
+            reset_at = time.strftime('%H:%M:%S', time.localtime(self._rate_limit_reset))
+            raise APIError(f"API rate limit exhausted; resets at {reset_at}")
+
         req_headers = {}
         if headers:
             req_headers.update(headers)
 
         try:
-            response = self.session.get(url, headers=req_headers, timeout=self.timeout)
+            response = self.session.get(
+                url, headers=req_headers, timeout=self.timeout, stream=stream
+            )
+            self._track_rate_limit(response)
             response.raise_for_status()
             return response
         except requests.RequestException as e:
             raise APIError(f"Failed to fetch PR: {e}")
 
+    def _track_rate_limit(self, response: requests.Response) -> None:
+        """Remember when an exhausted GitHub rate limit resets."""
+        reset = response.headers.get('x-ratelimit-reset')
+        if response.headers.get('x-ratelimit-remaining') == '0' and isinstance(reset, str):
+            self._rate_limit_reset = float(reset) if reset.isdigit() else 0.0
+
     def get_pr_info(self, url: str) -> dict[str, str | int]:
         """Fetch PR metadata (title, author, etc.)."""
         from shield_pr.git.pr_info import get_pr_info
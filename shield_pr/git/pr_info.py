@@ -31,7 +31,7 @@ def get_pr_info(fetcher: "PRFetcher", url: str) -> dict[str, str | int]:
         return _get_gitlab_info(fetcher, metadata)
 
 
-def _get_github_info(fetcher: PRFetcher, metadata: PRMetadata) -> dict[str, str | int]:
+def _get_github_info(fetcher: "PRFetcher", metadata: "PRMetadata") -> dict[str, str | int]:
     """Fetch PR info from GitHub API."""
     api_url = fetcher.GITHUB_API.format(
         owner=metadata.owner,
@@ -52,7 +52,7 @@ def _get_github_info(fetcher: PRFetcher, metadata: PRMetadata) -> dict[str, str
     }
 
 
-def _get_gitlab_info(fetcher: PRFetcher, metadata: PRMetadata) -> dict[str, str | int]:
+def _get_gitlab_info(fetcher: "PRFetcher", metadata: "PRMetadata") -> dict[str, str | int]:
     """Fetch MR info from GitLab API."""
     api_url = fetcher.GITLAB_API.format(
         owner=metadata.owner,
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Optional
 
 from git import Repo, GitCommandError, InvalidGitRepositoryError
+from git.diff import Diff
 
 from shield_pr.core.errors import GitOperationError
 from shield_pr.git.models import FileChange
@@ -83,6 +84,53 @@ class GitRepository:
         Returns:
             Dict mapping file paths to FileChange objects.
 
+        Raises:
+            GitOperationError: If git operation fails.
+        """
+        return get_file_changes_from_diffs(
+            self._branch_diffs(base_branch, head_branch, create_patch=True)
+        )
+
+    def get_branch_diff_names(
+        self, base_branch: str, head_branch: Optional[str] = None
+    ) -> dict[str, FileChange]:
+        """
+        Get changed files between branches without generating patches.
+
+        Runs git diff --raw, which is much cheaper than building patches
+        for files that may be filtered out.
+
+        Args:
+            base_branch: Base branch to compare against.
+            head_branch: Head branch (default: current branch).
+
+        Returns:
+            Dict mapping file paths to FileChange objects with empty patches.
+
+        Raises:
+            GitOperationError: If git operation fails.
+        """
+        return get_file_changes_from_diffs(
+            self._branch_diffs(base_branch, head_branch, create_patch=False)
+        )
+
+    def _branch_diffs(
+        self,
+        base_branch: str,
+        head_branch: Optional[str],
+        create_patch: bool,
+    ) -> list[Diff]:
+        """
+        Run git diff between branches.
+
+        Args:
+            base_branch: Base branch to compare against.
+            head_branch: Head branch (default: current branch).
+            create_patch: Include patch bodies.
+
+        Returns:
+            GitPython Diff objects.
+
         Raises:
             GitOperationError: If git operation fails.
         """
@@ -90,8 +138,7 @@ class GitRepository:
             base_commit = self.repo.commit(base_branch)
             head_commit = self.repo.commit(head_branch) if head_branch else self.repo.head.commit
 
-            diffs = base_commit.diff(head_commit, create_patch=True, R=True)
-            return get_file_changes_from_diffs(diffs)
+            return base_commit.diff(head_commit, create_patch=create_patch, R=True)
         except GitCommandError as e:
             raise GitOperationError(f"Failed to get branch diff: {e}")
         except ValueError as e:
@@ -1,6 +1,6 @@
 """Review result models for code review output."""
 
-from shield_pr.models.finding import Finding
+from shield_pr.models.finding import Finding, FindingsResponse
 from shield_pr.models.review_result import ReviewResult
 
-__all__ = ["Finding", "ReviewResult"]
+__all__ = ["Finding", "FindingsResponse", "ReviewResult"]
@@ -1,6 +1,6 @@
 """Finding model representing a single review finding."""
 
-from typing import Literal
+from typing import List, Literal
 from pydantic import BaseModel, Field
 
 
@@ -55,3 +55,19 @@ class Finding(BaseModel):
                 "code_snippet": "query = f\"SELECT * FROM users WHERE id = {user_id}\""
             }
         }
+
+
+class FindingsResponse(BaseModel):
+    """Structured response of a single review stage.
+
+    Passed to the provider as the response schema, so the stage prompts
+    no longer need to describe the JSON shape.
+
+    Attributes:
+        findings: Findings reported by the stage (empty if none)
+    """
+
+    findings: List[Finding] = Field(
+        default_factory=list,
+        description="Findings reported for the reviewed file"
+    )
@@ -1,5 +1,6 @@
 """File reader utility for code review operations."""
 
+import asyncio
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -16,6 +17,7 @@ class FileReader:
     """
 
     DEFAULT_MAX_SIZE = 100 * 1024  # 100KB default
+    MAX_CONCURRENT_READS = 32
     ENCODINGS = ["utf-8", "latin-1", "cp1252"]
 
     def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
@@ -94,6 +96,27 @@ class FileReader:
 
         return results
 
+    async def aread_files(self, file_paths: list[str]) -> Dict[str, Optional[str]]:
+        """Read multiple files concurrently on worker threads.
+
+        At most MAX_CONCURRENT_READS files are read at once so disk reads
+        overlap without opening every file in a large change set at once.
+
+        Args:
+            file_paths: List of file paths
+
+        Returns:
+            Dictionary mapping file paths to contents, in input order
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_READS)
+
+        async def _read_one(file_path: str) -> Optional[str]:
+            async with semaphore:
+                return await asyncio.to_thread(self.read_file, file_path)
+
+        contents = await asyncio.gather(*(_read_one(path) for path in file_paths))
+        return dict(zip(file_paths, contents))
+
     def _truncate_content(self, content: str, file_path: str) -> str:
         """Truncate content to max size while preserving structure.
 
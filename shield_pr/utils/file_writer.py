@@ -0,0 +1,23 @@
+"""Atomic file writing for review output."""
+
+import os
+from pathlib import Path
+
+
+def write_text_atomic(file_path: str, text: str) -> None:
+    """Write text to a file so readers never see a partial result.
+
+    The encoded text is written to a sibling temporary file in one call and
+    then renamed over the destination.
+
+    Args:
+        file_path: Destination path
+        text: Content to write (encoded as UTF-8)
+    """
+    path = Path(file_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(text.encode("utf-8"))
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
@@ -1,10 +1,19 @@
 """Unit tests for cache configuration."""
 
+import sqlite3
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from shield_pr.core.cache import clear_cache, setup_cache
+from shield_pr.core.cache import (
+    ResultCache,
+    clear_cache,
+    code_digest,
+    code_shape,
+    content_digest,
+    rename_identifiers,
+    setup_cache,
+)
 
 
 class TestSetupCache:
@@ -27,6 +36,20 @@ class TestSetupCache:
                 setup_cache()
                 mock_set.assert_called_once()
 
+    def test_setup_cache_sqlite(self, tmp_path):
+        """Test sqlite cache creates its database directory."""
+        db_path = tmp_path / "nested" / "llm_cache.db"
+        with patch("shield_pr.core.cache.set_llm_cache") as mock_set:
+            setup_cache("sqlite", str(db_path))
+
+        assert db_path.parent.is_dir()
+        assert type(mock_set.call_args[0][0]).__name__ == "SQLiteCache"
+
+    def test_setup_cache_sqlite_requires_path(self):
+        """Test sqlite cache without a path raises error."""
+        with pytest.raises(ValueError, match="requires a database path"):
+            setup_cache("sqlite")
+
     def test_setup_cache_unsupported_type(self):
         """Test unsupported cache type raises error."""
         with pytest.raises(ValueError, match="Unsupported cache type"):
@@ -57,3 +80,146 @@ class TestClearCache:
                 with patch("shield_pr.core.cache.setup_cache") as mock_setup:
                     clear_cache()
                     mock_setup.assert_called_once()
+
+
+class TestResultCache:
+    """Test content-addressed stage result cache."""
+
+    def test_make_key_is_stable_and_part_sensitive(self):
+        """Test keys depend on every part and their boundaries."""
+        assert ResultCache.make_key("a", "b") == ResultCache.make_key("a", "b")
+        assert ResultCache.make_key("a", "b") != ResultCache.make_key("ab", "")
+
+    def test_get_set_roundtrip(self):
+        """Test stored values are returned."""
+        cache = ResultCache()
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
+        assert cache.get("missing") is None
+
+    def test_lru_eviction(self):
+        """Test oldest entry is evicted when full."""
+        cache = ResultCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+
+    def test_sqlite_persistence(self, tmp_path):
+        """Test values survive across cache instances with a path."""
+        db = str(tmp_path / "cache" / "results.sqlite")
+        ResultCache(path=db).set("k", "persisted")
+        assert ResultCache(path=db).get("k") == "persisted"
+
+    def test_sqlite_uses_wal_journal(self, tmp_path):
+        """Test the persistent store allows concurrent readers during writes."""
+        import sqlite3
+
+        db = str(tmp_path / "results.sqlite")
+        ResultCache(path=db).set("k", "v")
+        mode = sqlite3.connect(db).execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_sqlite_leaves_other_tables_alone(self, tmp_path):
+        """Test a shared cache file keeps tables the stage cache does not own."""
+        db = tmp_path / "cache.db"
+        with sqlite3.connect(db) as conn:
+            conn.execute("CREATE TABLE entries (value TEXT)")
+            conn.execute("INSERT INTO entries VALUES ('kept')")
+
+        ResultCache(path=db).set("k", "v")
+
+        with sqlite3.connect(db) as conn:
+            assert conn.execute("SELECT value FROM entries").fetchall() == [("kept",)]
+
+    def test_sqlite_prunes_expired_and_excess_entries(self, tmp_path):
+        """Test opening the cache drops old entries and keeps the newest ones."""
+        db = str(tmp_path / "results.sqlite")
+        cache = ResultCache(path=db)
+        with patch("shield_pr.core.cache.time.time", return_value=0.0):
+            cache.set("ancient", "v")
+        for index in range(3):
+            with patch("shield_pr.core.cache.time.time", return_value=1e9 + index):
+                cache.set(f"k{index}", "v")
+
+        with patch("shield_pr.core.cache.time.time", return_value=1e9 + 10):
+            reopened = ResultCache(path=db, max_disk_entries=2)
+
+        assert reopened.get("ancient") is None
+        assert reopened.get("k0") is None
+        assert reopened.get("k1") == "v" and reopened.get("k2") == "v"
+
+    def test_clear(self, tmp_path):
+        """Test clear removes memory and disk entries."""
+        cache = ResultCache(path=str(tmp_path / "results.sqlite"))
+        cache.set("k", "v")
+        cache.clear()
+        assert cache.get("k") is None
+
+
+class TestContentDigest:
+    """Tests for memoized content digests."""
+
+    def test_digest_stable_and_distinct(self):
+        """Test equal content shares a digest and different content does not."""
+        assert content_digest("code") == content_digest("co" + "de")
+        assert content_digest("code") != content_digest("code2")
+
+    def test_digest_memoized(self):
+        """Test repeated digests of the same content hit the memo."""
+        content_digest.cache_clear()
+        text = "x" * 10_000
+
+        content_digest(text)
+        content_digest(text)
+
+        assert content_digest.cache_info().hits == 1
+
+
+class TestCodeDigest:
+    """Tests for whitespace-normalized code digests."""
+
+    def test_ignores_line_endings_and_trailing_spaces(self):
+        """Test CRLF and trailing whitespace do not change the digest."""
+        assert code_digest("a = 1\nb = 2\n") == code_digest("a = 1  \r\nb = 2\r\n")
+
+    def test_distinguishes_code_changes(self):
+        """Test real edits change the digest."""
+        assert code_digest("a = 1") != code_digest("a = 2")
+
+
+class TestCodeShape:
+    """Test structural fingerprints and identifier renaming."""
+
+    def test_renamed_code_shares_shape(self):
+        """Test renaming identifiers keeps the shape and lists the names."""
+        shape, names = code_shape("val total = price * qty")
+        other_shape, other_names = code_shape("val sum = cost * count")
+
+        assert shape == other_shape
+        assert names == ("total", "price", "qty")
+        assert other_names == ("sum", "cost", "count")
+
+    def test_keywords_literals_and_indentation_are_structure(self):
+        """Test keywords, literals and indentation changes alter the shape."""
+        base = code_shape('if ok:\n    run("a")')[0]
+
+        assert code_shape('while ok:\n    run("a")')[0] != base
+        assert code_shape('if ok:\n    run("b")')[0] != base
+        assert code_shape('if ok:\nrun("a")')[0] != base
+
+    def test_rename_identifiers(self):
+        """Test consistent renames are applied on word boundaries."""
+        text = "user leaks; username untouched"
+
+        assert rename_identifiers(text, ["user", "db"], ["account", "db"]) == (
+            "account leaks; username untouched"
+        )
+
+    def test_inconsistent_or_reserved_renames_rejected(self):
+        """Test non-bijective or reserved renames are refused."""
+        assert rename_identifiers("x", ["a", "b"], ["c", "c"]) is None
+        assert rename_identifiers("x", ["a", "a"], ["b", "c"]) is None
+        assert rename_identifiers("x", ["done"], ["ok"], frozenset({"done"})) is None
@@ -1,11 +1,21 @@
 """Tests for BaseReviewChain (depth selection and stage execution)."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
-from shield_pr.chains.base import BaseReviewChain
-from shield_pr.models.finding import Finding
+from langchain_core.prompts import PromptTemplate
+from tenacity import wait_none
+from shield_pr.chains._retry import STAGE_RETRY_ATTEMPTS
+from shield_pr.chains.base import BaseReviewChain, _build_stage, _make_stages, _pack_by_size
+from shield_pr.chains.platforms.android_chain import AndroidReviewChain
+from shield_pr.chains.prompts.factory import PromptRef
+from shield_pr.chains.universal_chain import UniversalReviewChain
+from shield_pr.models.finding import Finding, FindingsResponse
 from shield_pr.models.review_result import ReviewResult
-from shield_pr.core.errors import ReviewError
+from shield_pr.core.cache import ResultCache
+from shield_pr.config.models import APIConfig
+from shield_pr.core.errors import RateLimitError, ReviewError
+from shield_pr.core.llm_client import LLMClient
 
 
 class ConcreteReviewChain(BaseReviewChain):
@@ -76,6 +86,17 @@ class TestBaseReviewChainDepthSelection:
 
         assert stages == ["architecture", "platform_issues", "tests", "improvements"]
 
+    def test_depth_stages_frozen_per_class(self):
+        """Test subclasses get their own frozen depth table."""
+        class CustomDepthChain(ConcreteReviewChain):
+            DEPTH_STAGES = {"quick": ["tests"], "standard": ["tests", "architecture"]}
+
+        chain = CustomDepthChain(MagicMock(), depth="quick", platform="test")
+
+        assert chain._depth_stages == ("tests",)
+        assert CustomDepthChain._DEPTH_STAGES_FROZEN["standard"] == ("tests", "architecture")
+        assert ConcreteReviewChain._DEPTH_STAGES_FROZEN["quick"] == ("architecture", "improvements")
+
 
 class TestBaseReviewChainStageExecution:
     """Tests for stage execution logic."""
@@ -134,13 +155,11 @@ class TestBaseReviewChainStageExecution:
 class TestBaseReviewChainIntegration:
     """Integration tests for full chain execution."""
 
-    @patch("shield_pr.chains.base.ResultParser")
-    def test_execute_full_workflow(self, mock_parser_class):
+    @patch("shield_pr.chains.base._SHARED_PARSER")
+    def test_execute_full_workflow(self, mock_parser):
         """Test complete execute workflow."""
         # Setup mocks
         llm_client = MagicMock()
-        mock_parser = MagicMock()
-        mock_parser_class.return_value = mock_parser
 
         # Mock parser methods
         finding = Finding(
@@ -179,12 +198,10 @@ class TestBaseReviewChainIntegration:
         with pytest.raises(ReviewError, match="Chain execution failed"):
             chain.execute("test code", "test.py")
 
-    @patch("shield_pr.chains.base.ResultParser")
-    def test_execute_with_different_depths(self, mock_parser_class):
+    @patch("shield_pr.chains.base._SHARED_PARSER")
+    def test_execute_with_different_depths(self, mock_parser):
         """Test execute works with all depth levels."""
         llm_client = MagicMock()
-        mock_parser = MagicMock()
-        mock_parser_class.return_value = mock_parser
 
         mock_parser.extract_findings.return_value = []
         mock_parser.generate_summary.return_value = "No issues"
@@ -228,3 +245,651 @@ class TestBaseReviewChainInitialization:
         assert "architecture" in chain.stages
         assert "improvements" in chain.stages
         assert len(chain.stages) == 6  # All test stages
+
+    def test_parser_shared_across_instances(self):
+        """Test chains share a single stateless ResultParser."""
+        first = ConcreteReviewChain(MagicMock(), platform="test")
+        second = ConcreteReviewChain(MagicMock(), platform="test")
+
+        assert first.parser is second.parser
+
+
+def _async_stage(text, input_variables=None):
+    """Build a mock stage exposing ainvoke and prompt input variables."""
+    stage = MagicMock()
+    stage.ainvoke = AsyncMock(return_value={"text": text})
+    if input_variables is not None:
+        stage.prompt.input_variables = input_variables
+    return stage
+
+
+class TestBaseReviewChainAsyncExecution:
+    """Tests for async level-parallel stage execution."""
+
+    def test_group_stage_levels_uses_prompt_dependencies(self):
+        """Test independent stages share a level and dependents follow."""
+        chain = ConcreteReviewChain(MagicMock(), depth="standard", platform="test")
+        chain.stages = {
+            "architecture": _async_stage("a", ["code", "file_path"]),
+            "platform_issues": _async_stage("p", ["code", "file_path"]),
+            "tests": _async_stage("t", ["code", "architecture_result"]),
+            "improvements": _async_stage("i", ["code", "tests_result"]),
+        }
+
+        levels = chain._group_stage_levels(
+            ["architecture", "platform_issues", "tests", "improvements"]
+        )
+
+        assert levels == [["architecture", "platform_issues"], ["tests"], ["improvements"]]
+
+    def test_group_stage_levels_unknown_inputs_are_sequential(self):
+        """Test stages without inspectable prompts run one per level."""
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+
+        levels = chain._group_stage_levels(["architecture", "missing", "improvements"])
+
+        assert levels == [["architecture"], ["improvements"]]
+
+    @pytest.mark.asyncio
+    async def test_aexecute_stages_passes_prior_results(self):
+        """Test dependent stages receive results of earlier levels."""
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+        arch = _async_stage("Architecture analysis", ["code", "file_path"])
+        imp = _async_stage("Improvements", ["code", "architecture_result"])
+        chain.stages = {"architecture": arch, "improvements": imp}
+
+        result = await chain._aexecute_stages(["architecture", "improvements"], "code", "a.py")
+
+        assert result["architecture_result"] == "Architecture analysis"
+        assert result["improvements_result"] == "Improvements"
+        assert imp.ainvoke.call_args[0][0]["architecture_result"] == "Architecture analysis"
+
+    @pytest.mark.asyncio
+    async def test_aexecute_wraps_errors(self):
+        """Test aexecute raises ReviewError on stage failure."""
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+        failing = _async_stage("x", ["code"])
+        failing.ainvoke.side_effect = Exception("LLM error")
+        chain.stages = {"architecture": failing}
+
+        with pytest.raises(ReviewError, match="Chain execution failed"):
+            await chain.aexecute("code", "test.py")
+
+
+class SpecReviewChain(BaseReviewChain):
+    """Chain declaring stages through STAGE_SPECS."""
+
+    STAGE_SPECS = {
+        "architecture": MagicMock(),
+        "improvements": MagicMock(),
+    }
+
+
+class TestBaseReviewChainStageSpecs:
+    """Tests for cached STAGE_SPECS materialization."""
+
+    def setup_method(self):
+        _make_stages.cache_clear()
+
+    def test_stages_shared_across_instances_for_same_llm(self):
+        """Test stages are built once per (class, llm) pair."""
+        llm_client = MagicMock()
+        with patch("shield_pr.chains.base._build_stage") as mock_llm_chain:
+            first = SpecReviewChain(llm_client, depth="quick", platform="test")
+            second = SpecReviewChain(llm_client, depth="quick", platform="test")
+
+        assert mock_llm_chain.call_count == 2
+        assert first.stages["architecture"] is second.stages["architecture"]
+        assert first.stages is not second.stages
+
+    def test_stages_rebuilt_for_different_llm(self):
+        """Test a different LLM client gets its own stages."""
+        with patch("shield_pr.chains.base._build_stage") as mock_llm_chain:
+            SpecReviewChain(MagicMock(), platform="test")
+            SpecReviewChain(MagicMock(), platform="test")
+
+        assert mock_llm_chain.call_count == 4
+
+    def test_unhashable_llm_builds_uncached(self):
+        """Test unhashable LLM clients fall back to per-instance stages."""
+        with patch("shield_pr.chains.base._build_stage") as mock_llm_chain:
+            chain = SpecReviewChain({"unhashable": True}, platform="test")
+
+        assert set(chain.stages) == {"architecture", "improvements"}
+        assert mock_llm_chain.call_args.args[0] is SpecReviewChain.STAGE_SPECS["improvements"]
+
+    def test_structured_client_gets_schema_free_prompt(self):
+        """Test clients enforcing structured output get the response model, not schema prose."""
+        llm_client = MagicMock(structured_output=True)
+        llm_client.invoke.return_value = '{"findings": []}'
+
+        stage = _build_stage(PromptRef("android", "architecture"), llm_client)
+        stage.invoke({"code": "x", "file_path": "a.kt"})
+
+        assert stage.schema is FindingsResponse
+        prompt = llm_client.invoke.call_args.args[0]
+        assert "Emit ONE finding" not in prompt
+        assert "Categories: architecture" in prompt
+        assert llm_client.invoke.call_args.kwargs == {"schema": FindingsResponse}
+
+    def test_system_capable_client_gets_shared_system_message(self):
+        """Test static instructions go out as one system message for every file."""
+        llm_client = MagicMock(structured_output=False, system_messages=True)
+        llm_client.invoke.return_value = '{"done": true}'
+        stage = _build_stage(PromptRef("android", "architecture"), llm_client)
+
+        stage.invoke({"code": "a", "file_path": "a.kt"})
+        stage.invoke({"code": "b", "file_path": "b.kt"})
+
+        first, second = llm_client.invoke.call_args_list
+        assert first.kwargs["system"] == second.kwargs["system"] == stage.prompt.system
+        assert first.args[0].startswith("File: a.kt")
+        assert second.args[0].startswith("File: b.kt")
+
+    def test_plain_client_keeps_schema_prompt(self):
+        """Test other clients keep the schema in the prompt."""
+        stage = _build_stage(PromptRef("android", "architecture"), MagicMock())
+
+        assert stage.schema is None
+        assert "Emit ONE finding" in stage._format({"code": "x", "file_path": "a.kt"})
+
+
+class TestBaseReviewChainResultCache:
+    """Tests for stage result caching."""
+
+    def test_cached_stage_skips_second_invoke(self):
+        """Test identical inputs hit the cache instead of the stage."""
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+        chain.result_cache = ResultCache()
+        arch = MagicMock()
+        arch.invoke.return_value = {"text": "arch"}
+        arch.prompt.input_variables = ["code", "file_path"]
+        chain.stages = {"architecture": arch}
+
+        first = chain._execute_stages(["architecture"], "code", "a.py")
+        second = chain._execute_stages(["architecture"], "code", "a.py")
+
+        assert arch.invoke.call_count == 1
+        assert first["architecture_result"] == second["architecture_result"] == "arch"
+
+    def test_changed_code_misses_cache(self):
+        """Test different code produces a different key."""
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+        chain.result_cache = ResultCache()
+        arch = MagicMock()
+        arch.invoke.return_value = {"text": "arch"}
+        chain.stages = {"architecture": arch}
+
+        chain._execute_stages(["architecture"], "code v1", "a.py")
+        chain._execute_stages(["architecture"], "code v2", "a.py")
+
+        assert arch.invoke.call_count == 2
+
+    def test_changed_prompt_misses_cache(self):
+        """Test editing a stage's prompt template invalidates its cached output."""
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+        chain.result_cache = ResultCache()
+        arch = MagicMock()
+        arch.invoke.return_value = {"text": "arch"}
+        arch.prompt.template = "Review {code}"
+        arch.prompt.input_variables = ["code", "file_path"]
+        chain.stages = {"architecture": arch}
+
+        chain._execute_stages(["architecture"], "code", "a.py")
+        arch.prompt.template = "Review carefully {code}"
+        chain._execute_stages(["architecture"], "code", "a.py")
+
+        assert arch.invoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_path_uses_cache(self):
+        """Test the async path shares the same cache."""
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+        chain.result_cache = ResultCache()
+        arch = _async_stage("arch", ["code", "file_path"])
+        chain.stages = {"architecture": arch}
+
+        await chain._aexecute_stages(["architecture"], "code", "a.py")
+        await chain._aexecute_stages(["architecture"], "code", "a.py")
+
+        assert arch.ainvoke.call_count == 1
+
+    def test_structural_cache_serves_renamed_code(self):
+        """Test a renamed copy of reviewed code reuses the output with names rewritten."""
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+        chain.result_cache = ResultCache()
+        chain.structural_cache = True
+        arch = MagicMock()
+        arch.invoke.return_value = {"text": '{"description": "load leaks user"}'}
+        arch.prompt.input_variables = ["code", "file_path"]
+        chain.stages = {"architecture": arch}
+
+        chain._execute_stages(["architecture"], "def load(user):\n    return user", "a.py")
+        result = chain._execute_stages(
+            ["architecture"], "def fetch(account):\n    return account", "b.py"
+        )
+
+        assert arch.invoke.call_count == 1
+        assert result["architecture_result"] == '{"description": "fetch leaks account"}'
+
+    def test_structural_cache_misses_changed_structure(self):
+        """Test code differing in more than names is sent to the stage."""
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+        chain.result_cache = ResultCache()
+        chain.structural_cache = True
+        arch = MagicMock()
+        arch.invoke.return_value = {"text": "arch"}
+        arch.prompt.input_variables = ["code", "file_path"]
+        chain.stages = {"architecture": arch}
+
+        chain._execute_stages(["architecture"], "def load(user):\n    return user", "a.py")
+        chain._execute_stages(["architecture"], "def load(user):\n    return None", "b.py")
+
+        assert arch.invoke.call_count == 2
+
+    def test_no_cache_by_default(self):
+        """Test chains do not cache unless a cache is attached."""
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+        assert chain._stage_cache_key("architecture", MagicMock(), {"code": "x"}) is None
+
+
+class TestBaseReviewChainStreaming:
+    """Tests for streaming the final stage level."""
+
+    @pytest.mark.asyncio
+    async def test_aexecute_streams_final_stage_findings(self):
+        """Test findings from the last level reach on_finding."""
+        arch = _async_stage("arch", ["code", "file_path"])
+        improvements = MagicMock()
+        improvements.prompt.input_variables = ["code", "architecture_result"]
+
+        async def fake_astream(context):
+            yield {"text": '{"findings": [{"severity": "MEDIUM", '}
+            yield {"text": '"description": "Streamed issue"}]}'}
+
+        improvements.astream = fake_astream
+
+        class StreamingChain(BaseReviewChain):
+            def _build_stages(self):
+                return {"architecture": arch, "improvements": improvements}
+
+        chain = StreamingChain(MagicMock(), depth="quick", platform="test")
+        seen = []
+
+        result = await chain.aexecute("code", "a.py", on_finding=seen.append)
+
+        assert [f.description for f in seen] == ["Streamed issue"]
+        assert isinstance(result, ReviewResult)
+        arch.ainvoke.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_retries_without_repeating_findings(self):
+        """Test a rate limit mid-stream falls back to the retried call."""
+        stage = MagicMock()
+        first = '{"severity": "HIGH", "description": "First issue"}'
+        second = '{"severity": "LOW", "description": "Second issue"}'
+        stage.ainvoke = AsyncMock(
+            return_value={"text": '{"findings": [' + first + ", " + second + "]}"}
+        )
+
+        async def failing_astream(context):
+            yield {"text": '{"findings": [' + first + ", "}
+            raise RateLimitError("429 quota exceeded")
+
+        stage.astream = failing_astream
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+        seen = []
+
+        with patch.object(BaseReviewChain._ainvoke_with_retry.retry, "wait", wait_none()):
+            result = await chain._astream_stage(
+                "architecture", stage, {"code": "x", "file_path": "a.py"}, seen.append
+            )
+
+        assert [f.description for f in seen] == ["First issue", "Second issue"]
+        assert "Second issue" in result["text"]
+        stage.ainvoke.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_final_stage_streams_through_llm_client(self):
+        """Test the final stage streams from the real LLMClient model."""
+        async def model_astream(messages):
+            yield MagicMock(content='{"findings": [{"severity": "LOW", ')
+            yield MagicMock(content='"description": "Streamed from model"}]}')
+
+        model = MagicMock()
+        model.ainvoke = AsyncMock(return_value=MagicMock(content='{"findings": []}'))
+        model.astream = model_astream
+        model.bind.return_value = model
+        config = APIConfig(api_key="test_api_key_1234567890", cache_type="memory")
+        with patch("shield_pr.core.llm_client.ChatGoogleGenerativeAI", return_value=model), \
+                patch("shield_pr.core.llm_client.setup_cache"):
+            client = LLMClient(config)
+        chain = AndroidReviewChain(client, depth="quick")
+        seen = []
+
+        await chain.aexecute("val x = 1", "Main.kt", on_finding=seen.append)
+
+        assert [f.description for f in seen] == ["Streamed from model"]
+
+
+class TestBaseReviewChainActiveStages:
+    """Tests for precomputed active stages."""
+
+    def test_active_stages_resolved_at_init(self):
+        """Test active stages follow depth order and skip missing stages."""
+        class PartialChain(BaseReviewChain):
+            def _build_stages(self):
+                return {"improvements": MagicMock(), "architecture": MagicMock()}
+
+        chain = PartialChain(MagicMock(), depth="standard", platform="test")
+
+        assert [name for name, _ in chain._active_stages] == ["architecture", "improvements"]
+        assert chain._active_stages[0][1] is chain.stages["architecture"]
+
+    def test_execute_runs_only_active_stages(self):
+        """Test execute invokes exactly the precomputed stages."""
+        arch, imp, extra = MagicMock(), MagicMock(), MagicMock()
+        for stage in (arch, imp, extra):
+            stage.invoke.return_value = {"text": "out"}
+
+        class QuickChain(BaseReviewChain):
+            def _build_stages(self):
+                return {"architecture": arch, "improvements": imp, "tests": extra}
+
+        QuickChain(MagicMock(), depth="quick", platform="test").execute("code", "a.py")
+
+        assert arch.invoke.call_count == 1
+        assert imp.invoke.call_count == 1
+        assert extra.invoke.call_count == 0
+
+
+class TestBaseReviewChainBatch:
+    """Tests for batched multi-file execution."""
+
+    @pytest.mark.asyncio
+    async def test_aexecute_batch_submits_one_abatch_per_stage(self):
+        """Test each stage batches all files and sees its own prior results."""
+        arch = MagicMock()
+        arch.prompt.input_variables = ["code", "file_path"]
+        arch.abatch = AsyncMock(return_value=["arch a", "arch b"])
+        imp = MagicMock()
+        imp.prompt.input_variables = ["code", "architecture_result"]
+        imp.abatch = AsyncMock(return_value=["imp a", "imp b"])
+
+        class BatchChain(BaseReviewChain):
+            def _build_stages(self):
+                return {"architecture": arch, "improvements": imp}
+
+        chain = BatchChain(MagicMock(), depth="quick", platform="test")
+        results = await chain.aexecute_batch([("code a", "a.py"), ("code b", "b.py")])
+
+        assert len(results) == 2
+        assert all(isinstance(result, ReviewResult) for result in results)
+        arch.abatch.assert_awaited_once()
+        imp.abatch.assert_awaited_once()
+        inputs = imp.abatch.call_args[0][0]
+        assert [i["architecture_result"] for i in inputs] == ["arch a", "arch b"]
+        assert imp.abatch.call_args.kwargs["config"] == {"max_concurrency": 10}
+
+    @pytest.mark.asyncio
+    async def test_aexecute_batch_failure_raises_review_error(self):
+        """Test batch failures are wrapped in ReviewError."""
+        arch = MagicMock()
+        arch.abatch = AsyncMock(side_effect=Exception("LLM error"))
+
+        class BatchChain(BaseReviewChain):
+            def _build_stages(self):
+                return {"architecture": arch}
+
+        chain = BatchChain(MagicMock(), depth="quick", platform="test")
+
+        with pytest.raises(ReviewError):
+            await chain.aexecute_batch([("code", "a.py")])
+
+    def test_skipped_stage_results_default_to_empty(self):
+        """Test prompts referencing skipped stages receive empty results."""
+        arch, imp, tests_stage = MagicMock(), MagicMock(), MagicMock()
+        for stage in (arch, imp, tests_stage):
+            stage.invoke.return_value = "out"
+
+        class QuickChain(BaseReviewChain):
+            def _build_stages(self):
+                return {"architecture": arch, "tests": tests_stage, "improvements": imp}
+
+        QuickChain(MagicMock(), depth="quick", platform="test").execute("code", "a.py")
+
+        assert imp.invoke.call_args[0][0]["tests_result"] == ""
+        assert tests_stage.invoke.call_count == 0
+
+
+class TestBaseReviewChainPackedBatch:
+    """Tests for packing several files into one prompt per stage."""
+
+    @staticmethod
+    def _llm(responses):
+        llm = MagicMock()
+        prompts = []
+
+        async def ainvoke(prompt):
+            prompts.append(prompt)
+            return responses(prompt)
+
+        llm.ainvoke = ainvoke
+        return llm, prompts
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_pack_all_files(self):
+        """Test one call per stage covers every file and findings are demuxed."""
+        def responses(prompt):
+            return (
+                '{"a.py": [{"severity": "HIGH", "category": "security", '
+                '"description": "Hardcoded secret in a"}], "b.py": []}'
+            )
+
+        llm, prompts = self._llm(responses)
+        chain = UniversalReviewChain(llm, depth="standard")
+
+        results = await chain.aexecute_batch([("key = 'x'", "a.py"), ("y = 1", "b.py")])
+
+        assert len(prompts) == 2
+        assert all('"file_path":"a.py"' in p and '"file_path":"b.py"' in p for p in prompts)
+        assert "Hardcoded secret in a" in {f.description for f in results[0].findings}
+        assert "Hardcoded secret in a" not in {f.description for f in results[1].findings}
+
+    @pytest.mark.asyncio
+    async def test_unsplittable_output_falls_back_per_file(self):
+        """Test output without per-file JSON is retried with one prompt per file."""
+        llm, prompts = self._llm(lambda prompt: "no json here")
+        chain = UniversalReviewChain(llm, depth="quick")
+
+        await chain.aexecute_batch([("a", "a.py"), ("b", "b.py")])
+
+        # One packed prompt, then one prompt per file
+        assert len(prompts) == 3
+        assert "Files (JSON list" in prompts[0]
+        assert all("Files (JSON list" not in p for p in prompts[1:])
+
+    @pytest.mark.asyncio
+    async def test_pack_chars_zero_disables_packing(self):
+        """Test a zero budget sends one prompt per file."""
+        llm, prompts = self._llm(lambda prompt: '{"findings": []}')
+        chain = UniversalReviewChain(llm, depth="quick")
+
+        await chain.aexecute_batch([("a", "a.py"), ("b", "b.py")], pack_chars=0)
+
+        assert len(prompts) == 2
+
+    def test_pack_by_size_respects_budget_and_paths(self):
+        """Test groups stay within budget and never repeat a path."""
+        files = [(0, "a", 5), (1, "b", 5), (2, "c", 20), (3, "a", 1), (4, "d", 1)]
+
+        assert _pack_by_size(files, 10) == [[0, 1], [2], [3, 4]]
+        assert _pack_by_size([(0, "a", 1), (1, "a", 1)], 10) == [[0], [1]]
+
+
+class TestBaseReviewChainRetry:
+    """Tests for stage-level retry of transient failures."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_stage_is_retried(self):
+        """Test a rate-limited stage is retried without rerunning earlier stages."""
+        arch = _async_stage("arch", ["code", "file_path"])
+        imp = _async_stage("imp", ["code", "architecture_result"])
+        imp.ainvoke.side_effect = [RateLimitError("429"), {"text": "imp"}]
+
+        class RetryChain(BaseReviewChain):
+            def _build_stages(self):
+                return {"architecture": arch, "improvements": imp}
+
+        chain = RetryChain(MagicMock(), depth="quick", platform="test")
+        with patch.object(BaseReviewChain._ainvoke_with_retry.retry, "wait", wait_none()):
+            result = await chain._aexecute_stages(["architecture", "improvements"], "code", "a.py")
+
+        assert result["improvements_result"] == "imp"
+        assert arch.ainvoke.call_count == 1
+        assert imp.ainvoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_connection_error_from_client_is_retried(self):
+        """Test a dropped connection mapped by LLMClient is retried per stage."""
+        calls = []
+
+        async def flaky_ainvoke(messages):
+            calls.append(messages)
+            if len(calls) == 1:
+                raise ConnectionResetError("Connection reset by peer")
+            return MagicMock(content='{"findings": []}')
+
+        model = MagicMock()
+        model.ainvoke = flaky_ainvoke
+        model.bind.return_value = model
+        config = APIConfig(api_key="test_api_key_1234567890", cache_type="memory")
+        with patch("shield_pr.core.llm_client.ChatGoogleGenerativeAI", return_value=model), \
+                patch("shield_pr.core.llm_client.setup_cache"):
+            client = LLMClient(config)
+        chain = AndroidReviewChain(client, depth="quick")
+
+        with patch.object(BaseReviewChain._ainvoke_with_retry.retry, "wait", wait_none()):
+            result = await chain.aexecute("val x = 1", "Main.kt")
+
+        assert isinstance(result, ReviewResult)
+        assert len(calls) == len(chain._active_stages) + 1
+
+    def test_sync_rate_limit_retried_at_one_layer(self):
+        """Test the sync path makes one provider call per stage attempt."""
+        model = MagicMock()
+        model.invoke.side_effect = Exception("429 quota exceeded")
+        model.bind.return_value = model
+        config = APIConfig(api_key="test_api_key_1234567890", cache_type="memory")
+        with patch("shield_pr.core.llm_client.ChatGoogleGenerativeAI", return_value=model), \
+                patch("shield_pr.core.llm_client.setup_cache"):
+            client = LLMClient(config)
+        chain = AndroidReviewChain(client, depth="quick")
+
+        with patch.object(BaseReviewChain._invoke_with_retry.retry, "wait", wait_none()):
+            with pytest.raises(ReviewError):
+                chain.execute("val x = 1", "Main.kt")
+
+        assert model.invoke.call_count == STAGE_RETRY_ATTEMPTS
+
+    def test_non_transient_errors_are_not_retried(self):
+        """Test generic failures surface immediately as ReviewError."""
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+        chain.stages["architecture"].invoke.side_effect = ValueError("bad prompt")
+
+        with pytest.raises(ReviewError):
+            chain.execute("code", "a.py")
+
+        assert chain.stages["architecture"].invoke.call_count == 1
+
+
+class TestBaseReviewChainCoalescing:
+    """Tests for coalescing identical in-flight stage calls."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_prompts_share_one_call(self):
+        """Test concurrent identical prompts trigger a single stage call."""
+        calls = []
+
+        async def slow_ainvoke(context):
+            calls.append(context)
+            await asyncio.sleep(0.01)
+            return "arch"
+
+        stage = MagicMock()
+        stage.prompt = PromptTemplate(template="{file_path}: {code}", input_variables=["code", "file_path"])
+        stage.ainvoke = slow_ainvoke
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+        context = {"code": "x = 1", "file_path": "a.py"}
+
+        results = await asyncio.gather(
+            chain._acached_invoke("architecture", stage, dict(context)),
+            chain._acached_invoke("architecture", stage, dict(context)),
+        )
+
+        assert results == ["arch", "arch"]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_different_prompts_not_coalesced(self):
+        """Test distinct prompts each get their own call."""
+        stage = MagicMock()
+        stage.prompt = PromptTemplate(template="{code}", input_variables=["code"])
+        stage.ainvoke = AsyncMock(return_value="out")
+        chain = ConcreteReviewChain(MagicMock(), depth="quick", platform="test")
+
+        await asyncio.gather(
+            chain._acached_invoke("architecture", stage, {"code": "a"}),
+            chain._acached_invoke("architecture", stage, {"code": "b"}),
+        )
+
+        assert stage.ainvoke.call_count == 2
+
+
+class TestBaseReviewChainSpeculation:
+    """Tests for speculative pre-launch of dependent stages."""
+
+    def _chain(self, arch_text):
+        arch = _async_stage(arch_text, ["code", "file_path"])
+        imp = _async_stage("imp", ["code", "architecture_result"])
+
+        class SpecChain(BaseReviewChain):
+            def _build_stages(self):
+                return {"architecture": arch, "improvements": imp}
+
+        chain = SpecChain(MagicMock(), depth="quick", platform="test")
+        chain.speculative = True
+        return chain, imp
+
+    @pytest.mark.asyncio
+    async def test_close_draft_keeps_speculative_call(self):
+        """Test a draft matching the real result avoids a second call."""
+        chain, imp = self._chain("Layered architecture, fine!")
+        chain.drafts.remember("test", "architecture", "src/a.py", "Layered architecture, fine.")
+
+        result = await chain._aexecute_stages(["architecture", "improvements"], "code", "src/b.py")
+
+        assert imp.ainvoke.call_count == 1
+        assert imp.ainvoke.call_args[0][0]["architecture_result"] == "Layered architecture, fine."
+        assert result["improvements_result"] == "imp"
+
+    @pytest.mark.asyncio
+    async def test_divergent_draft_is_reissued(self):
+        """Test a draft far from the real result is replaced by a real call."""
+        chain, imp = self._chain("Severe coupling between layers; split the module.")
+        chain.drafts.remember("test", "architecture", "src/a.py", "Everything is fine.")
+
+        await chain._aexecute_stages(["architecture", "improvements"], "code", "src/b.py")
+
+        last_context = imp.ainvoke.call_args[0][0]
+        assert last_context["architecture_result"] == "Severe coupling between layers; split the module."
+
+    @pytest.mark.asyncio
+    async def test_no_draft_runs_sequentially(self):
+        """Test stages without drafts run normally and record drafts."""
+        chain, imp = self._chain("arch")
+
+        await chain._aexecute_stages(["architecture", "improvements"], "code", "src/a.py")
+
+        assert imp.ainvoke.call_count == 1
+        assert imp.ainvoke.call_args[0][0]["architecture_result"] == "arch"
@@ -0,0 +1,87 @@
+"""Tests for concurrent multi-file batch review."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shield_pr.chains.batch import review_files
+from shield_pr.core.errors import ReviewError
+from shield_pr.models.review_result import ReviewResult
+
+
+def _result(platform="backend"):
+    return ReviewResult(platform=platform, findings=[], summary="ok", confidence=0.9)
+
+
+class TestBatchReviewFiles:
+    """Tests for review_files fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_reviews_all_files_with_shared_chain(self):
+        """Test every file is reviewed by a single chain instance."""
+        chain = MagicMock()
+        chain.aexecute = AsyncMock(return_value=_result())
+        files = {"a.py": "a = 1", "b.py": "b = 2", "c.py": "c = 3"}
+
+        with patch("shield_pr.chains.batch.get_chain", return_value=chain) as mock_get:
+            results = await review_files("backend", MagicMock(), files)
+
+        mock_get.assert_called_once()
+        assert set(results) == set(files)
+        assert chain.aexecute.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_respects_max_concurrency(self):
+        """Test no more than max_concurrency reviews run at once."""
+        running = 0
+        peak = 0
+
+        async def fake_aexecute(code, path):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _result()
+
+        chain = MagicMock()
+        chain.aexecute = fake_aexecute
+        files = {f"f{i}.py": "x" for i in range(8)}
+
+        with patch("shield_pr.chains.batch.get_chain", return_value=chain):
+            results = await review_files(
+                "backend", MagicMock(), files, max_concurrency=2, rpm=6000
+            )
+
+        assert len(results) == 8
+        assert peak <= 2
+
+    @pytest.mark.asyncio
+    async def test_failed_files_are_skipped_and_callback_streams(self):
+        """Test failures are omitted and on_result fires per success."""
+        async def fake_aexecute(code, path):
+            if path == "bad.py":
+                raise ReviewError("boom")
+            return _result()
+
+        chain = MagicMock()
+        chain.aexecute = fake_aexecute
+        seen = []
+
+        with patch("shield_pr.chains.batch.get_chain", return_value=chain):
+            results = await review_files(
+                "backend",
+                MagicMock(),
+                {"good.py": "x", "bad.py": "y"},
+                on_result=lambda path, _: seen.append(path),
+            )
+
+        assert list(results) == ["good.py"]
+        assert seen == ["good.py"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_limits(self):
+        """Test invalid limits raise ValueError."""
+        with pytest.raises(ValueError):
+            await review_files("backend", MagicMock(), {}, max_concurrency=0)
@@ -0,0 +1,90 @@
+"""Tests for the direct prompt-to-LLM stage path."""
+
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.prompts import PromptTemplate
+from shield_pr.chains._llm import PromptStage, acall, call
+
+
+def _prompt():
+    return PromptTemplate(template="Review {file_path}: {code}", input_variables=["code", "file_path"])
+
+
+class TestCall:
+    """Tests for call/acall response handling."""
+
+    def test_call_returns_plain_string(self):
+        """Test LLMClient-style string responses pass through."""
+        llm = MagicMock()
+        llm.invoke.return_value = "findings"
+
+        assert call(llm, "prompt") == "findings"
+        llm.invoke.assert_called_once_with("prompt")
+
+    @pytest.mark.asyncio
+    async def test_acall_unwraps_message_content(self):
+        """Test chat model messages are reduced to their content."""
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(return_value=AIMessage(content="findings"))
+
+        assert await acall(llm, "prompt") == "findings"
+
+
+class TestPromptStage:
+    """Tests for PromptStage execution."""
+
+    def test_invoke_formats_prompt(self):
+        """Test invoke sends the formatted prompt to the client."""
+        llm = MagicMock()
+        llm.invoke.return_value = "ok"
+        stage = PromptStage(_prompt(), llm)
+
+        assert stage.invoke({"code": "x = 1", "file_path": "a.py", "extra": "ignored"}) == "ok"
+        llm.invoke.assert_called_once_with("Review a.py: x = 1")
+
+    @pytest.mark.asyncio
+    async def test_abatch_preserves_order(self):
+        """Test abatch returns responses in input order."""
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(side_effect=lambda prompt: prompt.upper())
+        stage = PromptStage(_prompt(), llm)
+
+        results = await stage.abatch(
+            [{"code": "a", "file_path": "a.py"}, {"code": "b", "file_path": "b.py"}],
+            config={"max_concurrency": 1},
+        )
+
+        assert results == ["REVIEW A.PY: A", "REVIEW B.PY: B"]
+
+    @pytest.mark.asyncio
+    async def test_astream_non_runnable_yields_single_chunk(self):
+        """Test clients without streaming yield the whole response once."""
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(return_value="full text")
+        stage = PromptStage(_prompt(), llm)
+
+        chunks = [chunk async for chunk in stage.astream({"code": "a", "file_path": "a.py"})]
+
+        assert chunks == ["full text"]
+
+    @pytest.mark.asyncio
+    async def test_astream_streaming_client_passes_options(self):
+        """Test clients marked streaming stream chunks with schema and system."""
+        calls = []
+
+        class _Client:
+            streaming = True
+
+            async def astream(self, prompt, **options):
+                calls.append((prompt, options))
+                for text in ("a", "b"):
+                    yield text
+
+        schema = MagicMock()
+        stage = PromptStage(_prompt(), _Client(), schema=schema)
+
+        chunks = [chunk async for chunk in stage.astream({"code": "x", "file_path": "a.py"})]
+
+        assert chunks == ["a", "b"]
+        assert calls == [("Review a.py: x", {"schema": schema})]
@@ -2,7 +2,8 @@
 
 from unittest.mock import MagicMock, patch
 import pytest
-from langchain.chains import LLMChain
+from shield_pr.chains._llm import PromptStage
+from shield_pr.chains.prompts import ANDROID_PROMPTS
 from shield_pr.chains.platforms.android_chain import AndroidReviewChain
 from shield_pr.chains.platforms.ios_chain import IOSReviewChain
 from shield_pr.chains.platforms.ai_ml_chain import AiMlReviewChain
@@ -34,19 +35,17 @@ class TestAndroidReviewChain:
         assert "tests" in chain.stages
         assert "improvements" in chain.stages
 
-        # All stages should be LLMChain instances
+        # All stages should bind a prompt to the LLM client
         for stage in chain.stages.values():
-            assert isinstance(stage, LLMChain)
+            assert isinstance(stage, PromptStage)
 
-    def test_android_chain_stage_output_keys(self):
-        """Test AndroidReviewChain stages have correct output keys."""
+    def test_android_chain_stage_prompts(self):
+        """Test AndroidReviewChain stages start with the Android prompts."""
         llm_client = MagicMock()
         chain = AndroidReviewChain(llm_client, depth="standard")
 
-        assert chain.stages["architecture"].output_key == "architecture_result"
-        assert chain.stages["platform_issues"].output_key == "platform_issues_result"
-        assert chain.stages["tests"].output_key == "tests_result"
-        assert chain.stages["improvements"].output_key == "improvements_result"
+        for name in ("architecture", "platform_issues", "tests", "improvements"):
+            assert chain.stages[name].prompt is ANDROID_PROMPTS[name]
 
     def test_android_chain_inherits_from_base(self):
         """Test AndroidReviewChain properly inherits BaseReviewChain methods."""
@@ -83,7 +82,7 @@ class TestIOSReviewChain:
         assert "improvements" in chain.stages
 
         for stage in chain.stages.values():
-            assert isinstance(stage, LLMChain)
+            assert isinstance(stage, PromptStage)
 
     def test_ios_chain_default_depth(self):
         """Test IOSReviewChain uses default depth."""
@@ -115,7 +114,7 @@ class TestAiMlReviewChain:
         assert "improvements" in chain.stages
 
         for stage in chain.stages.values():
-            assert isinstance(stage, LLMChain)
+            assert isinstance(stage, PromptStage)
 
 
 class TestFrontendReviewChain:
@@ -140,7 +139,7 @@ class TestFrontendReviewChain:
         assert "improvements" in chain.stages
 
         for stage in chain.stages.values():
-            assert isinstance(stage, LLMChain)
+            assert isinstance(stage, PromptStage)
 
 
 class TestBackendReviewChain:
@@ -165,19 +164,17 @@ class TestBackendReviewChain:
         assert "improvements" in chain.stages
 
         for stage in chain.stages.values():
-            assert isinstance(stage, LLMChain)
+            assert isinstance(stage, PromptStage)
 
 
 class TestPlatformChainsMockLLM:
     """Tests for platform chains with mocked LLM execution."""
 
-    @patch("shield_pr.chains.base.ResultParser")
-    def test_android_chain_execute_with_mock_llm(self, mock_parser_class):
+    @patch("shield_pr.chains.base._SHARED_PARSER")
+    def test_android_chain_execute_with_mock_llm(self, mock_parser):
         """Test AndroidReviewChain execute with mocked LLM."""
         # Setup mocks
         llm_client = MagicMock()
-        mock_parser = MagicMock()
-        mock_parser_class.return_value = mock_parser
 
         # Mock parser outputs
         from shield_pr.models.finding import Finding
@@ -198,8 +195,8 @@ class TestPlatformChainsMockLLM:
         chain = AndroidReviewChain(llm_client, depth="quick")
 
         # Mock stage outputs
-        for stage in chain.stages.values():
-            stage.invoke = MagicMock(return_value={"text": "Mock output"})
+        # Mock LLM responses
+        llm_client.invoke.return_value = "Mock output"
 
         result = chain.execute("code", "MainActivity.kt")
 
@@ -208,12 +205,10 @@ class TestPlatformChainsMockLLM:
         assert len(result.findings) == 1
         assert result.findings[0].severity == "HIGH"
 
-    @patch("shield_pr.chains.base.ResultParser")
-    def test_ios_chain_execute_with_mock_llm(self, mock_parser_class):
+    @patch("shield_pr.chains.base._SHARED_PARSER")
+    def test_ios_chain_execute_with_mock_llm(self, mock_parser):
         """Test IOSReviewChain execute with mocked LLM."""
         llm_client = MagicMock()
-        mock_parser = MagicMock()
-        mock_parser_class.return_value = mock_parser
 
         from shield_pr.models.review_result import ReviewResult
 
@@ -223,8 +218,8 @@ class TestPlatformChainsMockLLM:
 
         chain = IOSReviewChain(llm_client, depth="standard")
 
-        for stage in chain.stages.values():
-            stage.invoke = MagicMock(return_value={"text": "Clean code"})
+        # Mock LLM responses
+        llm_client.invoke.return_value = "Clean code"
 
         result = chain.execute("code", "ViewController.swift")
 
@@ -232,12 +227,10 @@ class TestPlatformChainsMockLLM:
         assert result.platform == "ios"
         assert len(result.findings) == 0
 
-    @patch("shield_pr.chains.base.ResultParser")
-    def test_frontend_chain_execute_with_mock_llm(self, mock_parser_class):
+    @patch("shield_pr.chains.base._SHARED_PARSER")
+    def test_frontend_chain_execute_with_mock_llm(self, mock_parser):
         """Test FrontendReviewChain execute with mocked LLM."""
         llm_client = MagicMock()
-        mock_parser = MagicMock()
-        mock_parser_class.return_value = mock_parser
 
         from shield_pr.models.finding import Finding
         from shield_pr.models.review_result import ReviewResult
@@ -252,8 +245,8 @@ class TestPlatformChainsMockLLM:
 
         chain = FrontendReviewChain(llm_client, depth="deep")
 
-        for stage in chain.stages.values():
-            stage.invoke = MagicMock(return_value={"text": "Analysis output"})
+        # Mock LLM responses
+        llm_client.invoke.return_value = "Analysis output"
 
         result = chain.execute("code", "app.js")
 
@@ -280,3 +273,60 @@ class TestPlatformChainsMockLLM:
                 selected_stages = chain._select_stages_by_depth()
                 assert isinstance(selected_stages, list)
                 assert len(selected_stages) > 0
+
+
+class TestPlatformChainsFused:
+    """Tests for reviewing all stages through one combined prompt."""
+
+    COMBINED_OUTPUT = (
+        '{"architecture": [{"severity": "HIGH", "category": "architecture", '
+        '"description": "God class"}], "platform_issues": [], "tests": [], '
+        '"improvements": [{"severity": "LOW", "category": "performance", '
+        '"description": "Use LazyColumn"}]}'
+    )
+
+    def test_fused_execute_makes_one_call(self):
+        """Test a fused review sends one prompt and distributes findings per stage."""
+        llm_client = MagicMock()
+        llm_client.invoke.return_value = self.COMBINED_OUTPUT
+        chain = AndroidReviewChain(llm_client, depth="standard")
+        chain.fused = True
+
+        result = chain.execute("class Main", "Main.kt")
+
+        llm_client.invoke.assert_called_once()
+        prompt = llm_client.invoke.call_args[0][0]
+        assert "# Architecture" in prompt and "# Improvements" in prompt
+        assert "class Main" in prompt
+        assert {finding.description for finding in result.findings} == {
+            "God class",
+            "Use LazyColumn",
+        }
+
+    @pytest.mark.asyncio
+    async def test_fused_aexecute_reports_findings(self):
+        """Test async fused reviews report findings through on_finding."""
+        llm_client = MagicMock()
+
+        async def ainvoke(prompt):
+            return self.COMBINED_OUTPUT
+
+        llm_client.ainvoke = ainvoke
+        chain = AndroidReviewChain(llm_client, depth="standard")
+        chain.fused = True
+        reported = []
+
+        result = await chain.aexecute("class Main", "Main.kt", on_finding=reported.append)
+
+        assert reported == result.findings
+        assert len(result.findings) == 2
+
+    def test_fused_prompt_covers_active_stages_only(self):
+        """Test the combined prompt holds one section per stage active at the depth."""
+        chain = AndroidReviewChain(MagicMock(), depth="quick")
+
+        template = chain._fused_stage().prompt.template
+
+        assert "# Architecture" in template and "# Improvements" in template
+        assert "# Tests" not in template
+        assert set(chain._fused_stage().prompt.input_variables) == {"code", "file_path"}
@@ -0,0 +1,309 @@
+"""Tests for prompt template pre-rendering."""
+
+import subprocess
+import sys
+
+import pytest
+from langchain.prompts import PromptTemplate  # type: ignore
+from shield_pr.chains.prompts import (
+    ANDROID_PROMPTS,
+    IOS_PROMPTS,
+    UNIVERSAL_PROMPTS,
+    SEVERITY_GUIDE,
+    get_combined_prompt,
+    get_prompt,
+)
+from shield_pr.chains.prompts.factory import PromptRef
+from shield_pr.chains.prompts import budget
+from shield_pr.chains.prompts.code_preproc import language_for, prepare, truncated_lines
+from shield_pr.chains.prompts.fast import FastPrompt
+from shield_pr.chains.prompts.prerender import inline_partials
+from shield_pr.core.errors import PromptBudgetError
+
+
+class TestInlinePartials:
+    """Tests for inlining static partials."""
+
+    def test_partials_inlined(self):
+        """Test partial values are baked into the template text."""
+        prompt = PromptTemplate(
+            template="Guide: {guide}\nCode: {code}",
+            input_variables=["code"],
+            partial_variables={"guide": "be {strict}"},
+        )
+
+        rendered = PromptTemplate(
+            template=inline_partials(prompt.template, prompt.partial_variables),
+            input_variables=["code"],
+        )
+
+        assert rendered.format(code="x = 1") == prompt.format(code="x = 1")
+
+    def test_platform_prompts_have_severity_guide_inlined(self):
+        """Test shipped prompts embed the severity guide without partials."""
+        for prompts in (ANDROID_PROMPTS, UNIVERSAL_PROMPTS):
+            for prompt in prompts.values():
+                assert "severity_guide" not in prompt.input_variables
+                values = {name: "x" for name in prompt.input_variables}
+                assert SEVERITY_GUIDE in prompt.format(**values)
+
+
+class TestFastPrompt:
+    """Tests for %-formatted prompts."""
+
+    def test_matches_prompt_template(self):
+        """Test output is identical to PromptTemplate.format, including literal % and braces."""
+        template = 'File: {file_path}\n{code}\n100% sure: {{"findings": []}}'
+        reference = PromptTemplate.from_template(template)
+        values = {"code": "print('%s {x}' % y)", "file_path": "a.py"}
+
+        assert FastPrompt.from_template(template).format(**values) == reference.format(**values)
+
+    def test_input_variables_and_extra_keys(self):
+        """Test variables are inferred and unused context keys are ignored."""
+        prompt = FastPrompt("{code} {file_path} {code}")
+
+        assert prompt.input_variables == ("code", "file_path")
+        assert prompt.format(code="x", file_path="p", tests_result="unused") == "x p x"
+
+    def test_missing_variable_raises(self):
+        """Test missing inputs raise KeyError."""
+        with pytest.raises(KeyError):
+            FastPrompt("{code}").format(file_path="a.py")
+
+    def test_format_specs_rejected(self):
+        """Test placeholders beyond plain names are rejected."""
+        with pytest.raises(ValueError, match="Unsupported placeholder"):
+            FastPrompt("{code!r}")
+
+    def test_system_text_split_at_last_blank_line(self):
+        """Test static instructions become the system text and inputs the human text."""
+        prompt = FastPrompt('Rules 100%\n\n{{"done": true}}\n\nFile: {file_path}\n{code}')
+        values = {"code": "x", "file_path": "a.py"}
+
+        assert prompt.system == 'Rules 100%\n\n{"done": true}'
+        assert prompt.format_human(**values) == "File: a.py\nx"
+        assert f"{prompt.system}\n\n{prompt.format_human(**values)}" == prompt.format(**values)
+
+    def test_no_system_text_without_static_block(self):
+        """Test prompts without a blank line before the inputs stay one message."""
+        prompt = FastPrompt("Review {code}")
+
+        assert prompt.system == ""
+        assert prompt.format_human(code="x") == prompt.format(code="x") == "Review x"
+
+    def test_shipped_prompts_are_fast(self):
+        """Test shipped prompts use FastPrompt."""
+        for prompt in ANDROID_PROMPTS.values():
+            assert isinstance(prompt, FastPrompt)
+
+
+class TestPromptFactory:
+    """Tests for lazily built prompt templates."""
+
+    def test_get_prompt_cached(self):
+        """Test prompts are built once and shared."""
+        assert get_prompt("ios", "architecture") is get_prompt("ios", "architecture")
+        assert get_prompt("ios", "architecture") is IOS_PROMPTS["architecture"]
+
+    def test_input_variables_inferred(self):
+        """Test input variables come from the template placeholders."""
+        prompt = get_prompt("universal", "best_practices")
+
+        assert set(prompt.input_variables) == {
+            "code",
+            "file_path",
+            "security_result",
+            "readability_result",
+        }
+
+    def test_lazy_mapping_lists_stages(self):
+        """Test platform mappings expose stage names without building them."""
+        assert list(ANDROID_PROMPTS) == ["architecture", "platform_issues", "tests", "improvements"]
+        assert len(UNIVERSAL_PROMPTS) == 3
+
+    def test_prompt_ref_resolves(self):
+        """Test PromptRef resolves to the shared template."""
+        assert PromptRef("android", "tests").resolve() is ANDROID_PROMPTS["tests"]
+
+    def test_unknown_stage_raises(self):
+        """Test unknown stages raise KeyError."""
+        with pytest.raises(KeyError):
+            get_prompt("android", "unknown")
+
+    def test_findings_schema_rendered_per_stage(self):
+        """Test each prompt carries the shared schema with its own categories."""
+        values = {"code": "x", "file_path": "a.kt", "architecture_result": ""}
+        text = get_prompt("android", "platform_issues").format(**values)
+
+        assert '"category": "lifecycle|memory-leak|anr|permissions|compose|threading"' in text
+        assert '"file_path": "<reviewed file path>"' in text
+        assert '{"done": true}' in text
+        assert "Respond with ONLY the JSON, no markdown fences, no prose." in text
+
+    def test_system_text_precedes_inputs(self):
+        """Test instructions, guide and schema form system text shared by every call."""
+        for platform, stages in (("android", ANDROID_PROMPTS), ("universal", UNIVERSAL_PROMPTS)):
+            for stage in stages:
+                prompt = get_prompt(platform, stage)
+                values = {name: f"<{name}>" for name in prompt.input_variables}
+
+                assert SEVERITY_GUIDE.strip() in prompt.system
+                assert '{"done": true}' in prompt.system
+                assert prompt.format(**values).startswith(prompt.system)
+                assert prompt.format_human(**values).startswith("File: ")
+
+    def test_partials_shared_and_read_only(self):
+        """Test every prompt inlines the one shared, immutable partials mapping."""
+        from shield_pr.chains.prompts.severity_guide import PROMPT_PARTIALS
+
+        assert PROMPT_PARTIALS["severity_guide"] is SEVERITY_GUIDE
+        with pytest.raises(TypeError):
+            PROMPT_PARTIALS["severity_guide"] = "changed"  # type: ignore[index]
+
+    def test_definitions_upstream_stages_run_first(self):
+        """Test every stage only consumes results of stages declared before it."""
+        from shield_pr.chains.prompts.factory import _definitions
+
+        for platform, definition in _definitions().items():
+            seen = []
+            for stage, spec in definition["stages"].items():
+                assert spec["categories"], (platform, stage)
+                assert set(spec.get("uses", [])) <= set(seen), (platform, stage)
+                seen.append(stage)
+
+    def test_stage_role_override(self):
+        """Test a stage-level role replaces the platform role."""
+        text = get_prompt("universal", "security").format(code="x", file_path="a.py")
+
+        assert text.startswith("You are an expert security code reviewer.")
+        assert "Focus (OWASP Top 10):" in text
+
+    def test_severity_guide_compact(self):
+        """Test prompts carry the compact one-line severity guide."""
+        text = get_prompt("android", "architecture").format(code="x", file_path="a.kt")
+
+        assert "Severity Rating Guidelines" not in text
+        for level in ("HIGH=", "MEDIUM=", "LOW="):
+            assert level in text
+
+
+class TestCombinedPrompt:
+    """Tests for the fused multi-stage prompt."""
+
+    def test_sections_and_schema(self):
+        """Test each stage becomes a section with its own categories."""
+        prompt = get_combined_prompt("android", ("architecture", "platform_issues"))
+        text = prompt.format(code="x", file_path="a.kt")
+
+        assert text.index("# Architecture") < text.index("# Platform Issues")
+        assert "Categories: lifecycle|memory-leak|anr|permissions|compose|threading" in text
+        assert '{"architecture": [<finding>], "platform_issues": [<finding>]}' in text
+        assert text.count(SEVERITY_GUIDE) == 1
+
+    def test_combined_prompt_cached(self):
+        """Test combined prompts are built once per stage set."""
+        stages = ("security", "readability")
+
+        assert get_combined_prompt("universal", stages) is get_combined_prompt("universal", stages)
+
+
+class TestCodePreprocessing:
+    """Tests for review input preparation."""
+
+    def test_full_file_keeps_line_numbers(self):
+        """Test whitespace is normalized without moving any line."""
+        code = "fun a() {  \r\n\r\n\r\n\r\n    val x = 1\t\r\n}\r\n"
+
+        prepared = prepare(code)
+
+        assert prepared == "fun a() {\n\n\n\n    val x = 1\n}"
+
+    def test_diff_keeps_blank_context_lines(self):
+        """Test blank context lines keep their marker so hunk counts still match."""
+        patch = "@@ -1,4 +1,5 @@\n a  \n \n \n+b\t\n c\n"
+
+        assert prepare(patch, is_diff=True) == "@@ -1,4 +1,5 @@\n a\n \n \n+b\n c"
+
+    def test_full_file_containing_hunk_header_keeps_lines(self):
+        """Test a source file quoting a hunk header is not treated as a diff."""
+        code = 'FIXTURE = """\n@@ -1 +1 @@\n\n\n\n"""\n'
+
+        assert prepare(code, budget_tokens=1000) == code.rstrip("\n")
+
+    def test_diff_over_budget_drops_context(self):
+        """Test dropped context splits hunks under headers with real line numbers."""
+        context = "".join(f" context line {i}\n" for i in range(50))
+        patch = f"@@ -1,53 +1,53 @@ fun a()\n+added\n{context}-removed\n context\n"
+
+        prepared = prepare(patch, budget_tokens=20, is_diff=True)
+
+        assert prepared == "@@ -0,0 +1,1 @@ fun a()\n+added\n@@ -51,1 +51,0 @@\n-removed"
+
+    def test_truncated_diff_hunk_recounted(self):
+        """Test a hunk cut short by the budget counts only its kept lines."""
+        patch = "@@ -5,0 +6,40 @@\n" + "".join(f"+line {i}\n" for i in range(40))
+
+        prepared = prepare(patch, budget_tokens=10, is_diff=True)
+
+        assert prepared == "@@ -5,0 +6,2 @@\n+line 0\n+line 1\n... [38 more lines truncated]"
+        assert truncated_lines(prepared) == 38
+
+    def test_truncates_over_budget(self):
+        """Test input still over budget is cut at a line boundary."""
+        code = "\n".join(f"line {i}" for i in range(100))
+
+        prepared = prepare(code, budget_tokens=10)
+
+        assert len(prepared) < 80
+        assert prepared.startswith("line 0\nline 1\n")
+        assert prepared.endswith("more lines truncated]")
+        assert truncated_lines(prepared) == 100 - prepared.count("\n")
+        assert truncated_lines(prepare(code)) == 0
+
+    def test_language_for(self):
+        """Test languages are guessed from file extensions."""
+        assert language_for("app/Main.KT") == "kotlin"
+        assert language_for("README") == ""
+
+
+class TestTokenBudgets:
+    """Tests guarding template size against the declared budgets."""
+
+    def test_templates_within_budget(self):
+        """Test every stage template fits its token_budget."""
+        budget.check_token_budgets()
+
+        assert len(budget.token_budgets()) == 23
+
+    def test_over_budget_template_fails(self, monkeypatch):
+        """Test a template over its budget raises and is named in the error."""
+        monkeypatch.setattr(budget, "token_budgets", lambda: {("android", "tests"): 10})
+
+        with pytest.raises(PromptBudgetError, match="android/tests"):
+            budget.check_token_budgets()
+
+    def test_counts_sorted_heaviest_first(self):
+        """Test counts are reported heaviest first."""
+        tokens = [row[2] for row in budget.template_token_counts()]
+
+        assert tokens == sorted(tokens, reverse=True)
+
+
+class TestPromptImportCost:
+    """Tests that the prompts package stays free of LangChain."""
+
+    def test_building_prompts_does_not_import_langchain(self):
+        """Test importing prompts and formatting one loads no langchain modules."""
+        code = (
+            "import sys\n"
+            "from shield_pr.chains.prompts import ANDROID_PROMPTS, SEVERITY_GUIDE\n"
+            "ANDROID_PROMPTS['tests'].format(code='x', file_path='a.kt', "
+            "architecture_result='', platform_issues_result='')\n"
+            "print(any(name.startswith('langchain') for name in sys.modules))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "False"
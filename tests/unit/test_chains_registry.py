@@ -159,3 +159,12 @@ class TestGetChainFactory:
             assert chain.depth == "standard"
             assert chain.llm == llm_client
             assert hasattr(chain, "execute")
+
+    def test_platform_chains_have_no_instance_dict(self):
+        """Test platform chains use __slots__ instead of a per-instance dict."""
+        llm_client = MagicMock()
+
+        for platform in CHAIN_REGISTRY:
+            chain = get_chain(platform, llm_client)
+            assert not hasattr(chain, "__dict__")
+            assert chain.result_cache is None
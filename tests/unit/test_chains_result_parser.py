@@ -1,7 +1,9 @@
 """Tests for ResultParser (3-tier parsing fallback)."""
 
+import asyncio
+
 import pytest
-from shield_pr.chains.result_parser import ResultParser
+from shield_pr.chains.result_parser import ResultParser, _load_json_object
 from shield_pr.models.finding import Finding
 
 
@@ -209,6 +211,55 @@ class TestResultParserManualJsonExtract:
         assert findings == []
 
 
+class TestResultParserTextExtraction:
+    """Tests for description and suggestion extraction from prose findings."""
+
+    def test_description_stops_at_first_suggestion_prefix(self):
+        """Test everything from the first suggestion-style prefix is dropped."""
+        parser = ResultParser()
+        text = "Unchecked input\n```py\nx = y\n```\nfix: sanitize\nSuggestion: validate"
+
+        assert parser._extract_description(text) == "Unchecked input"
+
+    def test_segments_split_on_any_list_marker(self):
+        """Test bullets and numbered items split in one pass; capitals do not."""
+        parser = ResultParser()
+        text = "Findings:\n- HIGH: I found SQL injection\n2. LOW: naming\n* MEDIUM: leak"
+
+        assert parser._split_into_segments(text) == [
+            "Findings:",
+            "HIGH: I found SQL injection",
+            "LOW: naming",
+            "MEDIUM: leak",
+        ]
+
+    def test_suggestion_skips_short_matches(self):
+        """Test the first suggestion with real content is returned."""
+        parser = ResultParser()
+        text = "Issue\nFix: n/a\nRecommendation: Use parameterized queries"
+
+        assert parser._extract_suggestion(text) == "Use parameterized queries"
+        assert parser._extract_suggestion("No advice here") is None
+
+    def test_severity_first_whole_word_wins(self):
+        """Test severity is the first whole-word level, defaulting to LOW."""
+        parser = ResultParser()
+
+        assert parser._extract_severity("low impact but high visibility") == "LOW"
+        assert parser._extract_severity("Severity: Medium") == "MEDIUM"
+        assert parser._extract_severity("Highlight the follow-up") == "LOW"
+        assert parser._extract_severity("No level given") == "LOW"
+
+    def test_category_from_text_or_stage_name(self):
+        """Test category keywords win over the stage name fallback."""
+        parser = ResultParser()
+
+        assert parser._extract_category("A Code Smell here", "perf_result") == "code smell"
+        assert parser._extract_category("debugging output", "error_handling_result") == (
+            "error handling"
+        )
+
+
 class TestResultParserSummaryGeneration:
     """Tests for summary generation from findings."""
 
@@ -372,3 +423,158 @@ class TestResultParserConfidenceCalculation:
         confidence = parser.calculate_confidence(result, "deep", depth_stages)
 
         assert confidence <= 0.95
+
+
+async def _collect_stream(parser, chunks, stage_name="architecture_result"):
+    """Feed chunks through the streaming extractor and collect findings."""
+    queue = asyncio.Queue()
+    for chunk in chunks:
+        queue.put_nowait(chunk)
+    queue.put_nowait(None)
+    return [f async for f in parser.aextract_findings_stream(queue, stage_name, "app.py")]
+
+
+class TestResultParserStreaming:
+    """Tests for incremental findings extraction from streamed output."""
+
+    @pytest.mark.asyncio
+    async def test_stream_emits_json_findings_split_across_chunks(self):
+        """Test objects split over chunk boundaries are reassembled."""
+        parser = ResultParser()
+        chunks = [
+            '{"findings": [{"severity": "high", "category": "security", "desc',
+            'ription": "Uses {braces} in text", "line_number": 3},',
+            ' {"severity": "LOW", "description": "Second"}]}',
+        ]
+
+        findings = await _collect_stream(parser, chunks)
+
+        assert [f.description for f in findings] == ["Uses {braces} in text", "Second"]
+        assert findings[0].severity == "HIGH"
+        assert findings[0].line_number == 3
+        assert findings[1].category == "architecture"
+        assert all(f.file_path == "app.py" for f in findings)
+
+    @pytest.mark.asyncio
+    async def test_stream_single_character_chunks(self):
+        """Test findings survive chunks that split every character, around prose."""
+        parser = ResultParser()
+        text = (
+            'Findings follow.\n{"severity": "HIGH", "description": "first \\"quoted\\" }"}\n'
+            'note\n{"findings": [{"severity": "LOW", "description": "second"}]}'
+        )
+
+        findings = await _collect_stream(parser, list(text))
+
+        assert [f.description for f in findings] == ['first "quoted" }', "second"]
+
+    @pytest.mark.asyncio
+    async def test_stream_falls_back_to_text_parsing(self):
+        """Test non-JSON output is parsed as text at end of stream."""
+        parser = ResultParser()
+
+        findings = await _collect_stream(parser, ["- HIGH security issue", " on line 4"])
+
+        assert len(findings) == 1
+        assert findings[0].severity == "HIGH"
+        assert findings[0].line_number == 4
+
+
+class TestResultParserJSONOutput:
+    """Tests for decoding structured JSON stage output."""
+
+    def test_fenced_json_findings_decoded(self):
+        """Test a fenced {"findings": [...]} payload becomes findings."""
+        parser = ResultParser()
+        text = (
+            "```json\n"
+            '{"findings": [{"severity": "high", "category": "security", '
+            '"line_number": 12, "description": "SQL injection", "suggestion": "Use params"}]}\n'
+            "```"
+        )
+
+        findings = parser._parse_stage_output(text, "security_result", "app.py")
+
+        assert len(findings) == 1
+        assert findings[0].severity == "HIGH"
+        assert findings[0].line_number == 12
+        assert findings[0].file_path == "app.py"
+
+    def test_empty_findings_list_yields_nothing(self):
+        """Test an explicit empty findings list is not re-parsed as prose."""
+        parser = ResultParser()
+
+        assert parser._parse_stage_output('{"findings": []}', "tests_result", "a.py") == []
+
+    def test_json_lines_decoded_until_done(self):
+        """Test one-finding-per-line output stops at the done marker."""
+        parser = ResultParser()
+        text = (
+            '{"severity": "HIGH", "category": "security", "description": "SQL injection"}\n'
+            '{"severity": "LOW", "category": "style", "description": "Long line"}\n'
+            '{"done": true}\n'
+            '{"severity": "LOW", "description": "after done"}\n'
+        )
+
+        findings = parser._parse_stage_output(text, "security_result", "app.py")
+
+        assert [f.description for f in findings] == ["SQL injection", "Long line"]
+
+    def test_load_json_object_strict_and_wrapped(self):
+        """Test strict JSON decodes directly and wrapped JSON via the fallback."""
+        assert _load_json_object('{"findings": []}') == {"findings": []}
+        assert _load_json_object('Here you go:\n```json\n{"a": 1}\n```') == {"a": 1}
+        assert _load_json_object("no json here") is None
+
+    def test_json_lines_done_only_yields_nothing(self):
+        """Test a bare done marker means no findings."""
+        parser = ResultParser()
+
+        assert parser._parse_stage_output('{"done": true}', "tests_result", "a.py") == []
+
+    @pytest.mark.asyncio
+    async def test_json_lines_streamed_per_line(self):
+        """Test streamed JSON Lines yield each finding as its line completes."""
+        parser = ResultParser()
+        queue: asyncio.Queue = asyncio.Queue()
+        for chunk in ('{"severity": "HIGH", "descr', 'iption": "first"}\n{"done": true}\n', None):
+            queue.put_nowait(chunk)
+
+        findings = [f async for f in parser.aextract_findings_stream(queue, "security_result", "a.py")]
+
+        assert [f.description for f in findings] == ["first"]
+
+
+class TestResultParserCombinedOutput:
+    """Tests for splitting fused-prompt output into stage results."""
+
+    def test_split_distributes_arrays(self):
+        """Test each stage gets its own findings array."""
+        parser = ResultParser()
+        text = 'Result:\n{"security": [{"severity": "HIGH", "description": "SQLi"}], "readability": []}'
+
+        results = parser.split_combined_output(text, ["security", "readability", "best_practices"])
+
+        findings = parser.extract_findings({"security_result": results["security_result"]}, "a.py")
+        assert findings[0].description == "SQLi"
+        assert results["readability_result"] == '{"findings":[]}'
+        assert results["best_practices_result"] == '{"findings":[]}'
+
+    def test_split_without_json_keeps_text(self):
+        """Test unstructured output is kept for the segment parser."""
+        parser = ResultParser()
+
+        results = parser.split_combined_output("HIGH: SQL injection", ["security", "readability"])
+
+        assert results == {"security_result": "HIGH: SQL injection", "readability_result": ""}
+
+    def test_split_batch_output_by_file(self):
+        """Test multi-file output is keyed back to each file path."""
+        parser = ResultParser()
+        text = '{"a.py": [{"severity": "LOW", "description": "nit"}], "c.py": []}'
+
+        results = parser.split_batch_output(text, ["a.py", "b.py"])
+
+        assert parser.extract_findings({"x_result": results["a.py"]}, "a.py")[0].description == "nit"
+        assert results["b.py"] == '{"findings":[]}'
+        assert parser.split_batch_output("not json", ["a.py"]) is None
@@ -1,6 +1,7 @@
 """Tests for SynthesisChain (deduplication and prioritization)."""
 
 import pytest
+from unittest.mock import patch
 from shield_pr.chains.synthesis_chain import SynthesisChain
 from shield_pr.models.finding import Finding
 from shield_pr.models.review_result import ReviewResult
@@ -173,6 +174,68 @@ class TestSynthesisChainDeduplication:
         # Different files - should keep both
         assert len(deduplicated) == 2
 
+    def test_deduplicate_compares_only_same_category_and_file(self):
+        """Test findings in different category/file buckets are never compared."""
+        chain = SynthesisChain()
+        findings = [
+            Finding(
+                severity="LOW",
+                category=category,
+                file_path=file_path,
+                line_number=10,
+                description="Issue",
+                suggestion="Fix",
+            )
+            for category in ("security", "performance")
+            for file_path in ("a.kt", "b.kt")
+        ]
+
+        with patch.object(chain, "_are_similar", wraps=chain._are_similar) as are_similar:
+            result = chain._deduplicate(findings)
+
+        assert result == findings
+        assert are_similar.call_count == 0
+
+    def test_deduplicate_exact_description_skips_fuzzy_check(self):
+        """Test an identical description replaces in place without a fuzzy check."""
+        chain = SynthesisChain()
+        low = Finding(
+            severity="LOW",
+            category="security",
+            file_path="a.kt",
+            description="Hardcoded key",
+            suggestion="Fix",
+        )
+        high = low.model_copy(update={"severity": "HIGH"})
+
+        with patch.object(chain, "_are_similar", wraps=chain._are_similar) as are_similar:
+            result = chain._deduplicate([low, high])
+
+        assert result == [high]
+        assert are_similar.call_count == 0
+
+    def test_deduplicate_ignores_case_and_whitespace(self):
+        """Test descriptions differing only in case or spacing are duplicates."""
+        chain = SynthesisChain()
+        findings = [
+            Finding(
+                severity="MEDIUM",
+                category="security",
+                file_path="a.kt",
+                description="SQL Injection in query",
+                suggestion="Fix",
+            ),
+            Finding(
+                severity="HIGH",
+                category="security",
+                file_path="a.kt",
+                description="sql  injection in QUERY ",
+                suggestion="Fix",
+            ),
+        ]
+
+        assert chain._deduplicate(findings) == [findings[1]]
+
     def test_deduplicate_empty_list(self):
         """Test deduplication handles empty list."""
         chain = SynthesisChain()
@@ -316,6 +379,36 @@ class TestSynthesisChainSimilarityDetection:
         # 10 lines apart and different descriptions
         assert chain._are_similar(finding1, finding2) is False
 
+    def test_similar_descriptions_matches_ratio(self):
+        """Test the prefiltered check agrees with SequenceMatcher.ratio() > 0.8."""
+        from difflib import SequenceMatcher
+
+        pairs = [
+            ("SQL injection in query", "SQL injection in queries"),
+            ("SQL injection", "SQL injection in the user lookup query"),
+            ("Null check missing", "Missing null check"),
+            ("", ""),
+        ]
+        for desc1, desc2 in pairs:
+            expected = SequenceMatcher(None, desc1, desc2).ratio() > 0.8
+            matcher = SequenceMatcher(None, "", desc2)
+
+            assert SynthesisChain._similar_descriptions(desc1, desc2) is expected
+            assert SynthesisChain._similar_descriptions(desc1, desc2, matcher) is expected
+
+    def test_indel_ratio_bounds_sequence_matcher(self):
+        """Test the optional RapidFuzz prefilter never rejects a similar pair."""
+        from difflib import SequenceMatcher
+
+        fuzz = pytest.importorskip("rapidfuzz.fuzz")
+        pairs = [
+            ("SQL injection in query", "SQL injection in queries"),
+            ("Null check missing", "Null-check missng"),
+            ("abcdefghij", "jihgfedcba"),
+        ]
+        for desc1, desc2 in pairs:
+            assert fuzz.ratio(desc1, desc2) / 100 >= SequenceMatcher(None, desc1, desc2).ratio()
+
 
 class TestSynthesisChainPrioritization:
     """Tests for finding prioritization logic."""
@@ -75,3 +75,29 @@ class TestMainCommand:
         """Test main without debug flag."""
         result = runner.invoke(main, ["version"])
         assert result.exit_code == 0
+
+    def test_main_imports_review_commands_lazily(self):
+        """Test importing the CLI does not load the review pipeline."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, shield_pr.cli; "
+            "print('shield_pr.core.review_pipeline' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "False"
+
+    def test_lazy_command_help_matches_commands(self):
+        """Test the stored short help matches each command's own help."""
+        import click
+
+        from shield_pr.cli import _LAZY_COMMANDS
+
+        ctx = click.Context(main)
+        for name, (_, short_help) in _LAZY_COMMANDS.items():
+            command = main.get_command(ctx, name)
+            assert command.get_short_help_str(200) == short_help
@@ -0,0 +1,45 @@
+"""Unit tests for review-pr command helpers."""
+
+from unittest.mock import MagicMock
+
+from shield_pr.commands.review_pr import _exceeds_pr_limits
+from shield_pr.config.models import ReviewConfig
+from shield_pr.git.pr_helpers import PRMetadata
+from shield_pr.git.pr_info import _get_gitlab_info
+
+
+class TestExceedsPRLimits:
+    """Tests for checking PR metadata against size limits."""
+
+    def test_github_counts(self):
+        """Test integer counts from GitHub are compared to the limits."""
+        config = ReviewConfig(max_files_per_pr=10, max_lines_per_pr=100)
+        assert not _exceeds_pr_limits(
+            {'changed_files': 3, 'additions': 40, 'deletions': 20}, config
+        )
+        assert _exceeds_pr_limits({'changed_files': 11}, config)
+        assert _exceeds_pr_limits({'additions': 80, 'deletions': 21}, config)
+
+    def test_gitlab_capped_changes_count(self):
+        """Test GitLab's "1000+" string counts as over a 1000-file limit."""
+        fetcher = MagicMock()
+        fetcher.GITLAB_API = "https://gitlab.example/{owner}/{repo}/merge_requests/{number}"
+        fetcher._make_request.return_value.json.return_value = {
+            'title': 'Big MR',
+            'author': {'username': 'dev'},
+            'state': 'opened',
+            'changes_count': '1000+',
+        }
+        info = _get_gitlab_info(fetcher, PRMetadata('gitlab', 'group', 'proj', 7))
+
+        assert _exceeds_pr_limits(info, ReviewConfig(max_files_per_pr=1000))
+        assert not _exceeds_pr_limits(
+            {'changed_files': '12'}, ReviewConfig(max_files_per_pr=200)
+        )
+
+    def test_unparseable_counts_are_ignored(self):
+        """Test missing or malformed counts do not raise."""
+        config = ReviewConfig(max_files_per_pr=10, max_lines_per_pr=100)
+        assert not _exceeds_pr_limits(
+            {'changed_files': 'n/a', 'additions': None, 'deletions': ''}, config
+        )
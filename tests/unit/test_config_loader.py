@@ -52,6 +52,18 @@ class TestLoadYAMLConfig:
         finally:
             os.unlink(temp_path)
 
+    def test_reload_after_edit_returns_fresh_copy(self, tmp_path):
+        """Should re-read an edited file and not share results between calls."""
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump({"review": {"depth": "quick"}}))
+
+        first = load_yaml_config(str(path))
+        first["review"]["depth"] = "mutated"
+        assert load_yaml_config(str(path))["review"]["depth"] == "quick"
+
+        path.write_text(yaml.dump({"review": {"depth": "deep", "extra": 1}}))
+        assert load_yaml_config(str(path))["review"]["depth"] == "deep"
+
 
 class TestLoadEnvOverrides:
     """Test environment variable loading."""
@@ -84,6 +96,14 @@ class TestLoadEnvOverrides:
         assert result["review"]["platforms"] == ["android", "ios", "backend"]
         assert result["review"]["focus_areas"] == ["security", "performance"]
 
+    def test_unset_and_empty_vars_are_skipped(self, monkeypatch):
+        """Should only build sections for variables that are set and non-empty."""
+        for name in [n for n in os.environ if n.startswith("CRA_")]:
+            monkeypatch.delenv(name)
+        monkeypatch.setenv("CRA_MODEL", "")
+        monkeypatch.setenv("CRA_OUTPUT_FORMAT", "json")
+        assert load_env_overrides() == {"output": {"format": "json"}}
+
 
 class TestMergeConfigs:
     """Test configuration merging logic."""
@@ -110,6 +130,15 @@ class TestMergeConfigs:
         result = merge_configs(base, override)
         assert result["api"]["model"] == "gemini-1.5-pro"
 
+    def test_falsy_overrides_apply(self):
+        """Should apply False, 0 and empty-list overrides but skip None."""
+        base = {"api": {"max_tokens": 4096, "model": "m"}, "review": {"platforms": ["ios"]}}
+        override = {"api": {"max_tokens": 0, "model": None}, "review": {"platforms": []}}
+        result = merge_configs(base, override)
+        assert result["api"] == {"max_tokens": 0, "model": "m"}
+        assert result["review"]["platforms"] == []
+        assert base["api"]["max_tokens"] == 4096
+
 
 class TestLoadConfig:
     """Test full configuration loading with validation."""
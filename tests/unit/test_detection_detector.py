@@ -7,7 +7,7 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
-from shield_pr.detection.detector import PlatformDetector
+from shield_pr.detection.detector import CONTENT_PEEK_BYTES, PlatformDetector, _peek_file
 
 
 class TestDetectorBasic:
@@ -108,6 +108,19 @@ class TestDetectorBatch:
         results = self.detector.detect_batch([])
         assert results == {}
 
+    def test_batch_matches_single_detection(self, tmp_path):
+        """Should give the same results as detecting each file on its own."""
+        (tmp_path / "model.py").write_text("import torch\nimport numpy as np\n")
+        (tmp_path / "views.py").write_text("from django.db import models\n")
+        (tmp_path / "Main.kt").write_text("class Main\n")
+        files = [str(p) for p in sorted(tmp_path.iterdir())]
+
+        results = self.detector.detect_batch(files)
+
+        assert list(results) == files
+        for file_path in files:
+            assert results[file_path] == self.detector.detect(file_path)
+
     def test_batch_preserves_file_paths(self):
         """Should preserve file paths as keys in results."""
         files = ["path/to/file1.kt", "another/file2.swift"]
@@ -211,3 +224,24 @@ class TestDetectorIntegration:
         platform, confidence, _ = self.detector.detect("main.py", content=content)
         assert platform == "backend"
         assert confidence > 0.3
+
+    def test_reads_only_start_of_large_file(self, tmp_path):
+        """Should analyze the head of an ambiguous file without reading all of it."""
+        path = tmp_path / "train.py"
+        head = "import tensorflow as tf\nimport torch\nmodel = tf.keras.Sequential()\nneural network\n"
+        path.write_text(head + "x = 1\n" * 100_000)
+
+        with patch(
+            "shield_pr.detection.detector._peek_file", wraps=_peek_file
+        ) as peek:
+            platform, _, _ = self.detector.detect(str(path))
+
+        peek.assert_called_once_with(str(path))
+        assert platform == "ai-ml"
+        assert len(_peek_file(str(path))) == CONTENT_PEEK_BYTES
+
+    def test_peek_ignores_split_utf8(self, tmp_path):
+        """Should drop a multi-byte character cut off at the limit."""
+        path = tmp_path / "notes.py"
+        path.write_bytes("é".encode("utf-8") * 3)
+        assert _peek_file(str(path), limit=5) == "éé"
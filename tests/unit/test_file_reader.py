@@ -0,0 +1,34 @@
+"""Tests for file reader utility."""
+
+import pytest
+
+from shield_pr.utils.file_reader import FileReader
+
+
+class TestAreadFiles:
+    """Tests for concurrent file reads."""
+
+    @pytest.mark.asyncio
+    async def test_reads_files_in_input_order(self, tmp_path):
+        """Test contents come back keyed and ordered like the input."""
+        paths = []
+        for name in ("c.py", "a.py", "b.py"):
+            path = tmp_path / name
+            path.write_text(f"# {name}\n")
+            paths.append(str(path))
+
+        contents = await FileReader().aread_files(paths)
+
+        assert list(contents) == paths
+        assert contents[paths[0]] == "# c.py\n"
+
+    @pytest.mark.asyncio
+    async def test_missing_file_is_none(self, tmp_path):
+        """Test unreadable files map to None like read_files."""
+        present = tmp_path / "a.py"
+        present.write_text("x = 1\n")
+        missing = str(tmp_path / "gone.py")
+
+        contents = await FileReader().aread_files([str(present), missing])
+
+        assert contents == {str(present): "x = 1\n", missing: None}
@@ -0,0 +1,33 @@
+"""Tests for atomic output file writing."""
+
+from unittest.mock import patch
+
+import pytest
+
+from shield_pr.utils.file_writer import write_text_atomic
+
+
+class TestWriteTextAtomic:
+    """Test write_text_atomic."""
+
+    def test_replaces_existing_file(self, tmp_path):
+        """Should overwrite the destination with UTF-8 text and leave no temp file."""
+        target = tmp_path / "review.md"
+        target.write_text("old")
+
+        write_text_atomic(str(target), "# Review ✓\n")
+
+        assert target.read_text(encoding="utf-8") == "# Review ✓\n"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_failed_rename_keeps_previous_content(self, tmp_path):
+        """Should leave the old file intact if the write cannot complete."""
+        target = tmp_path / "review.md"
+        target.write_text("old")
+
+        with patch("shield_pr.utils.file_writer.os.replace", side_effect=OSError("disk")):
+            with pytest.raises(OSError):
+                write_text_atomic(str(target), "new")
+
+        assert target.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [target]
@@ -76,3 +76,13 @@ class TestDiffParser:
         """Test parse_single_file with empty input."""
         result = parser.parse_single_file("")
         assert result is None
+
+    def test_iter_parse_yields_each_file_lazily(self, parser, sample_diff):
+        """Test iter_parse yields a file before later lines are consumed."""
+        second = sample_diff.replace("file.py", "other.py")
+        lines = iter((sample_diff + second).split("\n"))
+
+        parsed = parser.iter_parse(lines)
+        first = next(parsed)
+        assert first.file_path == "file.py"
+        assert next(lines).startswith("+++")  # second file not yet read
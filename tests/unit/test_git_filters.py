@@ -91,3 +91,19 @@ class TestDiffFilter:
         """Test with no size limit."""
         filter_obj = DiffFilter(max_file_size=0)
         assert filter_obj.is_too_large("large.py", temp_dir) is False
+
+    def test_nested_and_gitignore_patterns(self, temp_dir):
+        """Test multi-segment, negated and .gitignore patterns."""
+        (temp_dir / ".gitignore").write_text("# comment\nsecrets/*.env\n!keep.py\n")
+        filter_obj = DiffFilter(ignore_patterns=["docs/*.md"])
+
+        assert filter_obj.should_ignore("app/docs/readme.md", temp_dir) is True
+        assert filter_obj.should_ignore("app/secrets/prod.env", temp_dir) is True
+        assert filter_obj.should_ignore("app/readme.md", temp_dir) is False
+        assert filter_obj.should_ignore("keep.py", temp_dir) is False
+
+    def test_missing_file_is_kept(self, temp_dir):
+        """Test deleted files are neither too large nor binary."""
+        filter_obj = DiffFilter()
+        assert filter_obj.is_too_large("gone.py", temp_dir) is False
+        assert filter_obj.is_binary_file("gone.py", temp_dir) is False
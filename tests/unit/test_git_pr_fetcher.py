@@ -2,11 +2,13 @@
 Unit tests for PRFetcher.
 """
 
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
 from shield_pr.git.pr_fetcher import PRFetcher, PRMetadata
-from shield_pr.core.errors import ValidationError
+from shield_pr.core.errors import APIError, ValidationError
 
 
 class TestPRFetcher:
@@ -80,3 +82,59 @@ class TestPRFetcher:
         mock_get.side_effect = Exception("Network error")
         with pytest.raises(Exception):  # APIError wraps this
             fetcher._make_request("http://example.com")
+
+    @patch('shield_pr.git.pr_fetcher.requests.Session.get')
+    def test_iter_pr_diff_joins_lines_across_chunks(self, mock_get, fetcher):
+        """Test streamed GitHub diff lines match splitting the full text."""
+        diff = "--- a/f.py\n+++ b/f.py\n@@ -1 +1 @@\n-old\n+néw\n"
+        raw = diff.encode("utf-8")
+        mock_response = MagicMock()
+        mock_response.encoding = "utf-8"
+        mock_response.iter_content.return_value = [raw[i:i + 5] for i in range(0, len(raw), 5)]
+        mock_get.return_value = mock_response
+
+        lines = list(fetcher.iter_pr_diff("https://github.com/org/repo/pull/1"))
+        assert lines == diff.split("\n")
+        assert mock_get.call_args.kwargs["stream"] is True
+        mock_response.close.assert_called_once()
+
+    @patch('shield_pr.git.pr_fetcher.requests.Session.get')
+    def test_iter_pr_files_follows_pages(self, mock_get, fetcher):
+        """Test changed files are listed across pages until a short page."""
+        fetcher.FILES_PAGE_SIZE = 2
+        pages = [[{"filename": "a.py"}, {"filename": "b.py"}], [{"filename": "c.py"}]]
+        mock_get.side_effect = [MagicMock(json=Mock(return_value=page)) for page in pages]
+
+        files = list(fetcher.iter_pr_files("https://github.com/org/repo/pull/1"))
+        assert files == ["a.py", "b.py", "c.py"]
+        assert mock_get.call_args.args[0].endswith("/pulls/1/files?per_page=2&page=2")
+
+    @patch('shield_pr.git.pr_fetcher.requests.Session.get')
+    def test_iter_pr_diff_replays_cached_body_on_304(self, mock_get, tmp_path):
+        """Test an unchanged PR diff is sent If-None-Match and read from disk."""
+        from shield_pr.git.pr_cache import PRDiffCache
+
+        fetcher = PRFetcher(diff_cache=PRDiffCache(str(tmp_path)))
+        url = "https://github.com/org/repo/pull/1"
+        diff = "--- a/f.py\n+++ b/f.py\n@@ -1 +1 @@\n+x\n"
+        fresh = MagicMock(status_code=200, encoding="utf-8", headers={"ETag": '"abc"'})
+        fresh.iter_content.return_value = [diff.encode("utf-8")]
+        mock_get.return_value = fresh
+        assert list(fetcher.iter_pr_diff(url)) == diff.split("\n")
+
+        mock_get.return_value = MagicMock(status_code=304, headers={})
+        assert list(fetcher.iter_pr_diff(url)) == diff.split("\n")
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+    @patch('shield_pr.git.pr_fetcher.requests.Session.get')
+    def test_exhausted_rate_limit_fails_fast(self, mock_get, fetcher):
+        """Test requests are refused until the reported rate limit reset."""
+        reset = str(int(time.time()) + 60)
+        mock_get.return_value = MagicMock(
+            headers={"x-ratelimit-remaining": "0", "x-ratelimit-reset": reset}
+        )
+        fetcher._make_request("http://example.com")
+
+        with pytest.raises(APIError, match="rate limit"):
+            fetcher._make_request("http://example.com")
+        assert mock_get.call_count == 1
@@ -70,6 +70,18 @@ class TestGitRepository:
             files = repo.get_staged_files()
             assert files == {}
 
+    def test_get_branch_diff_names_skips_patches(self, mock_repo, mock_diff):
+        """Test listing branch changes does not generate patches."""
+        mock_diff.diff = b""
+        base_commit = mock_repo.commit.return_value
+        base_commit.diff.return_value = [mock_diff]
+        with patch('shield_pr.git.repository.Repo', return_value=mock_repo):
+            repo = GitRepository()
+            files = repo.get_branch_diff_names("main")
+
+        assert files == {"file.py": FileChange(path="file.py", change_type="M")}
+        assert base_commit.diff.call_args.kwargs["create_patch"] is False
+
     def test_get_current_file_content(self, mock_repo, tmp_path):
         """Test getting current file content."""
         test_file = tmp_path / "test.py"
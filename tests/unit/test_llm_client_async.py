@@ -1,8 +1,10 @@
 """Unit tests for LLM client asynchronous invoke method."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
+from google.api_core import exceptions as google_exceptions
 
 from shield_pr.config.models import APIConfig
 from shield_pr.core.errors import APIError, RateLimitError
@@ -17,6 +19,7 @@ def api_config():
         model="gemini-1.5-pro",
         temperature=0.35,
         max_tokens=2048,
+        cache_type="memory",
     )
 
 
@@ -108,3 +111,111 @@ class TestLLMClientAsyncInvoke:
                 client = LLMClient(api_config)
                 with pytest.raises(APIError):
                     await client.ainvoke("Test prompt")
+
+
+class TestLLMClientAsyncStream:
+    """Test streamed LLM responses."""
+
+    @pytest.mark.asyncio
+    async def test_astream_yields_chunks(self, api_config):
+        """Test astream yields non-empty chunk contents in order."""
+        mock_llm = MagicMock()
+
+        async def mock_astream(prompt):
+            for text in ('{"findings": [', "", "]}"):
+                yield MagicMock(content=text)
+
+        mock_llm.astream = mock_astream
+
+        with patch("shield_pr.core.llm_client.ChatGoogleGenerativeAI", return_value=mock_llm):
+            with patch("shield_pr.core.llm_client.setup_cache"):
+                client = LLMClient(api_config)
+                chunks = [chunk async for chunk in client.astream("Test prompt")]
+
+        assert chunks == ['{"findings": [', "]}"]
+        assert client._limiter._active == 0
+
+    @pytest.mark.asyncio
+    async def test_astream_rate_limit_error(self, api_config):
+        """Test a throttled stream raises RateLimitError and lowers the cap."""
+        api_config.max_concurrency = 4
+        mock_llm = MagicMock()
+
+        async def mock_astream(prompt):
+            yield MagicMock(content="partial")
+            raise Exception("429 quota exceeded")
+
+        mock_llm.astream = mock_astream
+
+        with patch("shield_pr.core.llm_client.ChatGoogleGenerativeAI", return_value=mock_llm):
+            with patch("shield_pr.core.llm_client.setup_cache"):
+                client = LLMClient(api_config)
+                with pytest.raises(RateLimitError):
+                    async for _ in client.astream("Test prompt"):
+                        pass
+
+        assert client._limiter.limit == 2
+
+
+class TestLLMClientAdaptiveConcurrency:
+    """Test the AIMD concurrency cap around async invoke."""
+
+    @pytest.mark.asyncio
+    async def test_calls_capped_and_halved_on_rate_limit(self, api_config):
+        """Test calls never exceed the cap, which halves after a 429."""
+        api_config.max_concurrency = 4
+        state = {"active": 0, "peak": 0}
+
+        async def mock_ainvoke(prompt):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            if prompt == "throttled":
+                raise Exception("429 quota exceeded")
+            return MagicMock(content="ok")
+
+        mock_llm = MagicMock()
+        mock_llm.ainvoke = mock_ainvoke
+
+        with patch("shield_pr.core.llm_client.ChatGoogleGenerativeAI", return_value=mock_llm):
+            with patch("shield_pr.core.llm_client.setup_cache"):
+                client = LLMClient(api_config)
+                await asyncio.gather(*(client.ainvoke(f"p{i}") for i in range(10)))
+                assert state["peak"] == 4
+
+                with pytest.raises(RateLimitError):
+                    await client.ainvoke("throttled")
+                assert client._limiter.limit == 2
+
+                await client.ainvoke("recovered")
+                assert client._limiter.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_only_throttling_halves_cap(self, api_config):
+        """Test errors that merely contain 429 or "rate" leave the cap alone."""
+        api_config.max_concurrency = 4
+        errors = {
+            "bad_request": Exception("400 GenerateContentRequest.contents: must not be empty"),
+            "too_big": Exception("Request payload of 4294 bytes is invalid"),
+            "exhausted": google_exceptions.ResourceExhausted("Please retry later"),
+        }
+
+        async def mock_ainvoke(prompt):
+            raise errors[prompt]
+
+        mock_llm = MagicMock()
+        mock_llm.ainvoke = mock_ainvoke
+
+        with patch("shield_pr.core.llm_client.ChatGoogleGenerativeAI", return_value=mock_llm):
+            with patch("shield_pr.core.llm_client.setup_cache"):
+                client = LLMClient(api_config)
+                for prompt in ("bad_request", "too_big"):
+                    with pytest.raises(APIError) as info:
+                        await client.ainvoke(prompt)
+                    assert not isinstance(info.value, RateLimitError)
+                assert client._limiter.limit == 4
+
+                with pytest.raises(RateLimitError):
+                    await client.ainvoke("exhausted")
+                assert client._limiter.limit == 2
@@ -59,4 +59,6 @@ class TestLLMClientInit:
         with patch("shield_pr.core.llm_client.ChatGoogleGenerativeAI"):
             with patch("shield_pr.core.llm_client.setup_cache") as mock_cache:
                 LLMClient(api_config)
-                mock_cache.assert_called_once()
+                mock_cache.assert_called_once_with(
+                    api_config.cache_type, api_config.cache_path
+                )
@@ -5,8 +5,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from shield_pr.config.models import APIConfig
-from shield_pr.core.errors import APIError, RateLimitError
-from shield_pr.core.llm_client import LLMClient
+from shield_pr.core.errors import APIError, RateLimitError, TransientAPIError
+from shield_pr.core.llm_client import LLMClient, response_schema
+from shield_pr.models.finding import FindingsResponse
 
 
 @pytest.fixture
@@ -17,6 +18,7 @@ def api_config():
         model="gemini-1.5-pro",
         temperature=0.35,
         max_tokens=2048,
+        cache_type="memory",
     )
 
 
@@ -83,6 +85,25 @@ class TestLLMClientInvoke:
                 with pytest.raises(RateLimitError, match="Rate limit exceeded"):
                     client.invoke("Test prompt")
 
+    def test_invoke_does_not_retry_itself(self, api_config, mock_llm):
+        """Test a rate-limited call is made once; stages own the retries."""
+        mock_llm.invoke.side_effect = Exception("Rate limit exceeded")
+        with patch("shield_pr.core.llm_client.ChatGoogleGenerativeAI", return_value=mock_llm):
+            with patch("shield_pr.core.llm_client.setup_cache"):
+                client = LLMClient(api_config)
+                with pytest.raises(RateLimitError):
+                    client.invoke("Test prompt")
+        assert mock_llm.invoke.call_count == 1
+
+    def test_invoke_connection_error_is_transient(self, api_config, mock_llm):
+        """Test dropped connections map to the retryable TransientAPIError."""
+        mock_llm.invoke.side_effect = ConnectionResetError("Connection reset by peer")
+        with patch("shield_pr.core.llm_client.ChatGoogleGenerativeAI", return_value=mock_llm):
+            with patch("shield_pr.core.llm_client.setup_cache"):
+                client = LLMClient(api_config)
+                with pytest.raises(TransientAPIError, match="LLM call failed"):
+                    client.invoke("Test prompt")
+
     def test_invoke_quota_error(self, api_config, mock_llm):
         """Test invoke handles quota errors."""
         mock_llm.invoke.side_effect = Exception("Quota exceeded")
@@ -109,3 +130,47 @@ class TestLLMClientInvoke:
                 client = LLMClient(api_config)
                 with pytest.raises(APIError, match="LLM call failed"):
                     client.invoke("Test prompt")
+
+    def test_invoke_with_schema_binds_json_mode(self, api_config, mock_llm):
+        """Test a response schema is enforced through Gemini JSON mode."""
+        bound = mock_llm.bind.return_value
+        bound.invoke.return_value = MagicMock(content='{"findings": []}')
+        with patch("shield_pr.core.llm_client.ChatGoogleGenerativeAI", return_value=mock_llm):
+            with patch("shield_pr.core.llm_client.setup_cache"):
+                client = LLMClient(api_config)
+                response = client.invoke("Test prompt", schema=FindingsResponse)
+
+        assert response == '{"findings": []}'
+        config = mock_llm.bind.call_args.kwargs["generation_config"]
+        assert config["response_mime_type"] == "application/json"
+        assert config["response_schema"] is response_schema(FindingsResponse)
+        mock_llm.invoke.assert_not_called()
+
+    def test_invoke_with_system_sends_messages(self, api_config, mock_llm):
+        """Test a system message is sent ahead of the prompt."""
+        with patch("shield_pr.core.llm_client.ChatGoogleGenerativeAI", return_value=mock_llm):
+            with patch("shield_pr.core.llm_client.setup_cache"):
+                client = LLMClient(api_config)
+                client.invoke("File: a.py", system="Review rules")
+
+        mock_llm.invoke.assert_called_once_with(
+            [("system", "Review rules"), ("human", "File: a.py")]
+        )
+
+
+class TestResponseSchema:
+    """Test conversion of pydantic models to Gemini response schemas."""
+
+    def test_findings_response_schema(self):
+        """Test references are inlined and optional fields become nullable."""
+        schema = response_schema(FindingsResponse)
+        finding = schema["properties"]["findings"]["items"]
+
+        assert schema["type_"] == "OBJECT"
+        assert finding["properties"]["severity"]["enum"] == ["HIGH", "MEDIUM", "LOW"]
+        assert finding["properties"]["line_number"] == {
+            "type_": "INTEGER",
+            "description": "Line number where the issue occurs",
+            "nullable": True,
+        }
+        assert "description" in finding["required"]
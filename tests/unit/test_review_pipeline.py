@@ -0,0 +1,326 @@
+"""Tests for concurrent review pipeline execution."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shield_pr.config.models import APIConfig, Config, ReviewConfig
+from shield_pr.core.errors import ReviewError
+from shield_pr.core.review_pipeline import ReviewPipeline
+from shield_pr.models.finding import Finding
+from shield_pr.models.review_result import ReviewResult
+
+
+def _result(platform, description):
+    finding = Finding(
+        severity="MEDIUM",
+        category="review",
+        file_path="a.py",
+        description=description,
+    )
+    return ReviewResult(platform=platform, findings=[finding], summary="ok", confidence=0.9)
+
+
+class _TrackingChain:
+    """Chain stub recording how many reviews overlap."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self, platform, fail_on=None):
+        self.platform = platform
+        self.fail_on = fail_on
+        self.result_cache = None
+        self.fused = False
+
+    async def aexecute(self, code, file_path, on_finding=None):
+        type(self).active += 1
+        type(self).peak = max(type(self).peak, type(self).active)
+        await asyncio.sleep(0.01)
+        type(self).active -= 1
+        if file_path == self.fail_on:
+            raise ReviewError("boom")
+        result = _result(self.platform, f"{self.platform}:{file_path}")
+        if on_finding is not None:
+            for finding in result.findings:
+                on_finding(finding)
+        return result
+
+
+@pytest.fixture
+def pipeline():
+    """Provide a pipeline with the LLM client and file reader mocked."""
+    config = Config(
+        api=APIConfig(api_key="test_api_key_1234567890", cache_type="memory"),
+        review=ReviewConfig(max_concurrency=2),
+    )
+    with patch("shield_pr.core.review_pipeline.LLMClient"):
+        pipe = ReviewPipeline(config)
+    pipe.file_reader = MagicMock()
+
+    async def _aread_files(paths):
+        return pipe.file_reader.read_files(paths)
+
+    pipe.file_reader.aread_files = _aread_files
+    pipe.detector = MagicMock()
+    pipe.detector.detect.return_value = ("backend", 0.9, {})
+    _TrackingChain.active = 0
+    _TrackingChain.peak = 0
+    return pipe
+
+
+class TestReviewPipelineConcurrency:
+    """Tests for concurrent platform/universal and multi-file reviews."""
+
+    def test_platform_and_universal_run_concurrently(self, pipeline):
+        """Test each file's platform and universal chains overlap."""
+        pipeline.file_reader.read_files.return_value = {"a.py": "a = 1"}
+
+        with patch(
+            "shield_pr.core.review_pipeline.get_chain",
+            side_effect=lambda *args: _TrackingChain("backend"),
+        ), patch(
+            "shield_pr.core.review_pipeline.UniversalReviewChain",
+            side_effect=lambda *args: _TrackingChain("universal"),
+        ):
+            result = pipeline.review_files(["a.py"])
+
+        assert _TrackingChain.peak == 2
+        assert {f.description for f in result.findings} >= {"backend:a.py", "universal:a.py"}
+
+    def test_files_limited_by_max_concurrency(self, pipeline):
+        """Test no more than max_concurrency files are in flight."""
+        files = {f"f{i}.py": f"x = {i}" for i in range(6)}
+        pipeline.file_reader.read_files.return_value = files
+
+        with patch(
+            "shield_pr.core.review_pipeline.get_chain",
+            side_effect=lambda *args: _TrackingChain("backend"),
+        ), patch(
+            "shield_pr.core.review_pipeline.UniversalReviewChain",
+            side_effect=lambda *args: _TrackingChain("universal"),
+        ):
+            pipeline.review_files(list(files))
+
+        # Two files at once, each running two chains
+        assert _TrackingChain.peak == 4
+
+    def test_chains_created_once_per_platform_and_depth(self, pipeline):
+        """Test chain instances are shared across files."""
+        files = {f"f{i}.py": "x" for i in range(4)}
+        pipeline.file_reader.read_files.return_value = files
+
+        with patch(
+            "shield_pr.core.review_pipeline.get_chain",
+            side_effect=lambda *args: _TrackingChain("backend"),
+        ) as get_chain, patch(
+            "shield_pr.core.review_pipeline.UniversalReviewChain",
+            side_effect=lambda *args: _TrackingChain("universal"),
+        ) as universal:
+            pipeline.review_files(list(files))
+            pipeline.review_files(list(files), depth="deep")
+
+        assert get_chain.call_count == 2
+        assert universal.call_count == 2
+
+    def test_failed_file_reported_without_stopping_others(self, pipeline):
+        """Test a ReviewError for one file becomes an error finding."""
+        pipeline.file_reader.read_files.return_value = {"a.py": "a", "b.py": "b"}
+
+        with patch(
+            "shield_pr.core.review_pipeline.get_chain",
+            side_effect=lambda *args: _TrackingChain("backend", fail_on="b.py"),
+        ), patch(
+            "shield_pr.core.review_pipeline.UniversalReviewChain",
+            side_effect=lambda *args: _TrackingChain("universal"),
+        ):
+            result = pipeline.review_files(["a.py", "b.py"])
+
+        descriptions = {f.description for f in result.findings}
+        assert "backend:a.py" in descriptions
+        assert any("boom" in description for description in descriptions)
+
+    def test_truncated_input_reported(self, pipeline):
+        """Test a file cut to fit the token budget gets a finding saying so."""
+        pipeline.config.review.code_token_budget = 256
+        long_file = "\n".join(f"value_{i} = {i}" for i in range(400))
+        pipeline.file_reader.read_files.return_value = {"a.py": long_file, "b.py": "b = 1"}
+
+        with patch(
+            "shield_pr.core.review_pipeline.get_chain",
+            side_effect=lambda *args: _TrackingChain("backend"),
+        ), patch(
+            "shield_pr.core.review_pipeline.UniversalReviewChain",
+            side_effect=lambda *args: _TrackingChain("universal"),
+        ):
+            result = pipeline.review_files(["a.py", "b.py"])
+
+        notes = [f for f in result.findings if "token budget" in f.description]
+        assert [f.file_path for f in notes] == ["a.py"]
+
+    def test_findings_reported_as_files_complete(self, pipeline):
+        """Test on_finding receives each chain's findings."""
+        pipeline.file_reader.read_files.return_value = {"a.py": "a", "b.py": "b"}
+        seen = []
+
+        with patch(
+            "shield_pr.core.review_pipeline.get_chain",
+            side_effect=lambda *args: _TrackingChain("backend"),
+        ), patch(
+            "shield_pr.core.review_pipeline.UniversalReviewChain",
+            side_effect=lambda *args: _TrackingChain("universal"),
+        ):
+            pipeline.review_files(["a.py", "b.py"], on_finding=seen.append)
+
+        assert sorted(f.description for f in seen) == [
+            "backend:a.py", "backend:b.py", "universal:a.py", "universal:b.py"
+        ]
+
+
+class _BatchingChain(_TrackingChain):
+    """Universal chain stub recording batched reviews."""
+
+    batches = []
+
+    async def aexecute_batch(self, files, max_concurrency=10):
+        type(self).batches.append([file_path for _, file_path in files])
+        return [_result(self.platform, f"{self.platform}:{file_path}") for _, file_path in files]
+
+
+class TestReviewPipelineUniversalBatch:
+    """Tests for batching universal reviews across files."""
+
+    def test_universal_reviews_batched_across_files(self, pipeline):
+        """Test one batched universal review covers every file."""
+        pipeline.config.review.batch_universal = True
+        pipeline.file_reader.read_files.return_value = {"a.py": "a", "b.py": "b"}
+        _BatchingChain.batches = []
+
+        with patch(
+            "shield_pr.core.review_pipeline.get_chain",
+            side_effect=lambda *args: _TrackingChain("backend"),
+        ), patch(
+            "shield_pr.core.review_pipeline.UniversalReviewChain",
+            side_effect=lambda *args: _BatchingChain("universal"),
+        ):
+            result = pipeline.review_files(["a.py", "b.py"])
+
+        assert _BatchingChain.batches == [["a.py", "b.py"]]
+        descriptions = {f.description for f in result.findings}
+        assert {"universal:a.py", "universal:b.py", "backend:b.py"} <= descriptions
+
+    def test_batched_findings_reported(self, pipeline):
+        """Test findings of a batched review reach on_finding."""
+        pipeline.config.review.batch_universal = True
+        pipeline.file_reader.read_files.return_value = {"a.py": "a", "b.py": "b"}
+        seen = []
+
+        with patch(
+            "shield_pr.core.review_pipeline.get_chain",
+            side_effect=lambda *args: _TrackingChain("backend"),
+        ), patch(
+            "shield_pr.core.review_pipeline.UniversalReviewChain",
+            side_effect=lambda *args: _BatchingChain("universal"),
+        ):
+            pipeline.review_files(["a.py", "b.py"], on_finding=seen.append)
+
+        assert {"universal:a.py", "universal:b.py"} <= {f.description for f in seen}
+
+
+    def test_platform_reviews_batched_per_platform(self, pipeline):
+        """Test platform reviews form one batch per detected platform."""
+        pipeline.config.review.batch_platform = True
+        files = {"a.py": "a", "b.kt": "b", "c.py": "c"}
+        pipeline.file_reader.read_files.return_value = files
+        pipeline.detector.detect.side_effect = lambda path, *args, **kwargs: (
+            ("android" if path.endswith(".kt") else "backend"), 0.9, {}
+        )
+        _BatchingChain.batches = []
+
+        with patch(
+            "shield_pr.core.review_pipeline.get_chain",
+            side_effect=lambda platform, *args: _BatchingChain(platform),
+        ), patch(
+            "shield_pr.core.review_pipeline.UniversalReviewChain",
+            side_effect=lambda *args: _TrackingChain("universal"),
+        ):
+            result = pipeline.review_files(list(files))
+
+        assert sorted(_BatchingChain.batches) == [["a.py", "c.py"], ["b.kt"]]
+        descriptions = {f.description for f in result.findings}
+        assert {"backend:c.py", "android:b.kt", "universal:a.py"} <= descriptions
+
+
+class TestReviewPipelineDedup:
+    """Tests for reviewing identical diffs and files once."""
+
+    def test_identical_hunks_reviewed_once(self, pipeline):
+        """Test files sharing a hunk get copies of one review's findings."""
+        bump = "@@ -1 +1 @@\n-version = 1\n+version = 2\n"
+        patches = {
+            "a/setup.py": bump,
+            "b/setup.py": f"--- a/b/setup.py\n+++ b/b/setup.py\n{bump}",
+            "c.py": "@@ -1 +1 @@\n-x = 1\n+x = 2\n",
+        }
+        reviewed = []
+
+        class _RecordingChain(_TrackingChain):
+            async def aexecute(self, code, file_path, on_finding=None):
+                reviewed.append(file_path)
+                return await super().aexecute(code, file_path, on_finding)
+
+        with patch(
+            "shield_pr.core.review_pipeline.get_chain",
+            side_effect=lambda *args: _RecordingChain("backend"),
+        ), patch(
+            "shield_pr.core.review_pipeline.UniversalReviewChain",
+            side_effect=lambda *args: _RecordingChain("universal"),
+        ):
+            result = pipeline.review_diff(patches)
+
+        assert sorted(reviewed) == ["a/setup.py", "a/setup.py", "c.py", "c.py"]
+        copied = {f.description for f in result.findings if f.file_path == "b/setup.py"}
+        assert copied and all(d.endswith(":a/setup.py") for d in copied)
+
+    def test_identical_files_reviewed_once(self, pipeline):
+        """Test copies of a file get copies of one review's findings."""
+        pipeline.file_reader.read_files.return_value = {
+            "vendor/util.py": "def f():\n    return 1\n",
+            "lib/util.py": "def f():\n    return 1\n",
+            "main.py": "print(1)\n",
+        }
+        reviewed = []
+
+        class _RecordingChain(_TrackingChain):
+            async def aexecute(self, code, file_path, on_finding=None):
+                reviewed.append(file_path)
+                return await super().aexecute(code, file_path, on_finding)
+
+        with patch(
+            "shield_pr.core.review_pipeline.get_chain",
+            side_effect=lambda *args: _RecordingChain("backend"),
+        ), patch(
+            "shield_pr.core.review_pipeline.UniversalReviewChain",
+            side_effect=lambda *args: _RecordingChain("universal"),
+        ):
+            result = pipeline.review_files(["vendor/util.py", "lib/util.py", "main.py"])
+
+        assert sorted(reviewed) == ["main.py", "main.py", "vendor/util.py", "vendor/util.py"]
+        copied = {f.description for f in result.findings if f.file_path == "lib/util.py"}
+        assert copied and all(d.endswith(":vendor/util.py") for d in copied)
+
+
+class TestReviewPipelineSpeculation:
+    """Tests for enabling speculative stage execution."""
+
+    def test_speculation_follows_config_with_shared_drafts(self, pipeline):
+        """Test chains speculate only when configured and share one draft store."""
+        assert pipeline._configure_chain(_TrackingChain("backend")).speculative is False
+
+        pipeline.config.review.speculative = True
+        backend = pipeline._configure_chain(_TrackingChain("backend"))
+        universal = pipeline._configure_chain(_TrackingChain("universal"))
+
+        assert backend.speculative is True
+        assert backend.drafts is universal.drafts is pipeline.drafts